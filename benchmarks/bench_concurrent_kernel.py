@@ -0,0 +1,78 @@
+# benchmarks/bench_concurrent_kernel.py
+
+import sys
+import os
+import time
+import random
+import argparse
+import threading
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kernel import ArchanonKernel
+from meta.monitor import MetacognitiveMonitor
+from generators import build_taxonomy
+
+def run_mixed_load(kernel: ArchanonKernel, nodes: int, readers: int, seconds: float,
+                   batch_size: int, write_interval: float, seed: int = 5):
+    """
+    Runs reader threads asking questions against one writer thread that adds
+    batches of new concepts to the taxonomy, as a Learner would, for a fixed
+    time. Returns the number of questions answered and facts added.
+    """
+    stop = threading.Event()
+    answered = [0] * readers
+    written = [0]
+
+    def reader(slot: int):
+        rng = random.Random(seed + slot)
+        while not stop.is_set():
+            kernel.ask_question(f"c{rng.randrange(nodes)}", f"c{rng.randrange(nodes // 100 or 1)}")
+            answered[slot] += 1
+
+    def writer():
+        rng = random.Random(seed - 1)
+        concept = 0
+        while not stop.is_set():
+            batch = []
+            for _ in range(batch_size):
+                batch.append((f"new{concept}", f"c{rng.randrange(nodes)}", "is_a"))
+                batch.append((f"new{concept}", f"p{rng.randrange(100)}", "has_property"))
+                concept += 1
+            written[0] += kernel.add_facts(batch)
+            if write_interval:
+                time.sleep(write_interval)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(answered), written[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="Question throughput with a concurrent writer.")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--write-interval", type=float, default=0.0,
+                        help="Pause between batches, e.g. to mimic parsing time.")
+    parser.add_argument("--backend", default="networkx")
+    args = parser.parse_args()
+
+    for readers in args.readers:
+        kernel = ArchanonKernel(memory_backend=args.backend, thread_safe=True,
+                                monitor=MetacognitiveMonitor(retain=10_000))
+        build_taxonomy(kernel.memory, args.nodes, fan_out=8, extra_parent_rate=0.01)
+        questions, facts = run_mixed_load(kernel, args.nodes, readers, args.seconds,
+                                          args.batch_size, args.write_interval)
+        print(f"  {readers} reader(s) + 1 writer: {questions / args.seconds:,.0f} questions/s, "
+              f"{facts / args.seconds:,.0f} facts/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_learner_processes.py
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kernel import ArchanonKernel
+from sensory.text_parser import TextParser
+from learning.learner import Learner
+from generators import write_corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="Learner sentences/second across process counts.")
+    parser.add_argument("--articles", type=int, default=400)
+    parser.add_argument("--sentences", type=int, default=25)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    text_parser = TextParser()
+    if text_parser.nlp is None:
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_path = os.path.join(tmp, "corpus.txt")
+        write_corpus(corpus_path, args.articles, args.sentences)
+        total_sentences = args.articles * args.sentences
+        for n_process in args.processes:
+            learner = Learner(ArchanonKernel(), text_parser, batch_size=args.batch_size, n_process=n_process)
+            start = time.perf_counter()
+            learner.learn_from_corpus(corpus_path, streaming=True)
+            secs = time.perf_counter() - start
+            print(f"n_process={n_process}: {total_sentences / secs:,.0f} sentences/s")
+
+if __name__ == "__main__":
+    main()
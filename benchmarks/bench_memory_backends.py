@@ -0,0 +1,67 @@
+# benchmarks/bench_memory_backends.py
+
+import sys
+import os
+import time
+import random
+import tracemalloc
+import argparse
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from memory import MEMORY_BACKENDS
+from generators import generate_facts
+
+def run_backend(name: str, facts, num_queries: int = 100_000):
+    """Measures memory and throughput of one backend on the given facts."""
+    backend = MEMORY_BACKENDS[name]
+
+    tracemalloc.start()
+    memory = backend()
+    for source, target, label in facts:
+        memory.add_relationship(source, target, label)
+    if hasattr(memory, "compact"):
+        memory.compact()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del memory
+
+    memory = backend()
+    start = time.perf_counter()
+    for source, target, label in facts:
+        memory.add_relationship(source, target, label)
+    insert_secs = time.perf_counter() - start
+
+    rng = random.Random(7)
+    queries = [rng.choice(facts) for _ in range(num_queries)]
+    start = time.perf_counter()
+    for source, _, label in queries:
+        memory.query_relationships(source, label)
+    query_secs = time.perf_counter() - start
+
+    return {
+        "backend": name,
+        "edges": memory.number_of_edges(),
+        "bytes_per_edge": retained / max(memory.number_of_edges(), 1),
+        "inserts_per_sec": len(facts) / insert_secs,
+        "queries_per_sec": num_queries / query_secs,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare MemoryCore storage backends.")
+    parser.add_argument("--facts", type=int, default=500_000)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    facts = generate_facts(args.facts, args.nodes)
+    print(f"Benchmarking {len(facts)} facts over {args.nodes} concepts.")
+    for name in MEMORY_BACKENDS:
+        r = run_backend(name, facts)
+        print(
+            f"  {r['backend']:>9}: {r['edges']} edges, {r['bytes_per_edge']:.1f} bytes/edge, "
+            f"{r['inserts_per_sec']:,.0f} inserts/s, {r['queries_per_sec']:,.0f} queries/s"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_property_closure.py
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from memory import create_memory
+from causal.engine import CausalEngine
+from causal.properties import PropertyClosure
+from generators import build_taxonomy, add_properties
+
+def naive_holder(engine: CausalEngine, memory, node: str, prop: str) -> bool:
+    """Answers an inherited-property question by scanning every ancestor."""
+    for holder in [node, *engine.get_ancestors(node)]:
+        if memory.has_relationship(holder, prop, "has_property"):
+            return True
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description="Property-closure table vs. ancestor scan.")
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--fan-out", type=int, default=8)
+    parser.add_argument("--extra-parent-rate", type=float, default=0.01)
+    parser.add_argument("--properties", type=int, default=1_000)
+    parser.add_argument("--property-rate", type=float, default=0.05)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--updates", type=int, default=20_000)
+    parser.add_argument("--backend", default="compact")
+    args = parser.parse_args()
+
+    memory = create_memory(args.backend)
+    build_taxonomy(memory, args.nodes, args.fan_out, args.extra_parent_rate)
+    add_properties(memory, args.nodes, args.properties, args.property_rate)
+
+    start = time.perf_counter()
+    closure = PropertyClosure(memory)
+    print(f"Closure table built in {time.perf_counter() - start:.2f}s.")
+
+    rng = random.Random(7)
+    queries = [(f"c{rng.randrange(args.nodes)}", f"p{rng.randrange(args.properties)}")
+               for _ in range(args.queries)]
+
+    engine = CausalEngine(memory, cache_limit=0, inherit_properties=False)
+    start = time.perf_counter()
+    naive = [naive_holder(engine, memory, node, prop) for node, prop in queries]
+    naive_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tabled = [closure.holder(node, prop) is not None for node, prop in queries]
+    table_secs = time.perf_counter() - start
+    assert naive == tabled
+
+    start = time.perf_counter()
+    for i in range(args.updates):
+        memory.add_relationship(f"c{rng.randrange(args.nodes)}", f"p{rng.randrange(args.properties)}", "has_property")
+    update_secs = time.perf_counter() - start
+
+    print(f"  Ancestor scan: {args.queries / naive_secs:,.0f} queries/s")
+    print(f"  Closure table: {args.queries / table_secs:,.0f} queries/s")
+    print(f"  Updates:       {args.updates / update_secs:,.0f} facts/s (table maintained)")
+
+if __name__ == "__main__":
+    main()
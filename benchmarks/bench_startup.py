@@ -0,0 +1,68 @@
+# benchmarks/bench_startup.py
+
+import sys
+import os
+import json
+import argparse
+import subprocess
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Each scenario runs in a fresh interpreter and prints its timings as JSON.
+SCENARIOS = {
+    "import kernel": """
+import kernel
+""",
+    "kernel + first question (networkx)": """
+from kernel import ArchanonKernel
+k = ArchanonKernel()
+k.add_fact("Socrates", "human", "is_a")
+k.ask_question("Socrates", "human")
+""",
+    "kernel + first question (compact)": """
+from kernel import ArchanonKernel
+k = ArchanonKernel(memory_backend="compact")
+k.add_fact("Socrates", "human", "is_a")
+k.ask_question("Socrates", "human")
+""",
+    "import learning.learner": """
+import learning.learner
+""",
+    "TextParser + first parse": """
+from sensory.text_parser import TextParser
+p = TextParser()
+if p.nlp is not None:
+    p.extract_triplets("The cat is a mammal.")
+""",
+}
+
+RUNNER = """
+import sys, time, json, io, contextlib
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    exec({code!r})
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("networkx", "spacy", "asyncio") if m in sys.modules]
+print(json.dumps({{"ms": elapsed * 1000, "loaded": heavy}}))
+"""
+
+def run(code: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", RUNNER.format(src=SRC, code=code)],
+        check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start-up time of the kernel and its parts.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        results = [run(code) for _ in range(args.repeat)]
+        best = min(r["ms"] for r in results)
+        loaded = ", ".join(results[0]["loaded"]) or "-"
+        print(f"{name:<38} best {best:8.1f} ms   heavy modules loaded: {loaded}")
+
+if __name__ == "__main__":
+    main()
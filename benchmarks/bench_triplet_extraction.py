@@ -0,0 +1,105 @@
+# benchmarks/bench_triplet_extraction.py
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from spacy.vocab import Vocab
+from spacy.tokens import Doc
+from sensory.text_parser import TextParser, canonicalize_entity
+
+ADJECTIVES = ["fluffy", "small", "old", "red", "quiet", "wild", "tall", "bright"]
+NOUNS = ["cat", "dog", "river", "mountain", "city", "bird", "tree", "house", "ship", "star"]
+
+def build_sentences(count: int, seed: int = 42):
+    """
+    Builds a fixed set of parsed sentences by hand, so the benchmark times
+    extraction alone and needs no spaCy model. Half are "The ADJ NOUN is a
+    NOUN ." and half are "The NOUN is ADJ .".
+    """
+    rng = random.Random(seed)
+    vocab = Vocab()
+    docs = []
+    for i in range(count):
+        if i % 2:
+            adj, subject, obj = rng.choice(ADJECTIVES), rng.choice(NOUNS), rng.choice(NOUNS)
+            docs.append(Doc(
+                vocab, words=["The", adj, subject, "is", "a", obj, "."],
+                heads=[2, 2, 3, 3, 5, 3, 3],
+                deps=["det", "amod", "nsubj", "ROOT", "det", "attr", "punct"],
+                pos=["DET", "ADJ", "NOUN", "AUX", "DET", "NOUN", "PUNCT"],
+                lemmas=["the", adj, subject, "be", "a", obj, "."],
+            ))
+        else:
+            subject, adj = rng.choice(NOUNS), rng.choice(ADJECTIVES)
+            docs.append(Doc(
+                vocab, words=["The", subject, "is", adj, "."],
+                heads=[1, 2, 2, 2, 2],
+                deps=["det", "nsubj", "ROOT", "acomp", "punct"],
+                pos=["DET", "NOUN", "AUX", "ADJ", "PUNCT"],
+                lemmas=["the", subject, "be", adj, "."],
+            ))
+    return docs
+
+def legacy_canonicalize(phrase: str) -> str:
+    """TextParser v1.4's canonicalization, for comparison."""
+    phrase = phrase.lower().strip()
+    for article in ["a ", "an ", "the "]:
+        if phrase.startswith(article):
+            phrase = phrase[len(article):]
+    return phrase.strip()
+
+def legacy_extract(doc):
+    """TextParser v1.4's extraction: token joins, per-call canonicalization, set dedupe."""
+    triplets = []
+    for token in doc:
+        if token.lemma_ == "be":
+            subjects = [child for child in token.children if child.dep_ == "nsubj"]
+            attributes = [child for child in token.children if child.dep_ in ("attr", "acomp")]
+            if subjects and attributes:
+                subject_phrase = " ".join(t.text for t in subjects[0].subtree).strip()
+                attribute_phrase = " ".join(t.text for t in attributes[0].subtree).strip()
+                is_a_candidate = attributes[0].pos_ == "NOUN"
+                first_child_of_attr = next(attributes[0].children, None)
+                if first_child_of_attr and first_child_of_attr.pos_ == "DET":
+                    is_a_candidate = True
+                if is_a_candidate:
+                    triplets.append((legacy_canonicalize(subject_phrase), "is_a", legacy_canonicalize(attribute_phrase)))
+                elif attributes[0].pos_ == "ADJ":
+                    triplets.append((legacy_canonicalize(subject_phrase), "has_property",
+                                     legacy_canonicalize(attribute_phrase)))
+    return list(set(triplets))
+
+def time_path(extract, docs, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for doc in docs:
+            for _ in extract(doc):
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Triplet extraction: v1.4 path vs. fast path.")
+    parser.add_argument("--sentences", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = build_sentences(args.sentences)
+    text_parser = TextParser.__new__(TextParser)  # Extraction needs no model.
+    assert all(sorted(legacy_extract(doc)) == list(text_parser.iter_triplets(doc)) for doc in docs[:100])
+
+    legacy_secs = time_path(legacy_extract, docs, args.repeats)
+    fast_secs = time_path(text_parser.iter_triplets, docs, args.repeats)
+    print(f"  v1.4 path: {args.sentences / legacy_secs:,.0f} sentences/s")
+    print(f"  Fast path: {args.sentences / fast_secs:,.0f} sentences/s ({legacy_secs / fast_secs:.2f}x)")
+    print(f"  Canonical cache: {canonicalize_entity.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/generators.py
+
+import os
+import random
+from typing import Iterator, List, Tuple
+
+# Every generator is seeded, so the same arguments always produce the same
+# workload and results can be compared across commits.
+
+LABELS = ["is_a", "has_property", "part_of", "causes"]
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "data", "corpus.txt")
+
+def generate_facts(num_facts: int, num_nodes: int, seed: int = 42) -> List[Tuple[str, str, str]]:
+    """Generates a deterministic list of (source, target, label) facts."""
+    rng = random.Random(seed)
+    return [
+        (f"concept_{rng.randrange(num_nodes)}", f"concept_{rng.randrange(num_nodes)}", rng.choice(LABELS))
+        for _ in range(num_facts)
+    ]
+
+def build_taxonomy(memory, num_nodes: int, fan_out: int, extra_parent_rate: float, seed: int = 42):
+    """
+    Fills memory with a synthetic 'is_a' taxonomy: a tree of the given
+    fan-out, plus a second parent for a fraction of the nodes.
+    """
+    rng = random.Random(seed)
+    for i in range(1, num_nodes):
+        memory.add_relationship(f"c{i}", f"c{(i - 1) // fan_out}", "is_a")
+        if rng.random() < extra_parent_rate:
+            memory.add_relationship(f"c{i}", f"c{rng.randrange(i)}", "is_a")
+
+def dag_taxonomy(depth: int, fan_out: int, extra_parent_rate: float = 0.05,
+                 seed: int = 42) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yields the 'is_a' facts of a random DAG taxonomy with the given number
+    of levels below the root "c0". Each node has between 1 and fan_out
+    children, and a fraction of nodes get a second parent from any shallower
+    level, so the hierarchy is a DAG rather than a tree.
+
+    Args:
+        depth (int): Number of levels below the root.
+        fan_out (int): Maximum number of children per node.
+        extra_parent_rate (float): Share of nodes given a second parent.
+        seed (int): Random seed.
+    """
+    rng = random.Random(seed)
+    shallower = ["c0"]
+    level = ["c0"]
+    count = 1
+    for _ in range(depth):
+        next_level = []
+        for parent in level:
+            for _ in range(rng.randint(1, fan_out)):
+                child = f"c{count}"
+                count += 1
+                yield (child, parent, "is_a")
+                if rng.random() < extra_parent_rate:
+                    other = rng.choice(shallower)
+                    if other != parent:
+                        yield (child, other, "is_a")
+                next_level.append(child)
+        shallower.extend(next_level)
+        level = next_level
+
+def hub_graph(num_facts: int, num_nodes: int, num_hubs: int = 10, hub_share: float = 0.5,
+              seed: int = 42) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yields 'is_a' and 'has_property' facts where a share of all edges point
+    at a few hub nodes, as "thing" or "animal" do in a learned corpus. Hubs
+    get very large in-degrees, which stresses reverse lookups and any search
+    that expands them.
+
+    Args:
+        num_facts (int): Number of facts to yield (duplicates included).
+        num_nodes (int): Number of ordinary nodes.
+        num_hubs (int): Number of hub nodes.
+        hub_share (float): Share of edges whose target is a hub.
+        seed (int): Random seed.
+    """
+    rng = random.Random(seed)
+    for _ in range(num_facts):
+        source = f"n{rng.randrange(num_nodes)}"
+        if rng.random() < hub_share:
+            yield (source, f"hub{rng.randrange(num_hubs)}", "is_a")
+        elif rng.random() < 0.5:
+            yield (source, f"n{rng.randrange(num_nodes)}", "is_a")
+        else:
+            yield (source, f"p{rng.randrange(100)}", "has_property")
+
+def add_properties(memory, num_nodes: int, num_properties: int, rate: float, seed: int = 11):
+    """Gives a fraction of the taxonomy's nodes one 'has_property' fact each."""
+    rng = random.Random(seed)
+    for i in range(num_nodes):
+        if rng.random() < rate:
+            memory.add_relationship(f"c{i}", f"p{rng.randrange(num_properties)}", "has_property")
+
+SUBJECTS = ["cat", "dog", "river", "city", "planet", "tree", "computer", "song"]
+CLASSES = ["an animal", "a place", "a machine", "a thing", "an object", "a system"]
+ADJECTIVES = ["large", "small", "old", "famous", "green", "loud"]
+
+def write_corpus(path: str, num_articles: int, sentences_per_article: int, seed: int = 42):
+    """Writes a deterministic corpus in the tools/ingest_simple_wiki.py format."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for a in range(num_articles):
+            f.write(f"--- ARTICLE: Article {a} ---\n")
+            for _ in range(sentences_per_article):
+                subject = f"The {rng.choice(SUBJECTS)}"
+                if rng.random() < 0.5:
+                    f.write(f"{subject} is {rng.choice(CLASSES)}. ")
+                else:
+                    f.write(f"{subject} is {rng.choice(ADJECTIVES)}. ")
+            f.write("\n\n")
@@ -0,0 +1,117 @@
+# benchmarks/harness.py
+
+import os
+import sys
+import json
+import time
+import platform
+import datetime
+import subprocess
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+def peak_rss_mb() -> Optional[float]:
+    """The peak resident set size of this process so far, in MB, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(q / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def measure(name: str, operation: Callable[[Any], Any], inputs: Iterable[Any],
+            **extra: Any) -> Dict[str, Any]:
+    """
+    Times an operation once per input and summarizes the run.
+
+    Args:
+        name (str): The name the result is reported and compared under.
+        operation (callable): Called with each input in turn.
+        inputs (iterable): The workload, one item per operation.
+        **extra: Further fields to record with the result (e.g., sizes).
+
+    Returns:
+        A JSON-serializable dict with ops, ops_per_sec, p50_us, p99_us and
+        peak_rss_mb, plus the extra fields.
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    start = clock()
+    for item in inputs:
+        t0 = clock()
+        operation(item)
+        latencies.append(clock() - t0)
+    total_ns = clock() - start
+    latencies.sort()
+    return {
+        "name": name,
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / (total_ns / 1e9) if total_ns else 0.0,
+        "p50_us": percentile(latencies, 50) / 1000,
+        "p99_us": percentile(latencies, 99) / 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        **extra,
+    }
+
+def skipped(name: str, reason: str) -> Dict[str, Any]:
+    """A result recording that a benchmark could not run here, and why."""
+    return {"name": name, "skipped": reason}
+
+def environment() -> Dict[str, Any]:
+    """Describes where and on which commit a run happened."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+def write_results(path: str, results: List[Dict[str, Any]], params: Dict[str, Any]):
+    """Writes a run's results, its parameters and its environment as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "params": params, "results": results}, f, indent=2)
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def format_result(result: Dict[str, Any]) -> str:
+    if "skipped" in result:
+        return f"  {result['name']:<34} skipped: {result['skipped']}"
+    rss = result["peak_rss_mb"]
+    rss_text = f"{rss:8.1f} MB" if rss is not None else "       n/a"
+    return (f"  {result['name']:<34} {result['ops_per_sec']:>12,.0f} ops/s   "
+            f"p50 {result['p50_us']:>9.1f} us   p99 {result['p99_us']:>9.1f} us   peak RSS {rss_text}")
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Lines comparing two runs written by write_results(), one per benchmark
+    present in both. A ratio above 1.00x means the current run is faster.
+    """
+    before = {r["name"]: r for r in baseline["results"] if "skipped" not in r}
+    lines = [f"Compared with {baseline['environment'].get('commit') or 'baseline'}:"]
+    for result in current["results"]:
+        old = before.get(result["name"])
+        if old is None or "skipped" in result:
+            continue
+        speedup = result["ops_per_sec"] / old["ops_per_sec"] if old["ops_per_sec"] else float("inf")
+        p99 = old["p99_us"] / result["p99_us"] if result["p99_us"] else float("inf")
+        lines.append(f"  {result['name']:<34} throughput {speedup:5.2f}x   p99 {p99:5.2f}x")
+    return lines
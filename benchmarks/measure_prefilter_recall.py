@@ -0,0 +1,46 @@
+# benchmarks/measure_prefilter_recall.py
+
+import sys
+import os
+import time
+import argparse
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kernel import ArchanonKernel
+from sensory.text_parser import TextParser
+from learning.learner import Learner
+
+def learn(parser: TextParser, corpus_path: str, prefilter: bool):
+    """Ingests the corpus once. Returns (facts, seconds, sentences skipped)."""
+    kernel = ArchanonKernel()
+    learner = Learner(kernel, parser, prefilter=prefilter)
+    start = time.perf_counter()
+    learner.learn_from_corpus(corpus_path, streaming=True)
+    seconds = time.perf_counter() - start
+    return set(kernel.memory.iter_edges()), seconds, learner.sentences_skipped
+
+def main():
+    parser = argparse.ArgumentParser(description="Recall and speed of the copula pre-filter vs. a full parse.")
+    parser.add_argument("--corpus", default="data_corpus/simple_wiki_corpus_v1.txt",
+                        help="Written by tools/ingest_simple_wiki.py.")
+    args = parser.parse_args()
+
+    text_parser = TextParser()
+    if text_parser.nlp is None:
+        sys.exit("This measurement needs the 'en_core_web_sm' model.")
+
+    full_facts, full_secs, _ = learn(text_parser, args.corpus, prefilter=False)
+    filtered_facts, filtered_secs, skipped = learn(text_parser, args.corpus, prefilter=True)
+
+    kept = len(full_facts & filtered_facts)
+    recall = kept / len(full_facts) if full_facts else 1.0
+    print(f"\nFull parse:  {len(full_facts)} facts in {full_secs:.1f}s")
+    print(f"Pre-filter:  {len(filtered_facts)} facts in {filtered_secs:.1f}s "
+          f"({full_secs / filtered_secs:.2f}x), {skipped} sentences skipped")
+    print(f"Recall vs. full parse: {recall:.2%} ({len(full_facts) - kept} facts lost, "
+          f"{len(filtered_facts - full_facts)} facts only found with the pre-filter)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# benchmarks/run_suite.py
+
+import sys
+import os
+import io
+import random
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+# Make the 'src' directory importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from harness import measure, skipped, format_result, write_results, load_results, compare
+from generators import CORPUS_PATH, dag_taxonomy, hub_graph
+
+# Each component runs in its own fresh process, so its peak RSS is its own.
+# A component takes the run parameters and returns a list of results.
+
+def _kernel(params: Dict[str, Any]):
+    from kernel import ArchanonKernel
+    from meta.monitor import MetacognitiveMonitor
+    # A bounded trace, so the log does not dominate memory on long runs.
+    return ArchanonKernel(memory_backend=params["backend"], monitor=MetacognitiveMonitor(retain=10_000))
+
+def _taxonomy_queries(facts, count: int, seed: int = 7):
+    nodes = sorted({source for source, _, _ in facts}, key=lambda n: int(n[1:]))
+    shallow = nodes[:max(len(nodes) // 100, 1)]
+    rng = random.Random(seed)
+    return [(rng.choice(nodes), rng.choice(shallow)) for _ in range(count)]
+
+def bench_kernel(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    facts = list(dag_taxonomy(params["depth"], params["fan_out"]))
+    kernel = _kernel(params)
+    results = [measure("kernel.add_fact", lambda fact: kernel.add_fact(*fact), facts, facts=len(facts))]
+    queries = _taxonomy_queries(facts, params["queries"])
+    results.append(measure("kernel.ask_question", lambda q: kernel.ask_question(*q), queries))
+    return results
+
+def bench_engine(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from memory import create_memory
+    from causal.engine import CausalEngine
+    from causal.rules import DEFAULT_RULES
+    results = []
+
+    memory = create_memory(params["backend"])
+    facts = list(dag_taxonomy(params["depth"], params["fan_out"]))
+    memory.add_relationships(facts)
+    queries = _taxonomy_queries(facts, params["queries"])
+    engine = CausalEngine(memory, cache_limit=0)
+    results.append(measure("engine.deduce_property (dag)", lambda q: engine.deduce_property(*q), queries,
+                           facts=len(facts)))
+    engine.freeze_taxonomy()
+    results.append(measure("engine.deduce_property (frozen)", lambda q: engine.deduce_property(*q), queries))
+
+    memory = create_memory(params["backend"])
+    memory.add_relationships(facts)
+    engine = CausalEngine(memory, cache_limit=0, rules=DEFAULT_RULES)
+    result = measure("engine.rules.materialize (dag)", lambda _: engine.rules.materialize(), range(1))
+    result["derived"] = engine.rules.stats()["derived"]
+    results.append(result)
+    results.append(measure("engine.deduce_property (rules)", lambda q: engine.deduce_property(*q), queries))
+
+    memory = create_memory(params["backend"])
+    memory.add_relationships(hub_graph(params["hub_facts"], params["hub_facts"] // 4))
+    rng = random.Random(9)
+    nodes = params["hub_facts"] // 4
+    queries = [(f"n{rng.randrange(nodes)}", f"hub{rng.randrange(10)}") for _ in range(params["queries"])]
+    engine = CausalEngine(memory, cache_limit=0)
+    results.append(measure("engine.deduce_property (hubs)", lambda q: engine.deduce_property(*q), queries,
+                           facts=memory.number_of_edges()))
+    return results
+
+def bench_query(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from memory import create_memory, query
+    memory = create_memory(params["backend"])
+    facts = list(dag_taxonomy(params["depth"], params["fan_out"]))
+    memory.add_relationships(facts)
+    nodes = len(facts) + 1
+    rng = random.Random(13)
+    memory.add_relationships((f"c{i}", f"p{rng.randrange(100)}", "has_property") for i in range(nodes))
+    parents = sorted({target for _, target, _ in facts})
+    questions = [[("?x", "is_a", rng.choice(parents)), ("?x", "has_property", f"p{rng.randrange(100)}"),
+                  ("?x", "is_a", "?parent")] for _ in range(params["queries"] // 10)]
+    return [measure("memory.query (3 patterns)", lambda patterns: list(query(memory, patterns)), questions,
+                    facts=memory.number_of_edges())]
+
+def bench_parser(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from sensory.text_parser import TextParser
+    from bench_triplet_extraction import build_sentences
+    docs = build_sentences(params["sentences"])
+    parser = TextParser()
+    # Extraction from an already parsed sentence needs no model.
+    results = [measure("parser.iter_triplets", lambda doc: list(parser.iter_triplets(doc)), docs)]
+    if parser.nlp is None:
+        results.append(skipped("parser.extract_triplets", f"spaCy model '{parser.model_name}' is not installed"))
+        return results
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        sentences = parser.split_sentences(f.read())
+    results.append(measure("parser.extract_triplets", parser.extract_triplets, sentences))
+    return results
+
+def bench_learner(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from kernel import ArchanonKernel
+    from sensory.text_parser import TextParser
+    from learning.learner import Learner
+    parser = TextParser()
+    if parser.nlp is None:
+        return [skipped("learner.learn_from_corpus", f"spaCy model '{parser.model_name}' is not installed")]
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        text = f.read()
+    sentences = len(parser.split_sentences(text)) * params["corpus_repeat"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(params["corpus_repeat"]):
+                f.write(text + "\n")
+        learn = lambda _: Learner(ArchanonKernel(), parser).learn_from_corpus(path, streaming=True)
+        result = measure("learner.learn_from_corpus", learn, range(params["learner_runs"]),
+                         sentences=sentences)
+    result["sentences_per_sec"] = result["ops_per_sec"] * sentences
+    return [result]
+
+COMPONENTS = {
+    "kernel": bench_kernel,
+    "engine": bench_engine,
+    "query": bench_query,
+    "parser": bench_parser,
+    "learner": bench_learner,
+}
+
+def run_component(name: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # The modules announce themselves on construction; keep the report readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        return COMPONENTS[name](params)
+
+def run_isolated(name: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Runs one component in a fresh process."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_component, name, params).result()
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCHANON benchmark suite.")
+    parser.add_argument("components", nargs="*", default=list(COMPONENTS),
+                        help=f"Components to run: {', '.join(COMPONENTS)} (default: all).")
+    parser.add_argument("--backend", default="networkx")
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--fan-out", type=int, default=6)
+    parser.add_argument("--hub-facts", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--sentences", type=int, default=20_000)
+    parser.add_argument("--corpus-repeat", type=int, default=20)
+    parser.add_argument("--learner-runs", type=int, default=3)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", help="A JSON file from an earlier run to compare against.")
+    args = parser.parse_args()
+    unknown = [name for name in args.components if name not in COMPONENTS]
+    if unknown:
+        parser.error(f"unknown components: {', '.join(unknown)}")
+
+    params = {key: value for key, value in vars(args).items() if key not in ("components", "output", "compare")}
+    results = []
+    for name in args.components:
+        component_results = run_isolated(name, params)
+        for result in component_results:
+            print(format_result(result))
+        results.extend(component_results)
+
+    if args.output:
+        write_results(args.output, results, params)
+    if args.compare:
+        print("\n".join(compare(load_results(args.compare), {"results": results})))
+
+if __name__ == "__main__":
+    main()
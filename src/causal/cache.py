@@ -0,0 +1,96 @@
+# src/causal/cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Collection, Dict, Optional
+
+class AncestorCache:
+    """
+    AncestorCache v0.2: Memoized Transitive Closure.
+
+    Holds the 'is_a' ancestors of recently queried nodes (any collection;
+    the CausalEngine stores ancestor -> BFS predecessor dicts), evicting the
+    least recently used entries once the total number of stored ancestors
+    passes a configurable limit. Counters are kept for hits, misses,
+    evictions and invalidations.
+
+    v0.2: Every operation holds an internal lock, so concurrent readers of
+    a thread-safe kernel can share one cache.
+    """
+
+    def __init__(self, max_members: int = 1_000_000):
+        """
+        Args:
+            max_members (int): The memory limit, expressed as the total number
+                of ancestor entries held across all cached nodes.
+        """
+        self._entries: "OrderedDict[str, Collection[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_members = max_members
+        self._members = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, node_id: str) -> Optional[Collection[str]]:
+        """Returns the cached ancestors of a node, or None on a miss."""
+        with self._lock:
+            ancestors = self._entries.get(node_id)
+            if ancestors is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(node_id)
+            self.hits += 1
+            return ancestors
+
+    def put(self, node_id: str, ancestors: Collection[str]):
+        """Stores the ancestors of a node, evicting old entries if needed."""
+        if len(ancestors) > self._max_members:
+            return  # Would evict everything and still not fit.
+        with self._lock:
+            self._discard(node_id)
+            self._entries[node_id] = ancestors
+            self._members += len(ancestors)
+            while self._members > self._max_members:
+                _, evicted = self._entries.popitem(last=False)
+                self._members -= len(evicted)
+                self.evictions += 1
+
+    def _discard(self, node_id: str) -> bool:
+        ancestors = self._entries.pop(node_id, None)
+        if ancestors is None:
+            return False
+        self._members -= len(ancestors)
+        return True
+
+    def discard(self, node_id: str) -> bool:
+        """Drops a node's entry. Returns True if one was present."""
+        with self._lock:
+            return self._discard(node_id)
+
+    def invalidate(self, node_id: str):
+        """Drops a node's entry because its ancestry changed."""
+        with self._lock:
+            if self._discard(node_id):
+                self.invalidations += 1
+
+    def clear(self):
+        """Empties the cache. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._members = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache counters as a flat dict, suitable for scraping."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "members": self._members,
+        }
@@ -1,29 +1,208 @@
 # src/causal/engine.py
 
 from memory.core import MemoryCore
-from typing import List, Optional
+from causal.cache import AncestorCache
+from causal.taxonomy import TaxonomyIndex
+from causal.properties import PropertyClosure
+from causal.rules import Rule, RuleEngine
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 class CausalEngine:
     """
-    CausalEngine v0.1: Logical Inference.
+    CausalEngine v0.5: Logical Inference.
 
     This engine performs basic logical deductions on the knowledge graph
     stored in the MemoryCore. Its initial capability is property inheritance.
+
+    v0.2: The 'is_a' ancestors of queried nodes are memoized in an LRU cache.
+    When a new 'is_a' edge arrives, only the entries of the affected node and
+    its descendants are invalidated. Once ingestion settles, freeze_taxonomy()
+    builds a TaxonomyIndex that answers 'is_a' questions without a search
+    for as long as it stays fresh.
+
+    v0.3: deduce_property can also return the justification for its answer,
+    rebuilt from the parent pointers of the same breadth-first search.
+
+    v0.4: Properties are inherited through 'is_a' (cat is_a animal, animal
+    has_property alive => cat is alive), answered from a PropertyClosure
+    table that is maintained incrementally as facts arrive. The table is
+    built when the engine is created, unless build_properties=False defers
+    that to an explicit build_property_closure() call.
+
+    v0.5: Optional forward chaining. Given rules (e.g. causal.rules.DEFAULT_RULES
+    or user-defined Horn rules), a RuleEngine materializes their consequences
+    ahead of time, and questions about the labels the rules derive become
+    plain lookups in its derived-fact store.
     """
 
-    def __init__(self, memory_core: MemoryCore):
+    def __init__(self, memory_core: MemoryCore, cache_limit: int = 1_000_000, inherit_properties: bool = True,
+                 rules: Optional[Sequence[Rule]] = None, build_properties: bool = True):
         """
         Initializes the CausalEngine with a reference to a MemoryCore instance.
 
         Args:
             memory_core (MemoryCore): The memory system to reason over.
+            cache_limit (int): Maximum number of ancestor entries kept in the
+                ancestor cache. Set to 0 to disable caching.
+            inherit_properties (bool): Let nodes inherit the 'has_property'
+                facts of their 'is_a' ancestors.
+            rules (sequence of Rule, optional): Horn rules to materialize with
+                a RuleEngine. Rules deriving 'is_a' or 'has_property' take
+                over those questions from the ancestor search and the
+                property table.
+            build_properties (bool): Build the property table now, in time
+                linear in the size of memory. Pass False to open a large
+                store quickly (e.g. a memory-mapped snapshot); inherited
+                properties are then found by searching the ancestry until
+                build_property_closure() is called.
         """
         self._memory = memory_core
-        print("CausalEngine v0.1 initialized.")
+        self._cache = AncestorCache(cache_limit) if cache_limit > 0 else None
+        self._taxonomy: Optional[TaxonomyIndex] = None
+        self.rules = RuleEngine(memory_core, rules) if rules else None
+        self._derives_is_a = self.rules is not None and self.rules.derives("is_a")
+        derives_properties = self.rules is not None and self.rules.derives("has_property")
+        self._properties = (PropertyClosure(memory_core, build=build_properties)
+                            if inherit_properties and not derives_properties else None)
+        memory_core.add_listener(self._on_relationship_added)
+        print("CausalEngine v0.5 initialized.")
+
+    def _on_relationship_added(self, source_id: str, target_id: str, label: str):
+        """Invalidates cached ancestries made stale by a new 'is_a' edge."""
+        if label != "is_a" or not self._cache:
+            return
+        # The new edge can only change the ancestry of its source and of
+        # everything that already reaches the source through 'is_a'.
+        nodes_to_visit = [source_id]
+        visited_nodes = {source_id}
+        while nodes_to_visit:
+            current_node = nodes_to_visit.pop()
+            self._cache.invalidate(current_node)
+            for child in self._memory.query_sources(current_node, "is_a"):
+                if child not in visited_nodes:
+                    visited_nodes.add(child)
+                    nodes_to_visit.append(child)
+
+    def _compute_ancestors(self, source_id: str) -> Dict[str, str]:
+        """
+        Collects every node reachable from the source through 'is_a' edges,
+        each mapped to the node the breadth-first search reached it from.
+        """
+        # Use a queue for a breadth-first search up the 'is_a' hierarchy.
+        nodes_to_visit = [source_id]
+        visited_nodes = {source_id}
+        ancestors: Dict[str, str] = {}
+
+        while nodes_to_visit:
+            current_node = nodes_to_visit.pop(0)
+
+            # Query the memory for parents in the 'is_a' hierarchy.
+            parents = self._memory.query_relationships(current_node, "is_a")
+            for parent in parents:
+                if parent not in ancestors:
+                    ancestors[parent] = current_node
+                if parent not in visited_nodes:
+                    visited_nodes.add(parent)
+                    nodes_to_visit.append(parent)
+
+        return ancestors
+
+    def get_ancestors(self, source_id: str) -> Dict[str, str]:
+        """
+        Returns all 'is_a' ancestors of a node, served from the cache when possible.
+
+        Args:
+            source_id (str): The node whose ancestry is requested.
+
+        Returns:
+            A dict mapping each ancestor to its predecessor on a shortest
+            'is_a' chain from the source. Treat it as read-only.
+        """
+        if self._cache is None:
+            return self._compute_ancestors(source_id)
+        ancestors = self._cache.get(source_id)
+        if ancestors is None:
+            ancestors = self._compute_ancestors(source_id)
+            self._cache.put(source_id, ancestors)
+        return ancestors
 
-    # In src/causal/engine.py
+    @staticmethod
+    def _is_a_chain(source_id: str, ancestor_id: str, ancestors: Dict[str, str]) -> List[Tuple[str, str, str]]:
+        """Follows predecessor pointers back from an ancestor to the source."""
+        chain = []
+        node = ancestor_id
+        while True:
+            parent = ancestors[node]
+            chain.append((parent, "is_a", node))
+            if parent == source_id:
+                break
+            node = parent
+        chain.reverse()
+        return chain
 
-    def deduce_property(self, source_id: str, property_label: str) -> bool:
+    def _chain_to(self, source_id: str, ancestor_id: str) -> List[Tuple[str, str, str]]:
+        """
+        Returns an 'is_a' chain from a node to one of its ancestors. With a
+        usable frozen taxonomy, the walk only climbs through parents that
+        still reach the ancestor, instead of searching the whole ancestry.
+        """
+        taxonomy = self._taxonomy
+        if taxonomy is not None and (taxonomy.is_fresh or taxonomy.auto_rebuild):
+            predecessors: Dict[str, str] = {}
+            nodes_to_visit = [source_id]
+            while nodes_to_visit and ancestor_id not in predecessors:
+                current_node = nodes_to_visit.pop()
+                for parent in self._memory.query_relationships(current_node, "is_a"):
+                    if parent in predecessors or parent == source_id:
+                        continue
+                    if parent == ancestor_id or taxonomy.is_ancestor(ancestor_id, parent):
+                        predecessors[parent] = current_node
+                        nodes_to_visit.append(parent)
+                        if parent == ancestor_id:
+                            break
+            if ancestor_id in predecessors:
+                return self._is_a_chain(source_id, ancestor_id, predecessors)
+        return self._is_a_chain(source_id, ancestor_id, self.get_ancestors(source_id))
+
+    def freeze_taxonomy(self, auto_rebuild: bool = False) -> TaxonomyIndex:
+        """
+        Builds a TaxonomyIndex over the current 'is_a' hierarchy. While the
+        index is fresh, deductions use it instead of walking the graph.
+        Calling it again refreshes the same index rather than adding another.
+
+        Args:
+            auto_rebuild (bool): Let the index rebuild itself on the next query
+                after a new fact has made it stale.
+        """
+        if self._taxonomy is None:
+            self._taxonomy = TaxonomyIndex(self._memory, auto_rebuild=auto_rebuild)
+        else:
+            self._taxonomy.auto_rebuild = auto_rebuild
+            self._taxonomy.refresh()
+        return self._taxonomy
+
+    def build_property_closure(self):
+        """
+        Builds the property table deferred by build_properties=False. Like
+        freeze_taxonomy(), this is a one-off cost linear in the size of memory;
+        afterwards the table is kept up to date as facts arrive.
+        """
+        if self._properties is not None:
+            self._properties.build()
+
+    def _is_a(self, source_id: str, ancestor_id: str) -> bool:
+        """Checks 'is_a' subsumption, using the frozen taxonomy when it is usable."""
+        taxonomy = self._taxonomy
+        if taxonomy is not None and (taxonomy.is_fresh or taxonomy.auto_rebuild):
+            return taxonomy.is_ancestor(ancestor_id, source_id)
+        return ancestor_id in self.get_ancestors(source_id)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Returns the ancestor cache hit/miss counters (empty if disabled)."""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def deduce_property(self, source_id: str, property_label: str, explain: bool = False
+                        ) -> Union[bool, Tuple[bool, Optional[List[Tuple[str, str, str]]]]]:
         """
         Deduces if a node has a property, either directly or via inheritance.
         v1.1: Now checks for direct 'has_property' relationships first.
@@ -31,35 +210,95 @@ class CausalEngine:
         Args:
             source_id (str): The starting node (e.g., "Socrates", "The cat").
             property_label (str): The property we are checking for (e.g., "mortal", "fluffy").
+            explain (bool): Also return the justification for the answer.
 
         Returns:
-            True if the property is held, False otherwise.
+            True if the property is held, False otherwise. With explain=True,
+            a (result, justification) tuple, where the justification is the
+            list of (source, label, target) facts the answer rests on: the
+            direct 'has_property' fact, the 'is_a' chain, or the 'is_a' chain
+            to an ancestor followed by that ancestor's 'has_property' fact.
+            It is an empty list when the node is the property itself, and
+            None when the result is False.
         """
-        # --- NEW: Step 1: Check for direct properties ---
-        direct_properties = self._memory.query_relationships(source_id, "has_property")
-        if property_label in direct_properties:
-            return True # Found a direct property, reasoning is complete.
+        # Step 1: Check for direct properties
+        if self._memory.has_relationship(source_id, property_label, "has_property"):
+            # Found a direct property, reasoning is complete.
+            return (True, [(source_id, "has_property", property_label)]) if explain else True
 
-        # --- EXISTING: Step 2: Check for inherited properties via 'is_a' ---
+        # Step 2: Check for inherited properties via 'is_a'
         # First, check if the node itself is the property (e.g., ask_question("cat", "animal"))
         if source_id == property_label:
+            return (True, []) if explain else True
+
+        if self.rules is not None:
+            for label in ("is_a", "has_property"):
+                if self.rules.holds(source_id, label, property_label):
+                    return (True, self.rules.explain(source_id, label, property_label)) if explain else True
+            if self._derives_is_a:
+                # The 'is_a' closure is materialized; only the property table is left.
+                holder = self._inherited_holder(source_id, property_label)
+                if holder is None:
+                    return (False, None) if explain else False
+                if not explain:
+                    return True
+                return True, self.rules.explain(source_id, "is_a", holder) + [(holder, "has_property", property_label)]
+
+        # Decide first; the chain is only rebuilt for a True answer that needs it.
+        if self._is_a(source_id, property_label):
+            return (True, self._chain_to(source_id, property_label)) if explain else True
+
+        # Step 3: Check for properties held by an 'is_a' ancestor
+        holder = self._inherited_holder(source_id, property_label)
+        if holder is None:
+            return (False, None) if explain else False
+        if not explain:
             return True
+        return True, self._chain_to(source_id, holder) + [(holder, "has_property", property_label)]
 
-        # Use a queue for a breadth-first search up the 'is_a' hierarchy.
-        nodes_to_visit = [source_id]
-        visited_nodes = {source_id}
+    def _inherited_holder(self, source_id: str, property_label: str) -> Optional[str]:
+        """Returns the ancestor that gives a node an inherited property, if any."""
+        if self._properties is None:
+            return None
+        if not self._properties.ready:
+            # The table is not built yet or grew too large to keep; search the ancestry instead.
+            for ancestor in self.get_ancestors(source_id):
+                if ancestor != source_id and self._memory.has_relationship(ancestor, property_label, "has_property"):
+                    return ancestor
+            return None
+        holder = self._properties.holder(source_id, property_label)
+        return holder if holder != source_id else None
 
-        while nodes_to_visit:
-            current_node = nodes_to_visit.pop(0)
+    def deduce_properties(self, source_id: str, property_labels: Iterable[str]) -> Dict[str, bool]:
+        """
+        Answers several property questions about one node from a single walk
+        of its 'is_a' ancestry.
 
-            # Query the memory for parents in the 'is_a' hierarchy.
-            parents = self._memory.query_relationships(current_node, "is_a")
-            for parent in parents:
-                if parent == property_label:
-                    return True  # Found the property via inheritance
-                
-                if parent not in visited_nodes:
-                    visited_nodes.add(parent)
-                    nodes_to_visit.append(parent)
-        
-        return False # Checked direct and inherited properties, found nothing.
\ No newline at end of file
+        Args:
+            source_id (str): The node the questions are about.
+            property_labels (iterable of str): The properties to check.
+
+        Returns:
+            A dict mapping each property label to the result deduce_property
+            would give for it.
+        """
+        if self.rules is not None:
+            return {property_label: self.deduce_property(source_id, property_label)
+                    for property_label in property_labels}
+        direct_properties = set(self._memory.query_relationships(source_id, "has_property"))
+        taxonomy = self._taxonomy
+        use_taxonomy = taxonomy is not None and (taxonomy.is_fresh or taxonomy.auto_rebuild)
+        ancestors = None
+        results = {}
+        for property_label in property_labels:
+            if property_label in direct_properties or property_label == source_id:
+                results[property_label] = True
+            elif use_taxonomy:
+                results[property_label] = (taxonomy.is_ancestor(property_label, source_id)
+                                           or self._inherited_holder(source_id, property_label) is not None)
+            else:
+                if ancestors is None:
+                    ancestors = self.get_ancestors(source_id)
+                results[property_label] = (property_label in ancestors
+                                           or self._inherited_holder(source_id, property_label) is not None)
+        return results
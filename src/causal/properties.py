@@ -0,0 +1,189 @@
+# src/causal/properties.py
+
+import threading
+from typing import Dict, List, Optional
+
+from causal.taxonomy import strongly_connected_components
+
+class PropertyClosure:
+    """
+    PropertyClosure v0.2: Materialized Property Inheritance.
+
+    A table mapping each node to every property it holds, directly or
+    through an 'is_a' ancestor, together with the node that holds the
+    property directly (its "holder"). Lookups are a pair of dict accesses.
+
+    The table is built from the MemoryCore when the closure is created (or,
+    with build=False, when build() is called) and then kept up to date from
+    its listener:
+    - a new 'has_property' fact spreads the property down to the node's
+      descendants,
+    - a new 'is_a' fact spreads the parent's properties down to the child
+      and its descendants.
+    Propagation stops at nodes that already hold a property, so each
+    (node, property) entry is written once. Until the table is built,
+    ready is False and holder() returns None for every node.
+
+    v0.2: The table has a size limit. On graphs where most nodes reach each
+    other through 'is_a' cycles, every property spreads to every node and
+    the table grows quadratically. Before spreading anything, the build
+    bounds the table's size over the 'is_a' graph with its cycles
+    collapsed, in one linear pass. If the bound (or, later, the table)
+    passes the limit, no table is kept and overflowed is set; holder() then
+    returns None for every node and callers fall back to searching the
+    ancestry.
+    """
+
+    def __init__(self, memory_core, max_entries: Optional[int] = None, build: bool = True):
+        """
+        Args:
+            memory_core: The memory system whose facts are materialized.
+            max_entries (int, optional): The most (node, property) entries to
+                hold. Defaults to 16 per edge in memory, and at least 100,000.
+            build (bool): Build the table now. Pass False for large stores
+                that should open quickly, e.g. a memory-mapped snapshot, and
+                call build() when the one-off cost suits.
+        """
+        self._memory = memory_core
+        self._table: Dict[str, Dict[str, str]] = {}
+        self._entries = 0
+        self._max_entries = max_entries
+        self.overflowed = False
+        self._built = False
+        self._build_lock = threading.Lock()
+        memory_core.add_listener(self._on_relationship_added)
+        if build:
+            self.build()
+
+    @property
+    def ready(self) -> bool:
+        """Whether holder() answers from the table: it is built and has not overflowed."""
+        return self._built and not self.overflowed
+
+    def _limit(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return max(100_000, 16 * self._memory.number_of_edges())
+
+    def build(self):
+        """
+        Builds the table from every fact in memory, in time linear in the
+        number of 'is_a' and 'has_property' edges plus the size of the table.
+        Does nothing once built.
+        """
+        with self._build_lock:
+            if self._built:
+                return
+            parents: Dict[str, List[str]] = {}
+            for source_id, target_id, _ in self._memory.iter_edges("is_a"):
+                parents.setdefault(source_id, []).append(target_id)
+                parents.setdefault(target_id, [])
+            direct: Dict[str, List[str]] = {}
+            for source_id, property_label, _ in self._memory.iter_edges("has_property"):
+                direct.setdefault(source_id, []).append(property_label)
+                parents.setdefault(source_id, [])
+
+            component, members = strongly_connected_components(parents)
+            if self._size_bound(parents, direct, component, members) > self._limit():
+                self.overflowed = True
+            else:
+                self._fill(parents, direct, component, members)
+            self._built = True
+
+    def _size_bound(self, parents: Dict[str, List[str]], direct: Dict[str, List[str]],
+                    component: Dict[str, int], members: List[List[str]]) -> int:
+        """
+        An upper bound on the number of table entries, stopping early once it
+        passes the limit. Nodes in one 'is_a' cycle hold the same properties:
+        at most their own plus their parent components' bounds, and never
+        more than the number of distinct properties.
+        """
+        limit = self._limit()
+        distinct = {p for properties in direct.values() for p in properties}
+        bounds: List[int] = []
+        total = 0
+        for cid, nodes in enumerate(members):  # Ancestors first.
+            held = sum(len(direct.get(node, ())) for node in nodes)
+            parent_components = {component[p] for node in nodes for p in parents[node]}
+            parent_components.discard(cid)
+            held = min(held + sum(bounds[pid] for pid in parent_components), len(distinct))
+            bounds.append(held)
+            total += held * len(nodes)
+            if total > limit:
+                break
+        return total
+
+    def _fill(self, parents: Dict[str, List[str]], direct: Dict[str, List[str]],
+              component: Dict[str, int], members: List[List[str]]):
+        """
+        Fills the table one 'is_a' cycle component at a time, ancestors first:
+        a component holds its parent components' properties plus its members'
+        own, and each member is the holder of its own direct properties.
+        """
+        held_by: List[Dict[str, str]] = []
+        for cid, nodes in enumerate(members):
+            held: Dict[str, str] = {}
+            for node in nodes:
+                for p in parents[node]:
+                    if component[p] != cid:
+                        for property_label, holder in held_by[component[p]].items():
+                            held.setdefault(property_label, holder)
+            for node in nodes:
+                for property_label in direct.get(node, ()):
+                    held[property_label] = node
+            held_by.append(held)
+            for node in nodes:
+                if len(nodes) == 1:
+                    node_held = held
+                else:
+                    node_held = dict(held)
+                    node_held.update((p, node) for p in direct.get(node, ()))
+                if node_held:
+                    self._table[node] = node_held
+                    self._entries += len(node_held)
+
+    def _spread(self, node_id: str, properties: Dict[str, str]):
+        """Adds properties to a node and its 'is_a' descendants, where missing."""
+        pending = [(node_id, properties)]
+        while pending:
+            current_node, incoming = pending.pop()
+            held = self._table.setdefault(current_node, {})
+            added = {p: holder for p, holder in incoming.items() if p not in held}
+            if not added:
+                if not held:
+                    del self._table[current_node]
+                continue
+            held.update(added)
+            self._entries += len(added)
+            if self._entries > self._limit():
+                self._table = {}
+                self.overflowed = True
+                return
+            for child in self._memory.query_sources(current_node, "is_a"):
+                pending.append((child, added))
+
+    def _on_relationship_added(self, source_id: str, target_id: str, label: str):
+        if not self._built or self.overflowed:
+            return
+        if label == "has_property":
+            held = self._table.get(source_id)
+            if held is not None and target_id in held:
+                held[target_id] = source_id  # Prefer the direct fact as holder.
+            else:
+                self._spread(source_id, {target_id: source_id})
+        elif label == "is_a":
+            inherited = self._table.get(target_id)
+            if inherited:
+                self._spread(source_id, dict(inherited))
+
+    def holder(self, node_id: str, property_label: str) -> Optional[str]:
+        """
+        Returns the node that directly holds a property the given node has,
+        or None if the node does not have the property (or the table is not ready).
+        """
+        held = self._table.get(node_id)
+        return held.get(property_label) if held else None
+
+    def properties(self, node_id: str) -> List[str]:
+        """Returns every property a node holds, directly or by inheritance (empty if not ready)."""
+        return list(self._table.get(node_id, ()))
@@ -0,0 +1,361 @@
+# src/causal/rules.py
+
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from memory.query import Pattern, is_variable
+
+# Facts here read (source, label, target), like query patterns, so a rule
+# atom and the fact it matches line up term by term.
+Fact = Tuple[str, str, str]
+
+class Rule:
+    """
+    A Horn rule over relationship labels: when every body pattern matches,
+    the head fact holds. Terms starting with "?" are variables, e.g.
+
+        Rule(("?x", "located_in", "?z"),
+             [("?x", "located_in", "?y"), ("?y", "part_of", "?z")])
+    """
+
+    def __init__(self, head: Pattern, body: Sequence[Pattern], name: Optional[str] = None):
+        """
+        Args:
+            head (tuple): The (source, label, target) pattern the rule derives.
+            body (sequence): The patterns that must all match.
+            name (str, optional): Used in justifications. Defaults to the rule text.
+
+        Raises:
+            ValueError: If the body is empty, a label is a variable, or a head
+                variable does not occur in the body.
+        """
+        if not body:
+            raise ValueError("A rule needs at least one body pattern.")
+        self.head: Pattern = tuple(head)
+        self.body: List[Pattern] = [tuple(pattern) for pattern in body]
+        for _, label, _ in [self.head] + self.body:
+            if is_variable(label):
+                raise ValueError(f"Rule labels must be constants, got '{label}'.")
+        body_variables = {term for source, _, target in self.body for term in (source, target) if is_variable(term)}
+        unbound = [term for term in (self.head[0], self.head[2]) if is_variable(term) and term not in body_variables]
+        if unbound:
+            raise ValueError(f"Head variables do not occur in the body: {', '.join(unbound)}")
+        self.name = name or str(self)
+
+    def __str__(self) -> str:
+        atoms = ", ".join(" ".join(pattern) for pattern in self.body)
+        return f"{' '.join(self.head)} <- {atoms}"
+
+    def __repr__(self) -> str:
+        return f"Rule({self.head!r}, {self.body!r}, name={self.name!r})"
+
+def transitivity(label: str) -> Rule:
+    """(?x label ?y), (?y label ?z) => (?x label ?z), e.g. for 'is_a' or 'part_of'."""
+    return Rule(("?x", label, "?z"), [("?x", label, "?y"), ("?y", label, "?z")], name=f"{label} transitivity")
+
+def inheritance(label: str = "has_property", via: str = "is_a") -> Rule:
+    """(?x via ?y), (?y label ?z) => (?x label ?z): a node inherits its parents' facts."""
+    return Rule(("?x", label, "?z"), [("?x", via, "?y"), ("?y", label, "?z")], name=f"{label} inheritance via {via}")
+
+# The rules behind CausalEngine's built-in reasoning.
+DEFAULT_RULES = (transitivity("is_a"), inheritance("has_property", "is_a"))
+
+class DerivedFacts:
+    """
+    The derived edges, indexed both ways by label and kept apart from the
+    asserted ones in memory, so they can all be dropped in O(1).
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._out: Dict[Tuple[str, str], Set[str]] = {}
+        self._in: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_label: Dict[str, int] = {}
+        # The rule and premises each fact was first derived from.
+        self._support: Dict[Fact, Tuple[str, Tuple[Fact, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._support)
+
+    def __contains__(self, fact: Fact) -> bool:
+        return fact in self._support
+
+    def add(self, fact: Fact, rule_name: str, premises: Tuple[Fact, ...]):
+        source, label, target = fact
+        self._out.setdefault((source, label), set()).add(target)
+        self._in.setdefault((target, label), set()).add(source)
+        self._by_label[label] = self._by_label.get(label, 0) + 1
+        self._support[fact] = (rule_name, premises)
+
+    def targets(self, source: str, label: str) -> Set[str]:
+        return self._out.get((source, label), set())
+
+    def sources(self, target: str, label: str) -> Set[str]:
+        return self._in.get((target, label), set())
+
+    def support(self, fact: Fact) -> Optional[Tuple[str, Tuple[Fact, ...]]]:
+        return self._support.get(fact)
+
+    def iter_facts(self, label: str) -> Iterator[Fact]:
+        for (source, fact_label), targets in list(self._out.items()):
+            if fact_label == label:
+                for target in list(targets):
+                    yield source, label, target
+
+    def label_counts(self) -> Dict[str, int]:
+        return dict(self._by_label)
+
+class RuleEngine:
+    """
+    RuleEngine v0.1: Forward-Chaining Materialization.
+
+    Applies Horn rules to the facts in a MemoryCore ahead of time and keeps
+    every consequence in a DerivedFacts store, so asking whether a derived
+    fact holds is a set lookup rather than a search.
+
+    Evaluation is semi-naive: each round joins only the facts that are new
+    since the previous round (the delta) against everything known, and the
+    facts that round derives become the next delta. The first materialize()
+    starts from all asserted facts of the labels the rules read; after that,
+    each fact added to memory is a delta of one, so only its own
+    consequences are derived. Derived facts live apart from memory:
+    retract_derived() drops them all at once, and they are derived again on
+    the next lookup.
+
+    Example:
+        rules = RuleEngine(memory, [transitivity("part_of")])
+        memory.add_relationship("Paris", "France", "part_of")
+        memory.add_relationship("France", "Europe", "part_of")
+        rules.holds("Paris", "part_of", "Europe") -> True
+    """
+
+    def __init__(self, memory_core, rules: Iterable[Rule] = DEFAULT_RULES):
+        """
+        Args:
+            memory_core: The memory system holding the asserted facts.
+            rules (iterable of Rule): The rules to materialize.
+        """
+        self._memory = memory_core
+        self.rules: List[Rule] = []
+        # label -> (rule, body position) for every body pattern reading that label.
+        self._triggers: Dict[str, List[Tuple[Rule, int]]] = {}
+        self._derived = DerivedFacts()
+        self._materialized = False
+        self._build_lock = threading.Lock()
+        self.rounds = 0
+        for rule in rules:
+            self._register(rule)
+        memory_core.add_listener(self._on_relationship_added)
+        print("RuleEngine v0.1 initialized.")
+
+    def _register(self, rule: Rule):
+        self.rules.append(rule)
+        for position, (_, label, _) in enumerate(rule.body):
+            self._triggers.setdefault(label, []).append((rule, position))
+
+    def add_rule(self, rule: Rule) -> int:
+        """
+        Adds a rule. If facts are already materialized, the rule's
+        consequences are derived now, along with whatever they trigger.
+
+        Returns:
+            The number of facts derived.
+        """
+        self._register(rule)
+        if not self._materialized:
+            return 0
+        delta = [fact for label in {label for _, label, _ in rule.body} for fact in self._known_facts(label)]
+        return self._saturate(delta, only=rule)
+
+    def derives(self, label: str) -> bool:
+        """Whether any rule concludes facts with this label."""
+        return any(rule.head[1] == label for rule in self.rules)
+
+    # --- Materialization --------------------------------------------------
+
+    def materialize(self) -> int:
+        """
+        Derives every consequence of the asserted facts, unless that is
+        already done. Lookups call it on demand.
+
+        Returns:
+            The number of facts derived.
+        """
+        with self._build_lock:
+            if self._materialized:
+                return 0
+            delta = [(source, label, target) for label in self._triggers
+                     for source, target, _ in self._memory.iter_edges(label)]
+            derived = self._saturate(delta)
+            self._materialized = True
+            return derived
+
+    def retract_derived(self):
+        """
+        Drops every derived fact, leaving memory untouched. The next lookup
+        materializes them again, e.g. with the rules changed in between.
+        """
+        with self._build_lock:
+            self._derived.clear()
+            self._materialized = False
+
+    def remove_rule(self, name: str):
+        """Removes the rules with the given name and retracts what was derived."""
+        remaining = [rule for rule in self.rules if rule.name != name]
+        self.rules, self._triggers = [], {}
+        for rule in remaining:
+            self._register(rule)
+        self.retract_derived()
+
+    def _on_relationship_added(self, source_id: str, target_id: str, label: str):
+        if not self._materialized or label not in self._triggers:
+            return
+        fact = (source_id, label, target_id)
+        # A fact derived earlier has had its consequences drawn already.
+        if fact not in self._derived:
+            self._saturate([fact])
+
+    def _saturate(self, delta: List[Fact], only: Optional[Rule] = None) -> int:
+        """Runs semi-naive rounds until a round derives nothing new."""
+        derived = 0
+        while delta:
+            self.rounds += 1
+            next_delta: List[Fact] = []
+            for fact in delta:
+                for rule, position in self._triggers.get(fact[1], ()):
+                    if only is not None and rule is not only:
+                        continue
+                    for bindings in self._fire(rule, position, fact):
+                        head = tuple(bindings.get(term, term) for term in rule.head)
+                        if head in self._derived or self._asserted(head):
+                            continue
+                        # Every body variable is bound now, so the premises follow in body order.
+                        premises = tuple(tuple(bindings.get(term, term) for term in pattern) for pattern in rule.body)
+                        self._derived.add(head, rule.name, premises)
+                        next_delta.append(head)
+            derived += len(next_delta)
+            delta = next_delta
+            only = None  # New facts may trigger any rule.
+        return derived
+
+    def _fire(self, rule: Rule, position: int, fact: Fact) -> Iterator[Dict[str, str]]:
+        """Yields the bindings of every body match that uses the fact for the given body pattern."""
+        row = self._unify(rule.body[position], fact, {})
+        if row is None:
+            return
+        yield from self._join(rule.body[:position] + rule.body[position + 1:], row)
+
+    @staticmethod
+    def _unify(pattern: Pattern, fact: Fact, row: Dict[str, str]) -> Optional[Dict[str, str]]:
+        bindings = dict(row)
+        for term, value in ((pattern[0], fact[0]), (pattern[2], fact[2])):
+            if is_variable(term):
+                if bindings.setdefault(term, value) != value:
+                    return None
+            elif term != value:
+                return None
+        return bindings
+
+    def _join(self, patterns: List[Pattern], row: Dict[str, str]) -> Iterator[Dict[str, str]]:
+        if not patterns:
+            yield row
+            return
+        i = 0
+        if len(patterns) > 1:
+            # Evaluate the most constrained pattern next: both ends bound, then one.
+            def unbound(pattern: Pattern) -> int:
+                return sum(is_variable(term) and term not in row for term in (pattern[0], pattern[2]))
+            i = min(range(len(patterns)), key=lambda k: unbound(patterns[k]))
+        pattern = patterns[i]
+        rest = patterns[:i] + patterns[i + 1:]
+        source = row.get(pattern[0], pattern[0])
+        label = pattern[1]
+        target = row.get(pattern[2], pattern[2])
+
+        if not is_variable(source) and not is_variable(target):
+            fact = (source, label, target)
+            candidates: Iterable[Fact] = [fact] if fact in self._derived or self._asserted(fact) else []
+        elif not is_variable(source):
+            candidates = [(source, label, t) for t in self._targets(source, label)]
+        elif not is_variable(target):
+            candidates = [(s, label, target) for s in self._sources(target, label)]
+        else:
+            candidates = list(self._known_facts(label))
+        for candidate in candidates:
+            bindings = self._unify(pattern, candidate, row)
+            if bindings is not None:
+                yield from self._join(rest, bindings)
+
+    # --- Lookups over asserted and derived facts ---------------------------
+
+    def _asserted(self, fact: Fact) -> bool:
+        return self._memory.has_relationship(fact[0], fact[2], fact[1])
+
+    def _known_facts(self, label: str) -> Iterator[Fact]:
+        for source, target, _ in self._memory.iter_edges(label):
+            yield source, label, target
+        yield from self._derived.iter_facts(label)
+
+    def _targets(self, source: str, label: str) -> List[str]:
+        asserted = self._memory.query_relationships(source, label)
+        derived = self._derived.targets(source, label)
+        return list(asserted) + list(derived) if derived else list(asserted)
+
+    def _sources(self, target: str, label: str) -> List[str]:
+        asserted = self._memory.query_sources(target, label)
+        derived = self._derived.sources(target, label)
+        return list(asserted) + list(derived) if derived else list(asserted)
+
+    def holds(self, source_id: str, label: str, target_id: str) -> bool:
+        """Whether a fact is asserted in memory or derived by the rules."""
+        if not self._materialized:
+            self.materialize()
+        return (source_id, label, target_id) in self._derived or self._asserted((source_id, label, target_id))
+
+    def is_derived(self, source_id: str, label: str, target_id: str) -> bool:
+        """Whether a fact was derived by the rules (rather than only asserted)."""
+        if not self._materialized:
+            self.materialize()
+        return (source_id, label, target_id) in self._derived
+
+    def query_relationships(self, source_id: str, label: str) -> List[str]:
+        """The targets of a node's asserted and derived edges with a label."""
+        if not self._materialized:
+            self.materialize()
+        return list(dict.fromkeys(self._targets(source_id, label)))
+
+    def query_sources(self, target_id: str, label: str) -> List[str]:
+        """The sources of a node's asserted and derived incoming edges with a label."""
+        if not self._materialized:
+            self.materialize()
+        return list(dict.fromkeys(self._sources(target_id, label)))
+
+    def explain(self, source_id: str, label: str, target_id: str) -> Optional[List[Fact]]:
+        """
+        Returns the asserted facts a fact rests on, in derivation order, or
+        None if it does not hold. An asserted fact is its own justification.
+        """
+        fact = (source_id, label, target_id)
+        if not self.holds(*fact):
+            return None
+        justification: List[Fact] = []
+        seen: Set[Fact] = set()
+        pending = [fact]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            support = self._derived.support(current)
+            if support is None or self._asserted(current):
+                justification.append(current)
+            else:
+                pending.extend(reversed(support[1]))
+        return justification
+
+    def stats(self) -> Dict[str, object]:
+        """The number of derived facts, in total and per label, and of rounds run."""
+        return {"derived": len(self._derived), "by_label": self._derived.label_counts(),
+                "rounds": self.rounds, "materialized": self._materialized}
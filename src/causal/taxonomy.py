@@ -0,0 +1,258 @@
+# src/causal/taxonomy.py
+
+import threading
+from array import array
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+def strongly_connected_components(parents: Dict[str, List[str]]) -> Tuple[Dict[str, int], List[List[str]]]:
+    """
+    Finds the strongly connected components of a graph with an iterative
+    Tarjan search. Components come out ancestors-first: a component is
+    numbered after every component it points at.
+
+    Args:
+        parents (dict): Each node mapped to the nodes it points at. Every
+            node that is pointed at must also be a key.
+
+    Returns:
+        A (node -> component number, component number -> members) pair.
+    """
+    component: Dict[str, int] = {}
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    members: List[List[str]] = []
+
+    for root in parents:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, i = work.pop()
+            if i == 0:
+                index[node] = low[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+            node_parents = parents[node]
+            while i < len(node_parents):
+                parent = node_parents[i]
+                i += 1
+                if parent not in index:
+                    work.append((node, i))
+                    work.append((parent, 0))
+                    break
+                if parent in on_stack:
+                    low[node] = min(low[node], index[parent])
+            else:
+                if low[node] == index[node]:
+                    found = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = len(members)
+                        found.append(member)
+                        if member == node:
+                            break
+                    members.append(found)
+                if work:
+                    caller = work[-1][0]
+                    low[caller] = min(low[caller], low[node])
+    return component, members
+
+class TaxonomyIndex:
+    """
+    TaxonomyIndex v0.1: The Frozen Taxonomy.
+
+    A precomputed index over the 'is_a' hierarchy that answers "is X a Y"
+    without searching the graph.
+
+    - Cycles are collapsed into strongly connected components first.
+    - Each component picks its first parent as a tree parent. The resulting
+      spanning forest is labelled with DFS pre/post intervals, so a tree
+      ancestor is found by interval containment in O(1).
+    - Ancestors reached through the other parents (the DAG part) are kept
+      in per-component 'extra' sets. A component without extra parents shares
+      its tree parent's set, so tree-like regions cost no extra memory.
+
+    The index listens to the MemoryCore. A new 'is_a' edge from a leaf is
+    patched in place; any other new 'is_a' edge marks the index stale until
+    refresh() rebuilds it (automatically on the next query if auto_rebuild
+    is set). Such rebuilds are serialized, and the index is only marked
+    fresh once a build is complete, so concurrent readers are safe.
+    """
+
+    def __init__(self, memory_core, auto_rebuild: bool = False):
+        """
+        Builds the index from the current contents of a MemoryCore.
+
+        Args:
+            memory_core: The memory system whose 'is_a' edges are indexed.
+            auto_rebuild (bool): Rebuild a stale index on the next query
+                instead of waiting for an explicit refresh().
+        """
+        self._memory = memory_core
+        self.auto_rebuild = auto_rebuild
+        self._build_lock = threading.Lock()
+        self._build()
+        memory_core.add_listener(self._on_relationship_added)
+
+    @property
+    def is_fresh(self) -> bool:
+        """True when the index reflects every 'is_a' edge in memory."""
+        return not self._stale
+
+    def refresh(self):
+        """Rebuilds the index if new facts have made it stale."""
+        if self._stale:
+            with self._build_lock:
+                if self._stale:
+                    self._build()
+
+    def _build(self):
+        parents: Dict[str, List[str]] = {}
+        for source_id, target_id, _ in self._memory.iter_edges("is_a"):
+            parents.setdefault(source_id, []).append(target_id)
+            parents.setdefault(target_id, [])
+
+        self._component: Dict[str, int] = {}
+        self._cyclic: Set[int] = set()
+        self._extra: Dict[int, FrozenSet[int]] = {}
+        self._tree_parent = array("i")
+        self._pre = array("i")
+        self._post = array("i")
+
+        comp_parents = self._condense(parents)
+        self._label_intervals(comp_parents)
+        self._collect_extras(comp_parents)
+        self._stale = False
+
+    def _condense(self, parents: Dict[str, List[str]]) -> List[List[int]]:
+        """
+        Collapses the 'is_a' cycles into components, ancestors first, which
+        is the order the rest of the build relies on. Returns each
+        component's parent components.
+        """
+        self._component, members = strongly_connected_components(parents)
+        comp_parents: List[List[int]] = []
+        for cid, component in enumerate(members):
+            seen: Dict[int, None] = {}
+            for member in component:
+                for parent in parents[member]:
+                    pid = self._component[parent]
+                    if pid == cid:
+                        self._cyclic.add(cid)
+                    else:
+                        seen[pid] = None
+            comp_parents.append(list(seen))
+        return comp_parents
+
+    def _label_intervals(self, comp_parents: List[List[int]]):
+        """Assigns DFS pre/post numbers over the spanning forest of first parents."""
+        count = len(comp_parents)
+        children: Dict[int, List[int]] = {}
+        roots = []
+        for cid, pids in enumerate(comp_parents):
+            tree_parent = pids[0] if pids else -1
+            self._tree_parent.append(tree_parent)
+            if tree_parent < 0:
+                roots.append(cid)
+            else:
+                children.setdefault(tree_parent, []).append(cid)
+
+        self._pre = array("i", [0]) * count
+        self._post = array("i", [0]) * count
+        clock = 0
+        for root in roots:
+            work = [(root, False)]
+            while work:
+                cid, done = work.pop()
+                if done:
+                    self._post[cid] = clock
+                    clock += 1
+                    continue
+                self._pre[cid] = clock
+                clock += 1
+                work.append((cid, True))
+                for child in children.get(cid, ()):
+                    work.append((child, False))
+
+    def _tree_chain(self, cid: int) -> List[int]:
+        """Returns a component and its tree ancestors."""
+        chain = []
+        while cid >= 0:
+            chain.append(cid)
+            cid = self._tree_parent[cid]
+        return chain
+
+    def _closure(self, cid: int) -> Set[int]:
+        """Returns a component together with all of its ancestors."""
+        closure = set(self._tree_chain(cid))
+        closure.update(self._extra.get(cid, ()))
+        return closure
+
+    def _collect_extras(self, comp_parents: List[List[int]]):
+        """Computes the non-tree ancestors of every component, ancestors first."""
+        empty: FrozenSet[int] = frozenset()
+        for cid, pids in enumerate(comp_parents):
+            inherited = self._extra.get(pids[0], empty) if pids else empty
+            if len(pids) <= 1:
+                if inherited:
+                    self._extra[cid] = inherited
+                continue
+            extra = set(inherited)
+            for pid in pids[1:]:
+                extra |= self._closure(pid)
+            self._extra[cid] = frozenset(extra)
+
+    def _on_relationship_added(self, source_id: str, target_id: str, label: str):
+        if label != "is_a" or self._stale:
+            return
+        if source_id == target_id or self._memory.query_sources(source_id, "is_a"):
+            # Renumbering a subtree is as costly as a rebuild.
+            self._stale = True
+            return
+        # The source is a leaf, so only its own ancestry changes.
+        sid = self._component.get(source_id)
+        if sid is None:
+            sid = self._add_unlabelled_component(source_id)
+        tid = self._component.get(target_id)
+        if tid is None:
+            tid = self._add_unlabelled_component(target_id)
+        extra = set(self._extra.get(sid, ()))
+        extra |= self._closure(tid)
+        self._extra[sid] = frozenset(extra)
+
+    def _add_unlabelled_component(self, node_id: str) -> int:
+        """Adds a component that lies outside every tree interval."""
+        cid = len(self._pre)
+        self._component[node_id] = cid
+        self._tree_parent.append(-1)
+        self._pre.append(-1)
+        self._post.append(-1)
+        return cid
+
+    def is_ancestor(self, ancestor_id: str, node_id: str) -> bool:
+        """
+        Checks whether ancestor_id is reachable from node_id through one or
+        more 'is_a' edges.
+
+        Args:
+            ancestor_id (str): The candidate ancestor (e.g., "mortal").
+            node_id (str): The node whose ancestry is checked (e.g., "Socrates").
+
+        Returns:
+            True if node_id is_a ancestor_id, directly or transitively.
+        """
+        if self._stale and self.auto_rebuild:
+            self.refresh()
+        cx = self._component.get(node_id)
+        cy = self._component.get(ancestor_id)
+        if cx is None or cy is None:
+            return False
+        if cx == cy:
+            return cx in self._cyclic
+        pre, post = self._pre, self._post
+        if pre[cy] < pre[cx] and post[cx] < post[cy]:
+            return True
+        return cy in self._extra.get(cx, ())
@@ -0,0 +1,51 @@
+# src/concurrency.py
+
+import threading
+from contextlib import contextmanager
+
+class ReadWriteLock:
+    """
+    ReadWriteLock v0.1: Shared Reads, Exclusive Writes.
+
+    Any number of readers may hold the lock at once; a writer holds it
+    alone. Waiting writers take priority over new readers, so a steady
+    stream of questions cannot starve the Learner. The lock is not
+    reentrant: a thread must not take it again while holding it.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """Holds the lock shared for the duration of a with-block."""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Holds the lock exclusively for the duration of a with-block."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
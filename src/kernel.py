@@ -1,9 +1,15 @@
 # src/kernel.py
 
-from memory.core import MemoryCore
+import hashlib
+import functools
+from contextlib import nullcontext
+from concurrency import ReadWriteLock
+from memory import create_memory, TripleQuery
+from memory.store import open_snapshot
 from causal.engine import CausalEngine
+from causal.rules import Rule
 from meta.monitor import MetacognitiveMonitor
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Sequence, Tuple
 
 class ArchanonKernel:
     """
@@ -12,19 +18,59 @@ class ArchanonKernel:
     This class acts as a facade, integrating the MemoryCore, CausalEngine,
     and MetacognitiveMonitor into a single, cohesive system. It provides
     high-level methods for interacting with the AGI core and ensures that
-    all actions are monitored and logged.
+    all actions are monitored and logged. Each call is also timed in the
+    monitor's metrics (see MetacognitiveMonitor.metrics_snapshot).
     """
 
-    def __init__(self):
-        """Initializes all sub-modules of the cognitive kernel."""
-        self.memory = MemoryCore()
-        self.causal = CausalEngine(self.memory)
-        self.monitor = MetacognitiveMonitor()
+    def __init__(self, memory_backend: str = "networkx", memory_path: Optional[str] = None,
+                 monitor: Optional[MetacognitiveMonitor] = None, thread_safe: bool = False,
+                 rules: Optional[Sequence[Rule]] = None):
+        """
+        Initializes all sub-modules of the cognitive kernel.
+
+        Args:
+            memory_backend (str): The MemoryCore storage backend to use,
+                "networkx" (default) or "compact" for large graphs.
+            memory_path (str, optional): A snapshot written by
+                MemoryCore.save_snapshot(). When given, memory is opened
+                memory-mapped from it instead of starting empty, and the
+                property table is not built until
+                kernel.causal.build_property_closure() is called.
+            monitor (MetacognitiveMonitor, optional): A pre-configured monitor,
+                e.g. with a bounded in-memory log and disk sinks.
+            thread_safe (bool): Guard the kernel with a reader-writer lock, so
+                questions from many threads run side by side while each
+                write (a single fact or a whole add_facts batch) is applied
+                in isolation. Readers never see a half-applied batch.
+            rules (sequence of Rule, optional): Horn rules the CausalEngine
+                materializes ahead of time, e.g. causal.rules.DEFAULT_RULES.
+                New facts then derive their consequences as they are added.
+        """
+        self._memory_backend = memory_backend
+        self._rules = list(rules) if rules else None
+        self._lock = ReadWriteLock() if thread_safe else None
+        if memory_path is not None:
+            self.memory = open_snapshot(memory_path)
+        else:
+            self.memory = create_memory(memory_backend)
+        self.causal = CausalEngine(self.memory, rules=self._rules, build_properties=memory_path is None)
+        self.monitor = monitor if monitor is not None else MetacognitiveMonitor()
         print("ArchanonKernel v1.0 initialized and online.")
 
-    def _log(self, module: str, action: str, params: Dict[str, Any], result: Any):
+    @property
+    def thread_safe(self) -> bool:
+        return self._lock is not None
+
+    def _reading(self):
+        return self._lock.read() if self._lock is not None else nullcontext()
+
+    def _writing(self):
+        return self._lock.write() if self._lock is not None else nullcontext()
+
+    def _log(self, module: str, action: str, params: Dict[str, Any], result: Any,
+             justification: Optional[List[Tuple[str, str, str]]] = None, duration_ns: Optional[int] = None):
         """A helper method to standardize logging."""
-        self.monitor.log_event(module, action, params, result)
+        self.monitor.log_event(module, action, params, result, justification, duration_ns)
 
     def add_fact(self, source_id: str, target_id: str, label: str):
         """
@@ -33,14 +79,41 @@ class ArchanonKernel:
         Example: kernel.add_fact("Socrates", "human", "is_a")
         """
         params = {"source_id": source_id, "target_id": target_id, "label": label}
-        self.memory.add_relationship(source_id, target_id, label)
-        # Log this event after it has been executed.
-        self._log("MemoryCore", "add_relationship", params, "Success")
+        with self._writing():
+            with self.monitor.timer("MemoryCore", "add_relationship") as timer:
+                self.memory.add_relationship(source_id, target_id, label)
+            # Log this event after it has been executed.
+            self._log("MemoryCore", "add_relationship", params, "Success", duration_ns=timer.elapsed_ns)
+
+    def add_facts(self, facts: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Adds a batch of (source_id, target_id, label) facts to memory.
+        Duplicates within the batch are dropped, and a single summary event
+        recording the counts and a SHA-256 digest of the batch is logged.
+
+        Example: kernel.add_facts([("Socrates", "human", "is_a"), ("human", "mortal", "is_a")])
+
+        Returns:
+            The number of facts that were new to memory.
+        """
+        facts = list(facts)
+        unique_facts = list(dict.fromkeys(facts))
+        digest = hashlib.sha256()
+        for source_id, target_id, label in unique_facts:
+            digest.update(f"{source_id}\t{target_id}\t{label}\n".encode("utf-8"))
+        params = {"facts": len(facts), "unique": len(unique_facts), "digest": digest.hexdigest()}
+
+        with self._writing():
+            with self.monitor.timer("MemoryCore", "add_relationships") as timer:
+                added = self.memory.add_relationships(unique_facts)
+            self._log("MemoryCore", "add_relationships", params, {"added": added}, duration_ns=timer.elapsed_ns)
+        return added
 
     def ask_question(self, source_id: str, property_label: str) -> bool:
         """
         Asks the kernel if a node has a certain property, using causal deduction.
-        The entire process is logged.
+        The entire process is logged, including the chain of facts that
+        justifies a positive answer.
 
         Example: kernel.ask_question("Socrates", "mortal") -> True
 
@@ -48,11 +121,82 @@ class ArchanonKernel:
             The boolean result of the deduction.
         """
         params = {"source_id": source_id, "property_label": property_label}
-        result = self.causal.deduce_property(source_id, property_label)
-        # Log this event after it has been executed.
-        self._log("CausalEngine", "deduce_property", params, result)
+        with self._reading(), self.monitor.timer("CausalEngine", "deduce_property") as timer:
+            result, justification = self.causal.deduce_property(source_id, property_label, explain=True)
+        # Log this event after it has been executed, outside the read lock.
+        self._log("CausalEngine", "deduce_property", params, result, justification, timer.elapsed_ns)
         return result
 
+    def ask_questions(self, questions: Iterable[Tuple[str, str]]) -> List[bool]:
+        """
+        Answers a batch of (source_id, property_label) questions.
+        Questions are grouped by subject so each subject's 'is_a' ancestry is
+        walked once, and a single aggregated event is logged for the batch.
+
+        Example: kernel.ask_questions([("Socrates", "mortal"), ("Socrates", "human")]) -> [True, True]
+
+        Returns:
+            The boolean results, in the same order as the questions.
+        """
+        questions = list(questions)
+        by_subject: Dict[str, List[str]] = {}
+        for source_id, property_label in questions:
+            by_subject.setdefault(source_id, []).append(property_label)
+
+        with self._reading(), self.monitor.timer("CausalEngine", "deduce_properties") as timer:
+            answers = {
+                source_id: self.causal.deduce_properties(source_id, property_labels)
+                for source_id, property_labels in by_subject.items()
+            }
+        results = [answers[source_id][property_label] for source_id, property_label in questions]
+
+        params = {"questions": len(questions), "subjects": len(by_subject)}
+        per_question = [
+            {"source_id": source_id, "property_label": property_label, "result": result}
+            for (source_id, property_label), result in zip(questions, results)
+        ]
+        self._log("CausalEngine", "deduce_properties", params, per_question, duration_ns=timer.elapsed_ns)
+        return results
+
+    def query(self, patterns: Iterable[Tuple[str, str, str]], select: Optional[Iterable[str]] = None
+              ) -> Iterator[Dict[str, str]]:
+        """
+        Answers a conjunction of (source, label, target) triple patterns,
+        where terms starting with "?" are variables (see memory.query).
+        The query plan is logged; answers are streamed lazily. In thread-safe
+        mode the query runs over a snapshot, so facts added while the
+        answers are being read do not affect them.
+
+        Example:
+            kernel.query([("?x", "is_a", "country"), ("?x", "has_property", "large")])
+            -> iterator of {"?x": ...} bindings
+
+        Returns:
+            An iterator of {variable: node} bindings.
+        """
+        patterns = [tuple(pattern) for pattern in patterns]
+        triple_query = TripleQuery(patterns, list(select) if select is not None else None)
+        with self._reading():
+            memory = self.memory.snapshot() if self.thread_safe else self.memory
+            with self.monitor.timer("MemoryCore", "plan_query") as timer:
+                plan = triple_query.plan(memory)
+        self._log("MemoryCore", "plan_query", {"patterns": patterns}, TripleQuery.describe(plan),
+                  duration_ns=timer.elapsed_ns)
+        return triple_query.run(memory, plan)
+
+    def snapshot(self):
+        """
+        Returns an O(1), read-only view of memory as it is now, for batch
+        reasoning jobs that need a stable graph while facts keep arriving.
+        In thread-safe mode the view never contains half of a batch.
+
+        Example:
+            engine = CausalEngine(kernel.snapshot())
+            engine.deduce_property("Socrates", "mortal")
+        """
+        with self._reading():
+            return self.memory.snapshot()
+
     def get_reasoning_trace(self) -> str:
         """
         Returns the full, human-readable Chain of Consciousness for the last
@@ -60,9 +204,83 @@ class ArchanonKernel:
         """
         return self.monitor.get_formatted_chain()
 
+    def close(self):
+        """Stores any pending log events and closes the monitor's sinks."""
+        self.monitor.close()
+
     def reset(self):
-        """Resets the kernel's memory and log to a clean state."""
-        self.memory = MemoryCore()
-        self.causal = CausalEngine(self.memory)
-        self.monitor.clear_log()
-        self._log("ArchanonKernel", "reset", {}, "System reset to initial state.")
\ No newline at end of file
+        """
+        Resets the kernel's memory and log to a clean state.
+        A kernel opened from a snapshot restarts with empty in-memory storage.
+        Views returned by snapshot() keep reading the memory they were taken from.
+        """
+        with self._writing():
+            self.memory = create_memory(self._memory_backend)
+            self.causal = CausalEngine(self.memory, rules=self._rules)
+            self.monitor.clear_log()
+            self._log("ArchanonKernel", "reset", {}, "System reset to initial state.")
+
+class AsyncArchanonKernel:
+    """
+    AsyncArchanonKernel v0.1: The Concurrent Facade.
+
+    An asyncio front end for a thread-safe ArchanonKernel, for serving
+    questions from many request handlers while a Learner keeps adding facts.
+    Each call runs on a thread pool, so the event loop is never blocked;
+    the kernel's reader-writer lock lets questions overlap with each other
+    and keeps every write batch atomic with respect to them.
+
+    Example:
+        kernel = AsyncArchanonKernel()
+        await kernel.add_facts([("Socrates", "human", "is_a")])
+        await kernel.ask_question("Socrates", "human") -> True
+    """
+
+    def __init__(self, kernel: Optional[ArchanonKernel] = None, max_workers: Optional[int] = None,
+                 **kernel_options):
+        """
+        Args:
+            kernel (ArchanonKernel, optional): A kernel created with
+                thread_safe=True. By default a new one is created.
+            max_workers (int, optional): Size of the thread pool.
+            **kernel_options: Passed to ArchanonKernel when creating one.
+        """
+        if kernel is None:
+            kernel = ArchanonKernel(thread_safe=True, **kernel_options)
+        elif not kernel.thread_safe:
+            raise ValueError("AsyncArchanonKernel needs a kernel created with thread_safe=True.")
+        # Imported here so that synchronous users never pay for it.
+        from concurrent.futures import ThreadPoolExecutor
+        self.kernel = kernel
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="archanon")
+        print("AsyncArchanonKernel v0.1 initialized.")
+
+    async def _run(self, method, *args):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args))
+
+    async def add_fact(self, source_id: str, target_id: str, label: str):
+        """See ArchanonKernel.add_fact."""
+        return await self._run(self.kernel.add_fact, source_id, target_id, label)
+
+    async def add_facts(self, facts: Iterable[Tuple[str, str, str]]) -> int:
+        """See ArchanonKernel.add_facts. The batch is applied atomically."""
+        return await self._run(self.kernel.add_facts, list(facts))
+
+    async def ask_question(self, source_id: str, property_label: str) -> bool:
+        """See ArchanonKernel.ask_question."""
+        return await self._run(self.kernel.ask_question, source_id, property_label)
+
+    async def ask_questions(self, questions: Iterable[Tuple[str, str]]) -> List[bool]:
+        """See ArchanonKernel.ask_questions."""
+        return await self._run(self.kernel.ask_questions, list(questions))
+
+    async def get_reasoning_trace(self) -> str:
+        """See ArchanonKernel.get_reasoning_trace."""
+        return await self._run(self.kernel.get_reasoning_trace)
+
+    def close(self):
+        """Waits for running calls, then closes the underlying kernel."""
+        self._executor.shutdown(wait=True)
+        self.kernel.close()
@@ -1,67 +1,316 @@
 # src/learning/learner.py
 
+import re
+from collections import OrderedDict
 from kernel import ArchanonKernel
 from sensory.text_parser import TextParser
-import spacy # We need spacy here to split text into sentences
+from sensory.parse_cache import ParseCache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+# Article headers written by tools/ingest_simple_wiki.py.
+ARTICLE_MARKER = re.compile(r"^--- ARTICLE: .* ---$")
+SENTENCE_ENDS = (".", "!", "?")
+
+def iter_corpus_chunks(corpus_filepath: str, max_chars: int = 100_000) -> Iterator[str]:
+    """
+    Lazily splits a corpus file into chunks that can be parsed independently.
+
+    Chunks end at '--- ARTICLE: ... ---' markers (which are dropped), or,
+    once a chunk holds max_chars characters, at the next paragraph boundary
+    or line that ends a sentence (or at any line, from twice the limit), so
+    text without blank lines is split too. A single line longer than
+    max_chars is cut at its last sentence end before the limit. Only one
+    chunk is held in memory at a time.
+
+    Args:
+        corpus_filepath (str): The path to the text file to read.
+        max_chars (int): The soft size limit of a chunk, in characters.
+    """
+    buffer: List[str] = []
+    size = 0
+    with open(corpus_filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            is_blank = not line.strip()
+            is_marker = ARTICLE_MARKER.match(line.strip())
+            at_boundary = size >= max_chars and (
+                is_blank or buffer[-1].rstrip().endswith(SENTENCE_ENDS) or size >= 2 * max_chars)
+            if (is_marker or at_boundary or len(line) > max_chars) and buffer:
+                chunk = "".join(buffer)
+                if chunk.strip():
+                    yield chunk
+                buffer, size = [], 0
+            if is_marker or (at_boundary and is_blank):
+                continue
+
+            while len(line) > max_chars:
+                cut = line.rfind(". ", 0, max_chars) + 1 or max_chars
+                yield line[:cut]
+                line = line[cut:]
+            buffer.append(line)
+            size += len(line)
+
+    chunk = "".join(buffer)
+    if chunk.strip():
+        yield chunk
+
+class _ChunkTriplets:
+    """The triplets of one chunk's sentences, as they arrive from the cache or the parser."""
+
+    def __init__(self, sentences: List[str], skipped_so_far: int):
+        self.sentences = sentences
+        self.triplets: List[Optional[List[Tuple[str, str, str]]]] = [None] * len(sentences)
+        self.waiting = len(sentences)
+        self.skipped_so_far = skipped_so_far
+
+    def fill(self, position: int, triplets: List[Tuple[str, str, str]]):
+        self.triplets[position] = triplets
+        self.waiting -= 1
 
 class Learner:
     """
-    Learner v1.0: The Learning Loop.
+    Learner v1.6: The Learning Loop.
 
     This module orchestrates the process of learning from a text corpus.
     It uses the TextParser to extract knowledge from sentences and then
     instructs the ArchanonKernel to add that knowledge to its MemoryCore.
+
+    v1.1: Adds a streaming mode that reads and parses the corpus one chunk
+    at a time, so peak memory no longer grows with the corpus size. Each
+    chunk is parsed once, and triplets are extracted from its sentence spans.
+
+    v1.2: Chunks are parsed in batches through nlp.pipe, optionally across
+    several worker processes, with the components extraction does not use
+    disabled. Parsed chunks come back in corpus order, so the facts added to
+    memory are the same whatever the number of processes. Each parsed
+    chunk's facts are handed to the kernel as one batch.
+
+    v1.3: An optional lexical pre-filter. Text is split into sentences by a
+    tokenizer-only pass, and only sentences containing a copula are sent to
+    the full pipeline; the number skipped is reported.
+
+    v1.4: An optional on-disk ParseCache. Sentences whose triplets were
+    cached by an earlier ingest (with the same model and extraction rules)
+    skip spaCy entirely; the cache hit rate is reported with the progress.
+
+    v1.5: The parser's shared model is loaded on the first parse, not when
+    the Learner is created.
+
+    v1.6: Parsing, extraction and whole ingests are timed, and sentences,
+    facts, skips and cache hits counted, in the kernel monitor's metrics.
     """
 
-    def __init__(self, kernel: ArchanonKernel, parser: TextParser):
+    def __init__(self, kernel: ArchanonKernel, parser: TextParser, batch_size: int = 32, n_process: int = 1,
+                 prefilter: bool = False, parse_cache: Optional[ParseCache] = None):
         """
         Initializes the Learner with a kernel and a text parser.
         
         Args:
             kernel (ArchanonKernel): The cognitive core to populate.
             parser (TextParser): The sensory module for understanding text.
+            batch_size (int): Number of texts nlp.pipe parses per batch.
+            n_process (int): Number of spaCy worker processes (-1 for one per CPU).
+            prefilter (bool): Parse only the sentences that contain a copula
+                (see TextParser.is_candidate). Much faster, at the cost of
+                facts in sentences the rule-based splitter cuts differently.
+            parse_cache (ParseCache, optional): Reuse the triplets of sentences
+                seen in earlier ingests. Its namespace should come from
+                parser.cache_namespace().
         """
         self.kernel = kernel
         self.parser = parser
-        # We use the parser's nlp model for sentence splitting.
-        self.nlp = parser.nlp
-        print("Learner v1.0 initialized.")
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.prefilter = prefilter
+        self.parse_cache = parse_cache
+        self.sentences_skipped = 0
+        self.metrics = kernel.monitor.metrics
+        print("Learner v1.6 initialized.")
+
+    @property
+    def nlp(self):
+        """The parser's shared spaCy pipeline, loaded on first use."""
+        return self.parser.nlp
 
-    def learn_from_corpus(self, corpus_filepath: str):
+    def _parse(self, texts: Iterable, as_tuples: bool = False) -> Iterator:
+        """Parses texts in batches, yielding Docs (or (Doc, context) pairs) in input order."""
+        docs = self.nlp.pipe(
+            texts,
+            as_tuples=as_tuples,
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+            disable=self.parser.unused_pipes(),
+        )
+        return self.metrics.time_iter("TextParser", "parse", docs)
+
+    def _sentences_to_parse(self, chunks: Iterable[str], pending: "OrderedDict[int, _ChunkTriplets]",
+                            totals: List[int]) -> Iterator[Tuple[str, Tuple[int, int]]]:
+        """
+        Splits chunks into sentences, drops those the pre-filter rejects and
+        fills in those found in the parse cache. Registers each chunk in
+        pending, then yields (sentence, (chunk_number, position)) for the
+        sentences that still need a parse.
+        """
+        for chunk_number, chunk in enumerate(chunks, start=1):
+            sentences = self.parser.split_sentences(chunk)
+            if self.prefilter:
+                candidates = [sentence for sentence in sentences if self.parser.is_candidate(sentence)]
+                self.sentences_skipped += len(sentences) - len(candidates)
+                self.metrics.increment("Learner", "sentences_skipped", len(sentences) - len(candidates))
+                sentences = candidates
+            state = _ChunkTriplets(sentences, self.sentences_skipped)
+            if self.parse_cache is not None:
+                for position, triplets in enumerate(self._cached(sentences)):
+                    if triplets is not None:
+                        state.fill(position, triplets)
+                self.metrics.increment("Learner", "parse_cache_hits", len(sentences) - state.waiting)
+            pending[chunk_number] = state
+            # A chunk served entirely from the cache yields nothing to parse,
+            # so finish it here; otherwise nlp.pipe would keep pulling chunks
+            # and a warm re-ingest would queue the whole corpus in pending.
+            self._finish_chunks(pending, totals)
+            for position, sentence in enumerate(sentences):
+                if state.triplets[position] is None:
+                    yield sentence, (chunk_number, position)
+
+    def _cached(self, sentences: List[str]) -> List[Optional[List[Tuple[str, str, str]]]]:
+        found = self.parse_cache.get_many(sentences)
+        return [found.get(sentence) for sentence in sentences]
+
+    def _learn_from_doc(self, doc: "Doc", report_every: int = 0) -> Tuple[int, int]:
+        """
+        Learns the facts in every sentence of a parsed document.
+
+        Returns:
+            A (sentences_processed, facts_learned) tuple.
+        """
+        facts: List[Tuple[str, str, str]] = []
+        sentence_count = self._collect_facts(doc, facts, report_every)
+
+        # Instruct the kernel to add the new facts in one batch
+        if facts:
+            self.kernel.add_facts(facts)
+        facts_learned = len(facts)
+        self.metrics.increment("Learner", "sentences", sentence_count)
+        self.metrics.increment("Learner", "facts", facts_learned)
+        return sentence_count, facts_learned
+
+    def _collect_facts(self, doc: "Doc", facts: List[Tuple[str, str, str]], report_every: int = 0) -> int:
+        """Appends the (subject, object, relation) facts of a parsed document. Returns its sentence count."""
+        # Triplets are read straight off the sentence spans of the parse.
+        sentences = list(doc.sents)
+        for i, sentence in enumerate(sentences):
+            if report_every and i % report_every == 0 and i > 0:
+                print(f"  ...processed {i}/{len(sentences)} sentences. Total facts learned: {len(facts)}")
+
+            with self.metrics.timer("TextParser", "extract_triplets"):
+                for subject, relation, obj in self.parser.iter_triplets(sentence):
+                    facts.append((subject, obj, relation))
+        return len(sentences)
+
+    def learn_from_corpus(self, corpus_filepath: str, streaming: bool = False, chunk_chars: int = 100_000):
         """
         Reads a text corpus, processes it, and learns facts.
 
         Args:
             corpus_filepath (str): The path to the text file to learn from.
+            streaming (bool): Read and parse the corpus chunk by chunk (split on
+                article markers or paragraphs) instead of all at once.
+            chunk_chars (int): The soft size limit of a chunk in streaming mode.
         """
         print(f"Starting learning process from corpus: {corpus_filepath}")
+        self.sentences_skipped = 0
         try:
-            with open(corpus_filepath, 'r', encoding='utf-8') as f:
-                text = f.read()
+            with self.metrics.timer("Learner", "learn_from_corpus"):
+                if self.prefilter or self.parse_cache is not None:
+                    chunks = iter_corpus_chunks(corpus_filepath, chunk_chars) if streaming else [self._read(corpus_filepath)]
+                    sentence_count, facts_learned = self._learn_sentences(chunks)
+                elif streaming:
+                    sentence_count, facts_learned = self._learn_streaming(corpus_filepath, chunk_chars)
+                else:
+                    doc = self.nlp(self._read(corpus_filepath), disable=self.parser.unused_pipes())
+                    sentence_count, facts_learned = self._learn_from_doc(doc, report_every=50)
         except FileNotFoundError:
             print(f"Error: Corpus file not found at {corpus_filepath}")
             return
 
-        # Use spaCy to split the entire text into sentences
-        doc = self.nlp(text)
-        sentences = [sent.text for sent in doc.sents]
-        
-        facts_learned = 0
-        for i, sentence in enumerate(sentences):
-            if i % 50 == 0 and i > 0:
-                print(f"  ...processed {i}/{len(sentences)} sentences. Total facts learned: {facts_learned}")
-
-            triplets = self.parser.extract_triplets(sentence)
-            if triplets:
-                for subject, relation, obj in triplets:
-                    # Instruct the kernel to add the new fact
-                    self.kernel.add_fact(subject, obj, relation)
-                    facts_learned += 1
-        
         print("\nLearning process complete.")
-        print(f"Total sentences processed: {len(sentences)}")
+        print(f"Total sentences processed: {sentence_count}")
+        if self.prefilter:
+            print(f"Sentences skipped by the pre-filter: {self.sentences_skipped}")
+        if self.parse_cache is not None:
+            stats = self.parse_cache.stats()
+            print(f"Parse cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate']:.1%} hit rate), {stats['entries']} entries.")
         print(f"Total new facts learned: {facts_learned}")
         # We can query the final size of the memory graph as well
-        final_node_count = self.kernel.memory._graph.number_of_nodes()
-        final_edge_count = self.kernel.memory._graph.number_of_edges()
-        print(f"MemoryCore now contains {final_node_count} nodes and {final_edge_count} relationships.")
\ No newline at end of file
+        final_node_count = self.kernel.memory.number_of_nodes()
+        final_edge_count = self.kernel.memory.number_of_edges()
+        print(f"MemoryCore now contains {final_node_count} nodes and {final_edge_count} relationships.")
+
+    @staticmethod
+    def _read(corpus_filepath: str) -> str:
+        with open(corpus_filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _learn_sentences(self, chunks: Iterable[str]) -> Tuple[int, int]:
+        """
+        Learns chunk by chunk at the sentence level, which the pre-filter and
+        the parse cache need. Sentences to parse are batched across chunks,
+        and each chunk's facts are added as one batch, in corpus order, once
+        all of its sentences are known. Returns (sentences, facts_learned),
+        where the sentence count includes skipped ones.
+        """
+        pending: "OrderedDict[int, _ChunkTriplets]" = OrderedDict()
+        totals = [0, 0]
+        docs = self._parse(self._sentences_to_parse(chunks, pending, totals), as_tuples=True)
+        for doc, (chunk_number, position) in docs:
+            state = pending[chunk_number]
+            with self.metrics.timer("TextParser", "extract_triplets"):
+                triplets = [triplet for sentence in doc.sents for triplet in self.parser.iter_triplets(sentence)]
+            state.fill(position, triplets)
+            if self.parse_cache is not None:
+                self.parse_cache.put(state.sentences[position], triplets)
+            self._finish_chunks(pending, totals)
+        self._finish_chunks(pending, totals)
+        if self.parse_cache is not None:
+            self.parse_cache.flush()
+        return totals[0] + self.sentences_skipped, totals[1]
+
+    def _finish_chunks(self, pending: "OrderedDict[int, _ChunkTriplets]", totals: List[int]):
+        """Adds the facts of every leading chunk whose sentences are all known."""
+        while pending:
+            chunk_number, state = next(iter(pending.items()))
+            if state.waiting:
+                return
+            del pending[chunk_number]
+            facts = [(subject, obj, relation)
+                     for triplets in state.triplets for subject, relation, obj in triplets]
+            if facts:
+                self.kernel.add_facts(facts)
+            totals[0] += len(state.sentences)
+            totals[1] += len(facts)
+            self.metrics.increment("Learner", "sentences", len(state.sentences))
+            self.metrics.increment("Learner", "facts", len(facts))
+            progress = (f"  ...chunk {chunk_number}: {len(state.sentences)} sentences, {len(facts)} facts. "
+                        f"Total: {totals[1]} facts learned")
+            if self.prefilter:
+                progress += f", {state.skipped_so_far} sentences skipped"
+            if self.parse_cache is not None:
+                progress += f", parse cache hit rate {self.parse_cache.hit_rate:.1%}"
+            print(progress + ".")
+
+    def _learn_streaming(self, corpus_filepath: str, chunk_chars: int) -> Tuple[int, int]:
+        """Learns from a corpus one chunk at a time, reporting progress per chunk."""
+        total_sentences = 0
+        total_facts = 0
+        chunks = iter_corpus_chunks(corpus_filepath, chunk_chars)
+        for chunk_number, doc in enumerate(self._parse(chunks), start=1):
+            sentences, facts = self._learn_from_doc(doc)
+            total_sentences += sentences
+            total_facts += facts
+            print(f"  ...chunk {chunk_number}: {sentences} sentences, {facts} facts. "
+                  f"Total: {total_sentences} sentences, {total_facts} facts learned.")
+        return total_sentences, total_facts
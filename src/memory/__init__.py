@@ -0,0 +1,30 @@
+# src/memory/__init__.py
+
+from memory.core import MemoryCore
+from memory.compact import CompactMemoryCore
+from memory.snapshot import MemorySnapshot
+from memory.query import LabelStats, TripleQuery, query
+from memory.store import MappedMemoryCore, open_snapshot, save_snapshot
+
+# Storage backends selectable at ArchanonKernel construction.
+MEMORY_BACKENDS = {
+    "networkx": MemoryCore,
+    "compact": CompactMemoryCore,
+}
+
+def create_memory(backend: str = "networkx"):
+    """
+    Creates an empty memory store for the named backend.
+
+    Args:
+        backend (str): One of the keys of MEMORY_BACKENDS.
+
+    Returns:
+        A MemoryCore-compatible instance.
+    """
+    try:
+        return MEMORY_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown memory backend '{backend}'. Choose from: {', '.join(MEMORY_BACKENDS)}"
+        ) from None
@@ -0,0 +1,526 @@
+# src/memory/compact.py
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from memory.snapshot import MemorySnapshot
+from memory.query import LabelStats
+from typing import Callable, Iterable, List, Dict, Any, Optional, Iterator, Tuple
+
+class CompactMemoryCore:
+    """
+    CompactMemoryCore v0.3: The Interned Graph.
+
+    A drop-in alternative to MemoryCore for large knowledge graphs. Node names
+    and relationship labels are interned to integer IDs, and edges live in
+    array-backed CSR (compressed sparse row) blocks instead of Python dicts.
+
+    - Compacted edges cost 16 bytes each (8 for the forward block, 8 for the
+      reverse block) instead of a dict per edge.
+    - New edges go to a small dict-based delta that is merged into the CSR
+      blocks once it grows past a fraction of the compacted size.
+
+    The public API matches MemoryCore. Query results are returned in node ID
+    order, which is the order in which nodes were first seen.
+
+    v0.2: Delta edges are stamped with a version number and compaction
+    builds new blocks instead of changing the old ones, so snapshot() can
+    hand out O(1), read-only views (see memory.snapshot.MemorySnapshot).
+    A view keeps the blocks it was taken from alive until it is dropped.
+
+    v0.3: Per-label counts of edges, distinct sources and distinct targets
+    (see label_stats()). They are counted from the CSR blocks on first use,
+    so opening a large snapshot stays cheap, and kept up to date afterwards.
+    """
+
+    def __init__(self, compact_threshold: int = 4096):
+        """
+        Initializes an empty compact graph.
+
+        Args:
+            compact_threshold (int): Minimum number of delta edges before they
+                are merged into the CSR blocks.
+        """
+        self._node_ids: Dict[str, int] = {}
+        self._node_names: List[str] = []
+        self._label_ids: Dict[str, int] = {}
+        self._label_names: List[str] = []
+        self._attrs: Dict[int, Dict[str, Any]] = {}
+
+        # Forward CSR block: edges of node n are at [offsets[n], offsets[n+1]),
+        # sorted by (label, target). The reverse block mirrors it for sources.
+        self._out_offsets = array("q", [0])
+        self._out_labels = array("i")
+        self._out_targets = array("i")
+        self._in_offsets = array("q", [0])
+        self._in_labels = array("i")
+        self._in_sources = array("i")
+
+        # Uncompacted edges: node -> label -> neighbour -> version, in version order.
+        self._out_delta: Dict[int, Dict[int, Dict[int, int]]] = {}
+        self._in_delta: Dict[int, Dict[int, Dict[int, int]]] = {}
+        self._delta_size = 0
+        self._version = 0
+        self._compact_threshold = compact_threshold
+        # label ID -> [edges, distinct sources, distinct targets], once counted.
+        self._label_counts: Optional[Dict[int, List[int]]] = None
+        self._listeners: List[Callable[[str, str, str], None]] = []
+        print("CompactMemoryCore v0.3 initialized.")
+
+    # --- Interning -------------------------------------------------------
+
+    def _intern_node(self, node_id: str) -> int:
+        nid = self._node_ids.get(node_id)
+        if nid is None:
+            nid = len(self._node_names)
+            self._node_ids[node_id] = nid
+            self._node_names.append(node_id)
+        return nid
+
+    def _intern_label(self, label: str) -> int:
+        lid = self._label_ids.get(label)
+        if lid is None:
+            lid = len(self._label_names)
+            self._label_ids[label] = lid
+            self._label_names.append(label)
+        return lid
+
+    # --- CSR helpers -----------------------------------------------------
+
+    @staticmethod
+    def _block_range(offsets: array, labels: array, nid: int, lid: int) -> Tuple[int, int]:
+        """Returns the [lo, hi) slice of a CSR block holding (nid, lid) edges."""
+        if nid >= len(offsets) - 1:
+            return 0, 0
+        start, end = offsets[nid], offsets[nid + 1]
+        lo = bisect_left(labels, lid, start, end)
+        hi = bisect_right(labels, lid, lo, end)
+        return lo, hi
+
+    def _has_edge_ids(self, sid: int, tid: int, lid: int) -> bool:
+        lo, hi = self._block_range(self._out_offsets, self._out_labels, sid, lid)
+        pos = bisect_left(self._out_targets, tid, lo, hi)
+        if pos < hi and self._out_targets[pos] == tid:
+            return True
+        return tid in self._out_delta.get(sid, {}).get(lid, ())
+
+    def _has_neighbours(self, nid: int, lid: int, reverse: bool = False) -> bool:
+        if reverse:
+            offsets, labels, delta = self._in_offsets, self._in_labels, self._in_delta
+        else:
+            offsets, labels, delta = self._out_offsets, self._out_labels, self._out_delta
+        lo, hi = self._block_range(offsets, labels, nid, lid)
+        return hi > lo or lid in delta.get(nid, ())
+
+    def _neighbours(self, nid: int, lid: int, reverse: bool = False) -> Iterator[int]:
+        if reverse:
+            offsets, labels, others, delta = self._in_offsets, self._in_labels, self._in_sources, self._in_delta
+        else:
+            offsets, labels, others, delta = self._out_offsets, self._out_labels, self._out_targets, self._out_delta
+        lo, hi = self._block_range(offsets, labels, nid, lid)
+        for i in range(lo, hi):
+            yield others[i]
+        yield from delta.get(nid, {}).get(lid, ())
+
+    def _successors(self, nid: int) -> Iterator[int]:
+        """Yields the targets of every out-edge of a node, whatever its label."""
+        if nid < len(self._out_offsets) - 1:
+            for i in range(self._out_offsets[nid], self._out_offsets[nid + 1]):
+                yield self._out_targets[i]
+        for targets in self._out_delta.get(nid, {}).values():
+            yield from targets
+
+    @staticmethod
+    def _merge_block(offsets: array, labels: array, others: array,
+                     delta: Dict[int, Dict[int, Dict[int, int]]], node_count: int):
+        """Merges a delta into one CSR block, producing new sorted arrays."""
+        new_offsets = array("q", [0])
+        new_labels = array("i")
+        new_others = array("i")
+        base_nodes = len(offsets) - 1
+        for nid in range(node_count):
+            node_delta = delta.get(nid)
+            if nid < base_nodes:
+                start, end = offsets[nid], offsets[nid + 1]
+            else:
+                start = end = 0
+            if not node_delta:
+                new_labels.extend(labels[start:end])
+                new_others.extend(others[start:end])
+            else:
+                merged = [(labels[i], others[i]) for i in range(start, end)]
+                for lid, neighbours in node_delta.items():
+                    merged.extend((lid, other) for other in neighbours)
+                merged.sort()
+                for lid, other in merged:
+                    new_labels.append(lid)
+                    new_others.append(other)
+            new_offsets.append(len(new_others))
+        return new_offsets, new_labels, new_others
+
+    def compact(self):
+        """Merges all pending delta edges into the CSR blocks."""
+        if not self._delta_size:
+            return
+        node_count = len(self._node_names)
+        self._out_offsets, self._out_labels, self._out_targets = self._merge_block(
+            self._out_offsets, self._out_labels, self._out_targets, self._out_delta, node_count)
+        self._in_offsets, self._in_labels, self._in_sources = self._merge_block(
+            self._in_offsets, self._in_labels, self._in_sources, self._in_delta, node_count)
+        self._out_delta = {}
+        self._in_delta = {}
+        self._delta_size = 0
+
+    # --- Public API (mirrors MemoryCore) ---------------------------------
+
+    def add_node(self, node_id: str, attributes: Optional[Dict[str, Any]] = None):
+        """
+        Adds a concept node to the memory graph.
+        If the node already exists, it updates its attributes.
+
+        Args:
+            node_id (str): The unique identifier for the concept.
+            attributes (dict, optional): A dictionary of properties for the node.
+        """
+        nid = self._intern_node(node_id)
+        if attributes:
+            self._attrs.setdefault(nid, {}).update(attributes)
+
+    def add_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        """
+        Adds a directed, labeled relationship between two nodes.
+        If the nodes do not exist, they are created automatically.
+
+        Args:
+            source_id (str): The starting node of the relationship.
+            target_id (str): The ending node of the relationship.
+            label (str): The type of relationship (e.g., "is_a", "causes").
+
+        Returns:
+            True if the relationship was new, False if it was already stored.
+        """
+        sid = self._intern_node(source_id)
+        tid = self._intern_node(target_id)
+        lid = self._intern_label(label)
+        if self._has_edge_ids(sid, tid, lid):
+            return False
+        if self._label_counts is not None:
+            counts = self._label_counts.setdefault(lid, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += not self._has_neighbours(sid, lid)
+            counts[2] += not self._has_neighbours(tid, lid, reverse=True)
+        self._version += 1
+        self._out_delta.setdefault(sid, {}).setdefault(lid, {})[tid] = self._version
+        self._in_delta.setdefault(tid, {}).setdefault(lid, {})[sid] = self._version
+        self._delta_size += 1
+        if self._delta_size >= max(self._compact_threshold, len(self._out_targets) // 4):
+            self.compact()
+
+        for listener in self._listeners:
+            listener(source_id, target_id, label)
+        return True
+
+    def add_relationships(self, relationships: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Adds many relationships at once. Duplicates, within the batch or
+        already in memory, are skipped.
+
+        Args:
+            relationships (iterable): (source_id, target_id, label) tuples.
+
+        Returns:
+            The number of relationships that were new.
+        """
+        added = 0
+        for source_id, target_id, label in dict.fromkeys(relationships):
+            if self.add_relationship(source_id, target_id, label):
+                added += 1
+        return added
+
+    def add_listener(self, listener: Callable[[str, str, str], None]):
+        """
+        Registers a callback invoked as listener(source_id, target_id, label)
+        each time a new relationship is stored. Duplicates do not notify.
+        """
+        self._listeners.append(listener)
+
+    def query_relationships(self, source_id: str, label: str) -> List[str]:
+        """
+        Finds all nodes connected from a source node by a specific relationship label.
+
+        Args:
+            source_id (str): The node to start the query from.
+            label (str): The relationship label to filter by.
+
+        Returns:
+            A list of target node IDs.
+        """
+        sid = self._node_ids.get(source_id)
+        lid = self._label_ids.get(label)
+        if sid is None or lid is None:
+            return []
+        names = self._node_names
+        return [names[tid] for tid in self._neighbours(sid, lid)]
+
+    def query_sources(self, target_id: str, label: str) -> List[str]:
+        """
+        Finds all nodes that point at a target node with a specific relationship label.
+
+        Args:
+            target_id (str): The node the relationships point at.
+            label (str): The relationship label to filter by.
+
+        Returns:
+            A list of source node IDs.
+        """
+        tid = self._node_ids.get(target_id)
+        lid = self._label_ids.get(label)
+        if tid is None or lid is None:
+            return []
+        names = self._node_names
+        return [names[sid] for sid in self._neighbours(tid, lid, reverse=True)]
+
+    def has_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        """Checks whether a specific labeled relationship exists."""
+        sid = self._node_ids.get(source_id)
+        tid = self._node_ids.get(target_id)
+        lid = self._label_ids.get(label)
+        if sid is None or tid is None or lid is None:
+            return False
+        return self._has_edge_ids(sid, tid, lid)
+
+    def iter_edges(self, label: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """
+        Iterates over stored relationships as (source_id, target_id, label).
+
+        Args:
+            label (str, optional): Only yield relationships with this label.
+        """
+        wanted = None
+        if label is not None:
+            wanted = self._label_ids.get(label)
+            if wanted is None:
+                return
+        names, labels = self._node_names, self._label_names
+        offsets = self._out_offsets
+        for sid in range(len(offsets) - 1):
+            for i in range(offsets[sid], offsets[sid + 1]):
+                lid = self._out_labels[i]
+                if wanted is None or lid == wanted:
+                    yield names[sid], names[self._out_targets[i]], labels[lid]
+        for sid, by_label in self._out_delta.items():
+            for lid, targets in by_label.items():
+                if wanted is None or lid == wanted:
+                    for tid in targets:
+                        yield names[sid], names[tid], labels[lid]
+
+    def iter_nodes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterates over stored concepts as (node_id, attributes)."""
+        for nid in range(len(self._node_names)):
+            yield self._node_names[nid], self._attrs.get(nid, {})
+
+    def _count_labels(self) -> Dict[int, List[int]]:
+        """Counts edges and distinct endpoints per label, from the CSR blocks and the delta."""
+        counts: Dict[int, List[int]] = {}
+        for column, offsets, labels, delta in ((1, self._out_offsets, self._out_labels, self._out_delta),
+                                               (2, self._in_offsets, self._in_labels, self._in_delta)):
+            for nid in range(len(offsets) - 1):
+                previous = -1
+                for i in range(offsets[nid], offsets[nid + 1]):
+                    lid = labels[i]
+                    entry = counts.get(lid)
+                    if entry is None:
+                        entry = counts[lid] = [0, 0, 0]
+                    if column == 1:
+                        entry[0] += 1
+                    if lid != previous:
+                        entry[column] += 1
+                        previous = lid
+            for nid, by_label in delta.items():
+                for lid, others in by_label.items():
+                    entry = counts.setdefault(lid, [0, 0, 0])
+                    if column == 1:
+                        entry[0] += len(others)
+                    lo, hi = self._block_range(offsets, labels, nid, lid)
+                    if hi == lo:
+                        entry[column] += 1
+        return counts
+
+    def label_stats(self) -> Dict[str, LabelStats]:
+        """
+        Returns, for each relationship label, the number of edges and of
+        distinct source and target nodes.
+
+        Example: label_stats()["is_a"] -> LabelStats(edges=2, sources=2, targets=2)
+        """
+        if self._label_counts is None:
+            self._label_counts = self._count_labels()
+        names = self._label_names
+        return {names[lid]: LabelStats(*counts) for lid, counts in self._label_counts.items()}
+
+    def snapshot(self) -> MemorySnapshot:
+        """
+        Returns a read-only view of memory as it is now. The view costs O(1)
+        to create and is unaffected by facts added afterwards.
+        """
+        blocks = (
+            self._out_offsets, self._out_labels, self._out_targets, self._out_delta,
+            self._in_offsets, self._in_labels, self._in_sources, self._in_delta,
+        )
+        return MemorySnapshot(self, self._version, len(self._node_names), self.number_of_edges(), blocks)
+
+    # --- Versioned reads (used by MemorySnapshot) ------------------------
+    # A view reads the CSR blocks and delta dicts that were current when it
+    # was taken. Compaction replaces them rather than changing them, and
+    # delta entries newer than the view are skipped.
+
+    @staticmethod
+    def _visible(entries: Optional[Dict[int, int]], version: int) -> List[int]:
+        found = []
+        for nid, added in list(entries.items()) if entries else ():
+            if added > version:
+                break
+            found.append(nid)
+        return found
+
+    def _neighbours_at(self, view: MemorySnapshot, nid: int, lid: int, reverse: bool = False) -> List[int]:
+        offsets, labels, others, delta = view.blocks[4:] if reverse else view.blocks[:4]
+        lo, hi = self._block_range(offsets, labels, nid, lid)
+        found = list(others[lo:hi])
+        found.extend(self._visible(delta.get(nid, {}).get(lid), view.version))
+        return found
+
+    def _ids_at(self, view: MemorySnapshot, *node_ids: str) -> Optional[List[int]]:
+        """Interns node names, or returns None if one did not exist at the view."""
+        nids = [self._node_ids.get(node_id) for node_id in node_ids]
+        if any(nid is None or nid >= view.node_count for nid in nids):
+            return None
+        return nids
+
+    def _targets_at(self, view: MemorySnapshot, source_id: str, label: str) -> List[str]:
+        nids = self._ids_at(view, source_id)
+        lid = self._label_ids.get(label)
+        if nids is None or lid is None:
+            return []
+        names = self._node_names
+        return [names[tid] for tid in self._neighbours_at(view, nids[0], lid)]
+
+    def _sources_at(self, view: MemorySnapshot, target_id: str, label: str) -> List[str]:
+        nids = self._ids_at(view, target_id)
+        lid = self._label_ids.get(label)
+        if nids is None or lid is None:
+            return []
+        names = self._node_names
+        return [names[sid] for sid in self._neighbours_at(view, nids[0], lid, reverse=True)]
+
+    def _has_relationship_at(self, view: MemorySnapshot, source_id: str, target_id: str, label: str) -> bool:
+        nids = self._ids_at(view, source_id, target_id)
+        lid = self._label_ids.get(label)
+        if nids is None or lid is None:
+            return False
+        sid, tid = nids
+        offsets, labels, targets, delta = view.blocks[:4]
+        lo, hi = self._block_range(offsets, labels, sid, lid)
+        pos = bisect_left(targets, tid, lo, hi)
+        if pos < hi and targets[pos] == tid:
+            return True
+        added = delta.get(sid, {}).get(lid, {}).get(tid)
+        return added is not None and added <= view.version
+
+    def _edges_at(self, view: MemorySnapshot, label: Optional[str]) -> Iterator[Tuple[str, str, str]]:
+        wanted = None
+        if label is not None:
+            wanted = self._label_ids.get(label)
+            if wanted is None:
+                return
+        names, label_names = self._node_names, self._label_names
+        offsets, labels, targets, delta = view.blocks[:4]
+        for sid in range(len(offsets) - 1):
+            for i in range(offsets[sid], offsets[sid + 1]):
+                lid = labels[i]
+                if wanted is None or lid == wanted:
+                    yield names[sid], names[targets[i]], label_names[lid]
+        for sid, by_label in list(delta.items()):
+            for lid, tids in list(by_label.items()):
+                if wanted is None or lid == wanted:
+                    for tid in self._visible(tids, view.version):
+                        yield names[sid], names[tid], label_names[lid]
+
+    def _has_node_at(self, view: MemorySnapshot, node_id: str) -> bool:
+        return self._ids_at(view, node_id) is not None
+
+    def _nodes_at(self, view: MemorySnapshot) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for nid in range(view.node_count):
+            yield self._node_names[nid], self._attrs.get(nid, {})
+
+    def _successors_at(self, view: MemorySnapshot, node_id: str) -> Iterator[str]:
+        nids = self._ids_at(view, node_id)
+        if nids is None:
+            return
+        nid = nids[0]
+        offsets, _, targets, delta = view.blocks[:4]
+        if nid < len(offsets) - 1:
+            for i in range(offsets[nid], offsets[nid + 1]):
+                yield self._node_names[targets[i]]
+        for tids in list(delta.get(nid, {}).values()):
+            for tid in self._visible(tids, view.version):
+                yield self._node_names[tid]
+
+    def save_snapshot(self, path: str):
+        """Writes the whole memory to a binary snapshot file (see memory.store)."""
+        from memory.store import save_snapshot
+        save_snapshot(self, path)
+
+    def find_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
+        """
+        Finds the shortest path of concepts connecting a source to a target,
+        following relationships of any label.
+
+        Args:
+            source_id (str): The starting node.
+            target_id (str): The ending node.
+
+        Returns:
+            A list of node IDs representing the path, or None if no path exists.
+        """
+        sid = self._node_ids.get(source_id)
+        tid = self._node_ids.get(target_id)
+        if sid is None or tid is None:
+            return None
+
+        parents = {sid: -1}
+        queue = deque([sid])
+        while queue and tid not in parents:
+            current = queue.popleft()
+            for nxt in self._successors(current):
+                if nxt not in parents:
+                    parents[nxt] = current
+                    queue.append(nxt)
+
+        if tid not in parents:
+            return None
+        path = []
+        node = tid
+        while node != -1:
+            path.append(self._node_names[node])
+            node = parents[node]
+        return path[::-1]
+
+    def get_node_attributes(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves the attributes of a specific node."""
+        nid = self._node_ids.get(node_id)
+        if nid is None:
+            return None
+        return self._attrs.setdefault(nid, {})
+
+    def has_node(self, node_id: str) -> bool:
+        """Checks whether a concept exists in memory."""
+        return node_id in self._node_ids
+
+    def number_of_nodes(self) -> int:
+        """Returns the number of concepts in memory."""
+        return len(self._node_names)
+
+    def number_of_edges(self) -> int:
+        """Returns the number of labeled relationships in memory."""
+        return len(self._out_targets) + self._delta_size
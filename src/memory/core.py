@@ -1,23 +1,55 @@
 # src/memory/core.py
 
-import networkx as nx
-from typing import List, Tuple, Dict, Any, Optional
+from memory.snapshot import MemorySnapshot
+from memory.query import LabelStats
+from typing import Callable, Iterable, Iterator, List, Tuple, Dict, Any, Optional
 
 class MemoryCore:
     """
-    MemoryCore v0.1: The Explicit Graph.
+    MemoryCore v0.5: The Explicit Graph.
 
     This class manages the foundational knowledge graph of ARCHANON.
     It stores concepts as nodes and explicit relationships as directed, labeled edges.
     
     - Nodes represent concepts (e.g., "Socrates", "human").
     - Edges represent relationships (e.g., "is_a", "has_property").
+
+    v0.2: Relationships are also kept in a label-partitioned index keyed by
+    (source, label) and (label, target), so label queries cost only the size
+    of their result and one pair of nodes can carry several labels.
+
+    v0.3: Every new node and relationship is stamped with a version number,
+    so snapshot() can hand out O(1), read-only views of the graph as it was
+    (see memory.snapshot.MemorySnapshot).
+
+    v0.4: Nodes and their attributes live in a plain dict. The networkx
+    graph is only needed for find_path(), so it (and networkx itself) is
+    loaded on first use and kept up to date from then on.
+
+    v0.5: Per-label counts of edges, distinct sources and distinct targets
+    are kept up to date on every insert (see label_stats()), for the
+    triple-pattern query planner in memory.query.
     """
 
     def __init__(self):
         """Initializes the MemoryCore with an empty directed graph."""
-        self._graph = nx.DiGraph()
-        print("MemoryCore v0.1 initialized.")
+        # node -> attributes, in the order nodes were first seen.
+        self._node_attrs: Dict[str, Dict[str, Any]] = {}
+        self._nx_graph = None
+        # (source, label) -> targets and (label, target) -> sources, each
+        # mapped to the version that added the edge. Dicts keep insertion
+        # order, so every adjacency dict is in version order.
+        self._out_index: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._in_index: Dict[Tuple[str, str], Dict[str, int]] = {}
+        # source -> the labels of its outgoing edges, for snapshot path searches.
+        self._out_labels: Dict[str, List[str]] = {}
+        self._node_versions: Dict[str, int] = {}
+        self._version = 0
+        self._edge_count = 0
+        # label -> [edges, distinct sources, distinct targets]
+        self._label_counts: Dict[str, List[int]] = {}
+        self._listeners: List[Callable[[str, str, str], None]] = []
+        print("MemoryCore v0.5 initialized.")
 
     def add_node(self, node_id: str, attributes: Optional[Dict[str, Any]] = None):
         """
@@ -28,21 +60,115 @@ class MemoryCore:
             node_id (str): The unique identifier for the concept.
             attributes (dict, optional): A dictionary of properties for the node.
         """
-        if attributes is None:
-            attributes = {}
-        self._graph.add_node(node_id, **attributes)
+        self._stamp_node(node_id)
+        if attributes:
+            self._node_attrs[node_id].update(attributes)
+            if self._nx_graph is not None:
+                self._nx_graph.add_node(node_id, **attributes)
 
-    def add_relationship(self, source_id: str, target_id: str, label: str):
+    def _stamp_node(self, node_id: str):
+        """Creates a node if it is new, recording the version at which it appears."""
+        if node_id not in self._node_versions:
+            self._version += 1
+            self._node_versions[node_id] = self._version
+            self._node_attrs[node_id] = {}
+            if self._nx_graph is not None:
+                self._nx_graph.add_node(node_id)
+
+    @property
+    def _graph(self):
+        """The networkx view of memory, built on first use."""
+        if self._nx_graph is None:
+            import networkx as nx
+            graph = nx.DiGraph()
+            view = self.snapshot()
+            for node_id, attributes in self._nodes_at(view):
+                graph.add_node(node_id, **attributes)
+            for source_id, target_id, label in self._edges_at(view, None):
+                self._add_graph_edge(graph, source_id, target_id, label)
+            self._nx_graph = graph
+            # A writer that ran during the build saw no graph and skipped it;
+            # its index entries are newer than the view, so replay them.
+            for node_id, added in list(self._node_versions.items()):
+                if added > view.version:
+                    graph.add_node(node_id, **self._node_attrs[node_id])
+            for (source_id, label), targets in list(self._out_index.items()):
+                for target_id, added in list(targets.items()):
+                    if added > view.version:
+                        self._add_graph_edge(graph, source_id, target_id, label)
+        return self._nx_graph
+
+    @staticmethod
+    def _add_graph_edge(graph, source_id: str, target_id: str, label: str):
+        if graph.has_edge(source_id, target_id):
+            edge = graph.edges[source_id, target_id]
+            edge["labels"].add(label)
+            edge["label"] = label
+        else:
+            graph.add_edge(source_id, target_id, label=label, labels={label})
+
+    def add_relationship(self, source_id: str, target_id: str, label: str) -> bool:
         """
         Adds a directed, labeled relationship between two nodes.
         If the nodes do not exist, they are created automatically.
+        A pair of nodes may hold several relationships with different labels.
 
         Args:
             source_id (str): The starting node of the relationship.
             target_id (str): The ending node of the relationship.
             label (str): The type of relationship (e.g., "is_a", "causes").
+
+        Returns:
+            True if the relationship was new, False if it was already stored.
+        """
+        targets = self._out_index.setdefault((source_id, label), {})
+        if target_id in targets:
+            return False
+        self._stamp_node(source_id)
+        self._stamp_node(target_id)
+        self._version += 1
+        sources = self._in_index.setdefault((label, target_id), {})
+        counts = self._label_counts.get(label)
+        if counts is None:
+            counts = self._label_counts[label] = [0, 0, 0]
+        counts[0] += 1
+        counts[1] += not targets
+        counts[2] += not sources
+        if not targets:
+            self._out_labels.setdefault(source_id, []).append(label)
+        targets[target_id] = self._version
+        sources[source_id] = self._version
+        self._edge_count += 1
+        if self._nx_graph is not None:
+            self._add_graph_edge(self._nx_graph, source_id, target_id, label)
+
+        for listener in self._listeners:
+            listener(source_id, target_id, label)
+        return True
+
+    def add_relationships(self, relationships: Iterable[Tuple[str, str, str]]) -> int:
         """
-        self._graph.add_edge(source_id, target_id, label=label)
+        Adds many relationships at once. Duplicates, within the batch or
+        already in memory, are skipped.
+
+        Args:
+            relationships (iterable): (source_id, target_id, label) tuples.
+
+        Returns:
+            The number of relationships that were new.
+        """
+        added = 0
+        for source_id, target_id, label in dict.fromkeys(relationships):
+            if self.add_relationship(source_id, target_id, label):
+                added += 1
+        return added
+
+    def add_listener(self, listener: Callable[[str, str, str], None]):
+        """
+        Registers a callback invoked as listener(source_id, target_id, label)
+        each time a new relationship is stored. Duplicates do not notify.
+        """
+        self._listeners.append(listener)
 
     def query_relationships(self, source_id: str, label: str) -> List[str]:
         """
@@ -57,14 +183,114 @@ class MemoryCore:
         Returns:
             A list of target node IDs.
         """
-        if not self._graph.has_node(source_id):
-            return []
-        
-        targets = []
-        for _, target, data in self._graph.out_edges(source_id, data=True):
-            if data.get("label") == label:
-                targets.append(target)
-        return targets
+        return list(self._out_index.get((source_id, label), ()))
+
+    def query_sources(self, target_id: str, label: str) -> List[str]:
+        """
+        Finds all nodes that point at a target node with a specific relationship label.
+        This is the reverse of query_relationships.
+
+        Example: query_sources("human", "is_a") -> ["Socrates"]
+
+        Args:
+            target_id (str): The node the relationships point at.
+            label (str): The relationship label to filter by.
+
+        Returns:
+            A list of source node IDs.
+        """
+        return list(self._in_index.get((label, target_id), ()))
+
+    def has_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        """Checks whether a specific labeled relationship exists."""
+        return target_id in self._out_index.get((source_id, label), ())
+
+    def iter_edges(self, label: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """
+        Iterates over stored relationships as (source_id, target_id, label).
+
+        Args:
+            label (str, optional): Only yield relationships with this label.
+        """
+        for (source_id, edge_label), targets in self._out_index.items():
+            if label is None or edge_label == label:
+                for target_id in targets:
+                    yield source_id, target_id, edge_label
+
+    def iter_nodes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterates over stored concepts as (node_id, attributes)."""
+        yield from self._node_attrs.items()
+
+    def label_stats(self) -> Dict[str, LabelStats]:
+        """
+        Returns, for each relationship label, the number of edges and of
+        distinct source and target nodes.
+
+        Example: label_stats()["is_a"] -> LabelStats(edges=2, sources=2, targets=2)
+        """
+        return {label: LabelStats(*counts) for label, counts in self._label_counts.items()}
+
+    def snapshot(self) -> MemorySnapshot:
+        """
+        Returns a read-only view of memory as it is now. The view costs O(1)
+        to create and is unaffected by facts added afterwards.
+
+        Example:
+            view = memory.snapshot()
+            memory.add_relationship("Plato", "human", "is_a")
+            view.has_node("Plato") -> False
+        """
+        return MemorySnapshot(self, self._version, len(self._node_versions), self._edge_count)
+
+    # --- Versioned reads (used by MemorySnapshot) ------------------------
+    # Adjacency dicts are copied with list() before being scanned: it runs
+    # without releasing the GIL, so a concurrent writer cannot interfere.
+
+    @staticmethod
+    def _visible(entries: Optional[Dict[str, int]], version: int) -> List[str]:
+        found = []
+        for node_id, added in list(entries.items()) if entries else ():
+            if added > version:
+                break
+            found.append(node_id)
+        return found
+
+    def _targets_at(self, view: MemorySnapshot, source_id: str, label: str) -> List[str]:
+        return self._visible(self._out_index.get((source_id, label)), view.version)
+
+    def _sources_at(self, view: MemorySnapshot, target_id: str, label: str) -> List[str]:
+        return self._visible(self._in_index.get((label, target_id)), view.version)
+
+    def _has_relationship_at(self, view: MemorySnapshot, source_id: str, target_id: str, label: str) -> bool:
+        added = self._out_index.get((source_id, label), {}).get(target_id)
+        return added is not None and added <= view.version
+
+    def _edges_at(self, view: MemorySnapshot, label: Optional[str]) -> Iterator[Tuple[str, str, str]]:
+        for (source_id, edge_label), targets in list(self._out_index.items()):
+            if label is None or edge_label == label:
+                for target_id in self._visible(targets, view.version):
+                    yield source_id, target_id, edge_label
+
+    def _has_node_at(self, view: MemorySnapshot, node_id: str) -> bool:
+        added = self._node_versions.get(node_id)
+        return added is not None and added <= view.version
+
+    def _nodes_at(self, view: MemorySnapshot) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for node_id, added in list(self._node_versions.items()):
+            if added > view.version:
+                break
+            yield node_id, self._node_attrs[node_id]
+
+    def _successors_at(self, view: MemorySnapshot, node_id: str) -> Iterator[str]:
+        # Read the versioned index, never the networkx graph: building that
+        # from a reader thread would race with writers.
+        for label in list(self._out_labels.get(node_id, ())):
+            yield from self._visible(self._out_index.get((node_id, label)), view.version)
+
+    def save_snapshot(self, path: str):
+        """Writes the whole memory to a binary snapshot file (see memory.store)."""
+        from memory.store import save_snapshot
+        save_snapshot(self, path)
 
     def find_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
         """
@@ -78,6 +304,7 @@ class MemoryCore:
         Returns:
             A list of node IDs representing the path, or None if no path exists.
         """
+        import networkx as nx
         try:
             path = nx.shortest_path(self._graph, source=source_id, target=target_id)
             return path
@@ -86,6 +313,16 @@ class MemoryCore:
 
     def get_node_attributes(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Retrieves the attributes of a specific node."""
-        if self._graph.has_node(node_id):
-            return self._graph.nodes[node_id]
-        return None
\ No newline at end of file
+        return self._node_attrs.get(node_id)
+
+    def has_node(self, node_id: str) -> bool:
+        """Checks whether a concept exists in memory."""
+        return node_id in self._node_attrs
+
+    def number_of_nodes(self) -> int:
+        """Returns the number of concepts in memory."""
+        return len(self._node_attrs)
+
+    def number_of_edges(self) -> int:
+        """Returns the number of labeled relationships in memory."""
+        return self._edge_count
@@ -0,0 +1,204 @@
+# src/memory/query.py
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# A triple pattern reads (source, label, target), e.g. ("?x", "is_a", "country").
+# Terms starting with "?" are variables; the label must be a constant.
+Pattern = Tuple[str, str, str]
+
+class LabelStats(NamedTuple):
+    """Cardinality statistics of one relationship label, kept by every memory backend."""
+    edges: int
+    sources: int
+    targets: int
+
+def is_variable(term: str) -> bool:
+    return term.startswith("?")
+
+class _Step(NamedTuple):
+    """One pattern of a plan, with how it is evaluated and its estimated output per input row."""
+    pattern: Pattern
+    mode: str
+    estimate: float
+
+class TripleQuery:
+    """
+    TripleQuery v0.1: Conjunctive Pattern Matching.
+
+    Answers a conjunction of triple patterns over any MemoryCore-compatible
+    memory, e.g. "which ?x is_a country and has_property large":
+
+        TripleQuery([("?x", "is_a", "country"), ("?x", "has_property", "large")])
+
+    The planner orders the patterns greedily. It starts with the most
+    selective pattern and then always takes the pattern that is cheapest
+    given the variables bound so far. Costs come from the backend's
+    per-label statistics (see label_stats()), or from an exact index lookup
+    when a pattern names a constant node. Each pattern is then evaluated as
+    an index nested-loop join:
+    - "check": both ends are bound, one has_relationship() call per row,
+    - "forward": the source is bound, query_relationships() per row,
+    - "backward": the target is bound, query_sources() per row,
+    - "scan": neither end is bound, iter_edges(label).
+    Rows are produced lazily, one binding at a time.
+    """
+
+    def __init__(self, patterns: Sequence[Pattern], select: Optional[Sequence[str]] = None):
+        """
+        Args:
+            patterns (sequence): (source, label, target) triple patterns.
+            select (sequence, optional): Variables to return, e.g. ["?x"].
+                Rows are then made distinct. By default every variable is returned.
+
+        Raises:
+            ValueError: If there are no patterns, a label is a variable, or a
+                selected variable does not occur in any pattern.
+        """
+        if not patterns:
+            raise ValueError("A query needs at least one triple pattern.")
+        self.patterns: List[Pattern] = [tuple(pattern) for pattern in patterns]
+        variables: Dict[str, None] = {}
+        for source, label, target in self.patterns:
+            if is_variable(label):
+                raise ValueError(f"Pattern labels must be constants, got '{label}'.")
+            for term in (source, target):
+                if is_variable(term):
+                    variables[term] = None
+        self.variables = list(variables)
+        if select is not None:
+            unknown = [variable for variable in select if variable not in variables]
+            if unknown:
+                raise ValueError(f"Selected variables do not occur in the patterns: {', '.join(unknown)}")
+        self.select = list(select) if select is not None else None
+
+    # --- Planning ---------------------------------------------------------
+
+    @staticmethod
+    def _estimate(memory, stats: Dict[str, LabelStats], pattern: Pattern, bound: Set[str]) -> Tuple[str, float]:
+        """Returns the evaluation mode of a pattern and its expected rows per input row."""
+        source, label, target = pattern
+        label_stats = stats.get(label)
+        if label_stats is None or not label_stats.edges:
+            return "scan", 0.0
+        source_known = not is_variable(source) or source in bound
+        target_known = not is_variable(target) or target in bound
+        if source_known and target_known:
+            if not is_variable(source) and not is_variable(target):
+                return "check", float(memory.has_relationship(source, target, label))
+            return "check", label_stats.edges / max(label_stats.sources * label_stats.targets, 1)
+        if source_known:
+            if not is_variable(source):
+                return "forward", float(len(memory.query_relationships(source, label)))
+            return "forward", label_stats.edges / label_stats.sources
+        if target_known:
+            if not is_variable(target):
+                return "backward", float(len(memory.query_sources(target, label)))
+            return "backward", label_stats.edges / label_stats.targets
+        return "scan", float(label_stats.edges)
+
+    def plan(self, memory) -> List[_Step]:
+        """
+        Orders the patterns for evaluation against a memory.
+
+        Returns:
+            The steps in evaluation order, each with its mode and estimated
+            rows per input row.
+        """
+        stats = memory.label_stats()
+        remaining = list(self.patterns)
+        bound: Set[str] = set()
+        steps: List[_Step] = []
+        while remaining:
+            best = None
+            for i, pattern in enumerate(remaining):
+                mode, estimate = self._estimate(memory, stats, pattern, bound)
+                # Prefer cheaper patterns; on a tie, prefer checks over expansions.
+                key = (estimate, mode != "check", i)
+                if best is None or key < best[0]:
+                    best = (key, i, mode, estimate)
+            _, i, mode, estimate = best
+            pattern = remaining.pop(i)
+            steps.append(_Step(pattern, mode, estimate))
+            bound.update(term for term in (pattern[0], pattern[2]) if is_variable(term))
+        return steps
+
+    @staticmethod
+    def describe(plan: List[_Step]) -> List[str]:
+        """Describes a plan, one line per step, e.g. "backward ?x -is_a-> country (~12 rows)"."""
+        return [f"{step.mode} {step.pattern[0]} -{step.pattern[1]}-> {step.pattern[2]} (~{step.estimate:.3g} rows)"
+                for step in plan]
+
+    def explain(self, memory) -> List[str]:
+        """Describes the plan chosen for a memory (see describe())."""
+        return self.describe(self.plan(memory))
+
+    # --- Evaluation -------------------------------------------------------
+
+    def run(self, memory, plan: Optional[List[_Step]] = None) -> Iterator[Dict[str, str]]:
+        """
+        Evaluates the query, yielding one {variable: node} binding per
+        answer, e.g. {"?x": "France"}. Answers are produced lazily, so
+        stopping early skips the rest of the work.
+
+        Args:
+            memory: A MemoryCore-compatible memory or snapshot.
+            plan (list, optional): A plan from plan() for the same memory.
+        """
+        steps = plan if plan is not None else self.plan(memory)
+        # A zero estimate is exact: the label is unused or a constant lookup came back empty.
+        if any(step.estimate == 0 for step in steps):
+            return
+        rows = self._join(memory, steps, 0, {})
+        if self.select is None:
+            yield from rows
+            return
+        seen = set()
+        for row in rows:
+            projected = tuple(row[variable] for variable in self.select)
+            if projected not in seen:
+                seen.add(projected)
+                yield dict(zip(self.select, projected))
+
+    def _join(self, memory, steps: List[_Step], depth: int, row: Dict[str, str]) -> Iterator[Dict[str, str]]:
+        if depth == len(steps):
+            yield dict(row)
+            return
+        source, label, target = steps[depth].pattern
+        source_value = row.get(source, source) if is_variable(source) else source
+        target_value = row.get(target, target) if is_variable(target) else target
+        source_free = is_variable(source) and source not in row
+        target_free = is_variable(target) and target not in row
+
+        if not source_free and not target_free:
+            if memory.has_relationship(source_value, target_value, label):
+                yield from self._join(memory, steps, depth + 1, row)
+            return
+        if not source_free:
+            matches = ((source_value, t) for t in memory.query_relationships(source_value, label))
+        elif not target_free:
+            matches = ((s, target_value) for s in memory.query_sources(target_value, label))
+        else:
+            matches = ((s, t) for s, t, _ in memory.iter_edges(label))
+
+        for source_match, target_match in matches:
+            if source_free and target_free and source == target and source_match != target_match:
+                continue  # A pattern like ("?x", "part_of", "?x").
+            if source_free:
+                row[source] = source_match
+            if target_free:
+                row[target] = target_match
+            yield from self._join(memory, steps, depth + 1, row)
+        if source_free:
+            row.pop(source, None)
+        if target_free:
+            row.pop(target, None)
+
+def query(memory, patterns: Sequence[Pattern], select: Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+    """
+    Shorthand for TripleQuery(patterns, select).run(memory).
+
+    Example:
+        for row in query(memory, [("?x", "is_a", "country"), ("?x", "has_property", "large")]):
+            print(row["?x"])
+    """
+    return TripleQuery(patterns, select).run(memory)
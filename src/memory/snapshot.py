@@ -0,0 +1,127 @@
+# src/memory/snapshot.py
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+class MemorySnapshot:
+    """
+    MemorySnapshot v0.1: A Frozen View.
+
+    A read-only view of a memory backend as it was when snapshot() was
+    called. It supports the same queries as MemoryCore, so a CausalEngine
+    can reason over it while ingestion continues on the live store.
+
+    Backends stamp every new node and edge with a version number, and keep
+    each adjacency dict in version order. A snapshot records only the
+    version it was taken at (plus, for CompactMemoryCore, references to the
+    current CSR blocks), so creating one is O(1) and queries stop at the
+    first entry newer than the snapshot. Because the stores are append-only,
+    no data is copied: later edges are simply not visible. Node attributes
+    are read live.
+    """
+
+    def __init__(self, memory, version: int, node_count: int, edge_count: int, blocks: Any = None):
+        """
+        Use the backend's snapshot() method rather than creating this directly.
+
+        Args:
+            memory: The backend the view reads from.
+            version (int): The backend's version at snapshot time.
+            node_count (int): The number of nodes at snapshot time.
+            edge_count (int): The number of relationships at snapshot time.
+            blocks (any, optional): Backend-specific state captured at snapshot time.
+        """
+        self._memory = memory
+        self.version = version
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self.blocks = blocks
+
+    def add_node(self, node_id: str, attributes: Optional[Dict[str, Any]] = None):
+        raise TypeError("MemorySnapshot is read-only.")
+
+    def add_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        raise TypeError("MemorySnapshot is read-only.")
+
+    def add_relationships(self, relationships: Iterable[Tuple[str, str, str]]) -> int:
+        raise TypeError("MemorySnapshot is read-only.")
+
+    def add_listener(self, listener):
+        """Accepted for compatibility. A snapshot never changes, so it never notifies."""
+
+    def snapshot(self) -> "MemorySnapshot":
+        return self
+
+    def query_relationships(self, source_id: str, label: str) -> List[str]:
+        """Finds the targets of a source's relationships with a label, as of the snapshot."""
+        return self._memory._targets_at(self, source_id, label)
+
+    def query_sources(self, target_id: str, label: str) -> List[str]:
+        """Finds the sources pointing at a target with a label, as of the snapshot."""
+        return self._memory._sources_at(self, target_id, label)
+
+    def has_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        """Checks whether a specific labeled relationship existed at the snapshot."""
+        return self._memory._has_relationship_at(self, source_id, target_id, label)
+
+    def iter_edges(self, label: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """Iterates over the snapshot's relationships as (source_id, target_id, label)."""
+        return self._memory._edges_at(self, label)
+
+    def iter_nodes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterates over the snapshot's concepts as (node_id, attributes)."""
+        return self._memory._nodes_at(self)
+
+    def label_stats(self):
+        """
+        Returns the live store's per-label counts. They are only estimates
+        for query planning, so facts added since the snapshot are included.
+        """
+        return self._memory.label_stats()
+
+    def has_node(self, node_id: str) -> bool:
+        """Checks whether a concept existed at the snapshot."""
+        return self._memory._has_node_at(self, node_id)
+
+    def get_node_attributes(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves the current attributes of a node that existed at the snapshot."""
+        if not self.has_node(node_id):
+            return None
+        return self._memory.get_node_attributes(node_id)
+
+    def find_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
+        """
+        Finds the shortest path of concepts connecting a source to a target,
+        following relationships of any label that existed at the snapshot.
+        """
+        if not (self.has_node(source_id) and self.has_node(target_id)):
+            return None
+        parents: Dict[str, Optional[str]] = {source_id: None}
+        queue = deque([source_id])
+        while queue and target_id not in parents:
+            current = queue.popleft()
+            for nxt in self._memory._successors_at(self, current):
+                if nxt not in parents:
+                    parents[nxt] = current
+                    queue.append(nxt)
+        if target_id not in parents:
+            return None
+        path = []
+        node: Optional[str] = target_id
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        return path[::-1]
+
+    def save_snapshot(self, path: str):
+        """Writes the view to a binary snapshot file (see memory.store)."""
+        from memory.store import save_snapshot
+        save_snapshot(self, path)
+
+    def number_of_nodes(self) -> int:
+        """Returns the number of concepts at the snapshot."""
+        return self.node_count
+
+    def number_of_edges(self) -> int:
+        """Returns the number of labeled relationships at the snapshot."""
+        return self.edge_count
@@ -0,0 +1,298 @@
+# src/memory/store.py
+
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from memory.compact import CompactMemoryCore
+
+# Snapshot layout: a fixed header, then 8-byte aligned sections in this order.
+#   node_offsets  int64[N+1]   byte offsets of each name in node_blob
+#   node_blob     bytes        UTF-8 node names, sorted bytewise
+#   labels        bytes        JSON list of relationship labels
+#   out_offsets   int64[N+1]   forward CSR block (see CompactMemoryCore)
+#   out_labels    int32[E]
+#   out_targets   int32[E]
+#   in_offsets    int64[N+1]   reverse CSR block
+#   in_labels     int32[E]
+#   in_sources    int32[E]
+#   attributes    bytes        JSON object {node name: attributes}
+MAGIC = b"ARCHKS01"
+SECTIONS = (
+    "node_offsets", "node_blob", "labels",
+    "out_offsets", "out_labels", "out_targets",
+    "in_offsets", "in_labels", "in_sources",
+    "attributes",
+)
+HEADER = struct.Struct("<8s8sQQI4x" + "QQ" * len(SECTIONS))
+BYTEORDER = sys.byteorder.encode("ascii").ljust(8, b"\0")
+
+def _log_path(path: str) -> str:
+    """Incremental saves after a snapshot are appended to this file."""
+    return path + ".log"
+
+def _csr(keys: List[int], node_count: int, label_count: int) -> Tuple[array, array, array]:
+    """Builds one CSR block from packed (node, label, other) keys."""
+    keys.sort()
+    offsets = array("q", [0]) * (node_count + 1)
+    labels = array("i")
+    others = array("i")
+    stride = label_count * node_count
+    for key in keys:
+        node, rest = divmod(key, stride)
+        label, other = divmod(rest, node_count)
+        offsets[node + 1] += 1
+        labels.append(label)
+        others.append(other)
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+    return offsets, labels, others
+
+def save_snapshot(memory, path: str):
+    """
+    Writes any MemoryCore-compatible memory to a compact binary snapshot.
+    The file is written next to its destination and moved into place, so a
+    store that is currently open on the same path keeps working. Any
+    incremental log left from an older snapshot at this path is removed.
+
+    Args:
+        memory: A memory backend providing iter_nodes() and iter_edges().
+        path (str): The snapshot file to write.
+    """
+    attributes = {}
+    names = []
+    for node_id, attrs in memory.iter_nodes():
+        names.append(node_id)
+        if attrs:
+            attributes[node_id] = attrs
+    encoded = sorted(name.encode("utf-8") for name in names)
+    node_ids = {name.decode("utf-8"): i for i, name in enumerate(encoded)}
+
+    labels: Dict[str, int] = {}
+    out_keys: List[int] = []
+    in_keys: List[int] = []
+    edges = [(node_ids[s], node_ids[t], labels.setdefault(l, len(labels))) for s, t, l in memory.iter_edges()]
+    node_count, label_count = len(encoded), max(len(labels), 1)
+    stride = label_count * node_count
+    for sid, tid, lid in edges:
+        out_keys.append(sid * stride + lid * node_count + tid)
+        in_keys.append(tid * stride + lid * node_count + sid)
+    del edges
+
+    node_offsets = array("q", [0])
+    for name in encoded:
+        node_offsets.append(node_offsets[-1] + len(name))
+    out_offsets, out_labels, out_targets = _csr(out_keys, node_count, label_count)
+    in_offsets, in_labels, in_sources = _csr(in_keys, node_count, label_count)
+
+    payloads = [
+        node_offsets.tobytes(), b"".join(encoded), json.dumps(list(labels)).encode("utf-8"),
+        out_offsets.tobytes(), out_labels.tobytes(), out_targets.tobytes(),
+        in_offsets.tobytes(), in_labels.tobytes(), in_sources.tobytes(),
+        json.dumps(attributes).encode("utf-8"),
+    ]
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * HEADER.size)
+        table = []
+        for payload in payloads:
+            f.write(b"\0" * (-f.tell() % 8))
+            table.extend((f.tell(), len(payload)))
+            f.write(payload)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, BYTEORDER, node_count, len(out_targets), len(labels), *table))
+    os.replace(tmp_path, path)
+    if os.path.exists(_log_path(path)):
+        os.remove(_log_path(path))
+
+def open_snapshot(path: str) -> "MappedMemoryCore":
+    """Opens a snapshot memory-mapped, replaying any incremental saves."""
+    return MappedMemoryCore(path)
+
+class _MappedNames:
+    """Node names: the sorted snapshot table on disk, plus new names in memory."""
+
+    def __init__(self, mm: mmap.mmap, offsets: memoryview, blob_start: int, count: int):
+        self._mm = mm
+        self._offsets = offsets
+        self._blob_start = blob_start
+        self._count = count
+        self._extra: List[str] = []
+        self._extra_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._count + len(self._extra)
+
+    def _raw(self, i: int) -> bytes:
+        return self._mm[self._blob_start + self._offsets[i]:self._blob_start + self._offsets[i + 1]]
+
+    def __getitem__(self, i: int) -> str:
+        if i < self._count:
+            return self._raw(i).decode("utf-8")
+        return self._extra[i - self._count]
+
+    def append(self, name: str):
+        self._extra.append(name)
+
+    def find(self, name: str) -> Optional[int]:
+        """Binary-searches the snapshot table, then checks the new names."""
+        key = name.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._raw(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._raw(lo) == key:
+            return lo
+        return self._extra_ids.get(name)
+
+class _MappedIds:
+    """Dict-like name -> ID view over _MappedNames, as CompactMemoryCore expects."""
+
+    def __init__(self, names: _MappedNames):
+        self._names = names
+
+    def get(self, name: str, default: Optional[int] = None) -> Optional[int]:
+        nid = self._names.find(name)
+        return default if nid is None else nid
+
+    def __contains__(self, name: str) -> bool:
+        return self._names.find(name) is not None
+
+    def __setitem__(self, name: str, nid: int):
+        self._names._extra_ids[name] = nid
+
+class MappedMemoryCore(CompactMemoryCore):
+    """
+    MappedMemoryCore v0.1: The Persistent Graph.
+
+    A CompactMemoryCore whose CSR blocks and string table are read straight
+    from a memory-mapped snapshot, so opening a multi-million-fact store
+    costs a header read and a few memoryview casts. Names are found by binary
+    search over the sorted string table; attributes are decoded on first use.
+
+    New facts go to the in-memory delta as usual (it is not auto-compacted,
+    which would copy the snapshot into memory). save() appends them to an
+    append-only log next to the snapshot, which is replayed on open. Writing
+    a fresh snapshot with save_snapshot() folds the log back in.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a snapshot written by save_snapshot().
+
+        Args:
+            path (str): The snapshot file.
+        """
+        super().__init__(compact_threshold=sys.maxsize)
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder, node_count, _, _, *table = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an ARCHANON knowledge snapshot.")
+        if byteorder != BYTEORDER:
+            raise ValueError(f"{path} was written on a machine with a different byte order.")
+        self._sections = {name: (table[2 * i], table[2 * i + 1]) for i, name in enumerate(SECTIONS)}
+        self._view = memoryview(self._mm)
+
+        self._node_names = _MappedNames(
+            self._mm, self._cast("node_offsets", "q"), self._sections["node_blob"][0], node_count)
+        self._node_ids = _MappedIds(self._node_names)
+        start, length = self._sections["labels"]
+        self._label_names = json.loads(self._mm[start:start + length].decode("utf-8"))
+        self._label_ids = {label: i for i, label in enumerate(self._label_names)}
+        self._out_offsets = self._cast("out_offsets", "q")
+        self._out_labels = self._cast("out_labels", "i")
+        self._out_targets = self._cast("out_targets", "i")
+        self._in_offsets = self._cast("in_offsets", "q")
+        self._in_labels = self._cast("in_labels", "i")
+        self._in_sources = self._cast("in_sources", "i")
+        self._attrs_loaded = False
+        self._unsaved: List[Any] = []
+
+        if os.path.exists(_log_path(path)):
+            self._replay_log()
+        print(f"MappedMemoryCore v0.1 opened {path}.")
+
+    def _cast(self, section: str, fmt: str) -> memoryview:
+        start, length = self._sections[section]
+        return self._view[start:start + length].cast(fmt)
+
+    def _load_attrs(self):
+        if self._attrs_loaded:
+            return
+        self._attrs_loaded = True
+        start, length = self._sections["attributes"]
+        stored = json.loads(self._mm[start:start + length].decode("utf-8"))
+        for node_id, attrs in stored.items():
+            self._attrs.setdefault(self._node_ids.get(node_id), {}).update(attrs)
+
+    def _replay_log(self):
+        with open(_log_path(self.path), "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                if record[0] == "edge":
+                    super().add_relationship(*record[1:])
+                else:
+                    self._load_attrs()
+                    super().add_node(record[1], record[2])
+
+    def add_node(self, node_id: str, attributes: Optional[Dict[str, Any]] = None):
+        self._load_attrs()
+        is_new = node_id not in self._node_ids
+        super().add_node(node_id, attributes)
+        if attributes or is_new:
+            self._unsaved.append(("node", node_id, attributes or {}))
+
+    def add_relationship(self, source_id: str, target_id: str, label: str) -> bool:
+        if not super().add_relationship(source_id, target_id, label):
+            return False
+        self._unsaved.append(("edge", source_id, target_id, label))
+        return True
+
+    def get_node_attributes(self, node_id: str) -> Optional[Dict[str, Any]]:
+        self._load_attrs()
+        return super().get_node_attributes(node_id)
+
+    def iter_nodes(self):
+        self._load_attrs()
+        return super().iter_nodes()
+
+    def _nodes_at(self, view):
+        self._load_attrs()
+        return super()._nodes_at(view)
+
+    def save(self) -> int:
+        """
+        Appends every change made since the last save to the incremental log.
+
+        Returns:
+            The number of records written.
+        """
+        written = len(self._unsaved)
+        if written:
+            with open(_log_path(self.path), "a", encoding="utf-8") as f:
+                for record in self._unsaved:
+                    f.write(json.dumps(record) + "\n")
+            self._unsaved = []
+        return written
+
+    def close(self):
+        """
+        Releases the memory map. The store must not be used afterwards, and
+        any snapshot() views taken from it must be dropped first.
+        """
+        self._out_offsets = self._out_labels = self._out_targets = None
+        self._in_offsets = self._in_labels = self._in_sources = None
+        self._node_names._offsets.release()
+        self._view.release()
+        self._mm.close()
+        self._file.close()
@@ -0,0 +1,331 @@
+# src/meta/metrics.py
+
+import os
+import sys
+import time
+import functools
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+# Latency histograms use power-of-two buckets: bucket 0 holds everything
+# under 1024 ns, bucket k holds [2**(k+9), 2**(k+10)) ns, and the last
+# bucket is open-ended (about 34 s and up). Finding a bucket is one
+# bit_length() call, so recording a latency is cheap enough to leave on.
+BUCKET_SHIFT = 10
+NUM_BUCKETS = 26
+BUCKET_BOUNDS_NS = [1 << (k + BUCKET_SHIFT) for k in range(NUM_BUCKETS - 1)]
+
+class LatencyHistogram:
+    """A streaming latency histogram with log-scale buckets."""
+
+    __slots__ = ("counts", "errors", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * NUM_BUCKETS
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, duration_ns: int, failed: bool = False):
+        bucket = (duration_ns >> BUCKET_SHIFT).bit_length()
+        self.counts[bucket if bucket < NUM_BUCKETS else NUM_BUCKETS - 1] += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        if failed:
+            self.errors += 1
+
+    def quantile(self, q: float) -> int:
+        """
+        Estimates a latency quantile in nanoseconds, as the upper bound of
+        the bucket it falls in (never more than the largest latency seen).
+        """
+        count = self.count
+        if not count:
+            return 0
+        rank = max(q * count, 1)
+        seen = 0
+        for k, bucket_count in enumerate(self.counts[:-1]):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS_NS[k], self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, Any]:
+        count = self.count
+        return {
+            "count": count,
+            "errors": self.errors,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / count / 1000 if count else 0.0,
+            "p50_us": self.quantile(0.5) / 1000,
+            "p90_us": self.quantile(0.9) / 1000,
+            "p99_us": self.quantile(0.99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+class _Timer:
+    """Times one operation. After the block, elapsed_ns holds its duration."""
+
+    __slots__ = ("_histogram", "_lock", "_start", "elapsed_ns")
+
+    def __init__(self, histogram: LatencyHistogram, lock: threading.Lock):
+        self._histogram = histogram
+        self._lock = lock
+        self.elapsed_ns: Optional[int] = None
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed_ns = elapsed_ns = time.perf_counter_ns() - self._start
+        with self._lock:
+            self._histogram.observe(elapsed_ns, exc_type is not None)
+        return False
+
+class _NullTimer:
+    """The timer handed out while metrics are disabled."""
+
+    __slots__ = ()
+    elapsed_ns = None
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+def process_stats() -> Dict[str, Any]:
+    """CPU time and peak resident memory of this process, where the platform reports them."""
+    if resource is None:
+        return {}
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # Linux reports ru_maxrss in kilobytes, macOS in bytes.
+    peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    return {"cpu_seconds": usage.ru_utime + usage.ru_stime, "peak_rss_bytes": peak_rss}
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+class MetricsRegistry:
+    """
+    MetricsRegistry v0.1: Operational Telemetry.
+
+    Per-(module, action) latency histograms and per-(module, name) counters,
+    kept in memory and updated on every call. The registry answers where the
+    time goes, which the Chain of Consciousness, a record of what happened,
+    does not. It is thread-safe, and a timed call costs two clock reads, a
+    bucket lookup and one uncontended lock, small next to a logged event.
+
+    Example:
+        with metrics.timer("CausalEngine", "deduce_property"):
+            engine.deduce_property("Socrates", "mortal")
+        metrics.increment("Learner", "sentences", 12)
+        metrics.snapshot()["operations"]["CausalEngine.deduce_property"]["p99_us"]
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled (bool): Record metrics. When False, timers and counters
+                do nothing, so instrumented code runs at full speed.
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+
+    def _histogram(self, key: Tuple[str, str]) -> LatencyHistogram:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def _observe(self, key: Tuple[str, str], duration_ns: int, failed: bool = False):
+        histogram = self._histogram(key)
+        with self._lock:
+            histogram.observe(duration_ns, failed)
+
+    def observe(self, module: str, action: str, duration_ns: int, failed: bool = False):
+        """Records the duration of an operation timed elsewhere."""
+        if self.enabled:
+            self._observe((module, action), duration_ns, failed)
+
+    def timer(self, module: str, action: str):
+        """
+        Returns a context manager that records how long its block takes.
+        Blocks that raise are counted as errors.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self._histogram((module, action)), self._lock)
+
+    def timed(self, module: str, action: Optional[str] = None) -> Callable:
+        """
+        A decorator that times every call of a function.
+
+        Args:
+            module (str): The module the calls are recorded under.
+            action (str, optional): Defaults to the function's name.
+        """
+        def decorate(func: Callable) -> Callable:
+            key = (module, action or func.__name__)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self._histogram(key), self._lock):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def instrument(self, obj: Any, module: str, methods: Iterable[str]):
+        """
+        Times the given methods of one object, e.g. a CausalEngine built
+        outside a kernel. Methods that are already instrumented are left alone.
+        """
+        for name in methods:
+            method = getattr(obj, name)
+            if getattr(method, "_archanon_timed", False):
+                continue
+            wrapper = self.timed(module, name)(method)
+            wrapper._archanon_timed = True
+            setattr(obj, name, wrapper)
+
+    def time_iter(self, module: str, action: str, iterable: Iterable) -> Iterator:
+        """
+        Yields from an iterable, recording the time spent producing each item,
+        e.g. the time spaCy's nlp.pipe takes to hand over each parsed Doc.
+        """
+        if not self.enabled:
+            yield from iterable
+            return
+        key = (module, action)
+        iterator = iter(iterable)
+        clock = time.perf_counter_ns
+        while True:
+            start = clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self._observe(key, clock() - start)
+            yield item
+
+    def increment(self, module: str, name: str, amount: int = 1):
+        """Adds to a counter, e.g. increment("Learner", "facts", 20)."""
+        if self.enabled and amount:
+            key = (module, name)
+            with self._lock:
+                self._counters[key] = self._counters.get(key, 0) + amount
+
+    def reset(self):
+        """Forgets every recorded latency and counter."""
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current metrics as plain data:
+        - operations: "Module.action" -> count, errors, total_ms, mean_us,
+          p50_us, p90_us, p99_us and max_us,
+        - counters: "Module.name" -> value,
+        - process: cpu_seconds and peak_rss_bytes, where available.
+        """
+        with self._lock:
+            operations = {f"{m}.{a}": h.summary() for (m, a), h in list(self._histograms.items())}
+            counters = {f"{m}.{n}": value for (m, n), value in self._counters.items()}
+        return {"operations": operations, "counters": counters, "process": process_stats()}
+
+    def to_prometheus(self, prefix: str = "archanon") -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = [(key, list(h.counts), h.count, h.errors, h.total_ns)
+                          for key, h in sorted(self._histograms.items())]
+            counters = sorted(self._counters.items())
+
+        lines: List[str] = []
+        name = f"{prefix}_operation_duration_seconds"
+        lines.append(f"# HELP {name} Latency of monitored operations.")
+        lines.append(f"# TYPE {name} histogram")
+        for (module, action), counts, count, _, total_ns in histograms:
+            labels = f'module="{_escape(module)}",action="{_escape(action)}"'
+            cumulative = 0
+            for bound_ns, bucket_count in zip(BUCKET_BOUNDS_NS, counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{labels},le="{bound_ns / 1e9:.9g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total_ns / 1e9:.9g}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+        name = f"{prefix}_operation_errors_total"
+        lines.append(f"# HELP {name} Monitored operations that raised an exception.")
+        lines.append(f"# TYPE {name} counter")
+        for (module, action), _, _, errors, _ in histograms:
+            lines.append(f'{name}{{module="{_escape(module)}",action="{_escape(action)}"}} {errors}')
+
+        name = f"{prefix}_events_total"
+        lines.append(f"# HELP {name} Counted events, such as sentences read or facts learned.")
+        lines.append(f"# TYPE {name} counter")
+        for (module, counter), value in counters:
+            lines.append(f'{name}{{module="{_escape(module)}",name="{_escape(counter)}"}} {value}')
+
+        stats = process_stats()
+        if stats:
+            lines.append(f"# TYPE {prefix}_process_cpu_seconds_total counter")
+            lines.append(f"{prefix}_process_cpu_seconds_total {stats['cpu_seconds']:.6g}")
+            lines.append(f"# TYPE {prefix}_process_peak_rss_bytes gauge")
+            lines.append(f"{prefix}_process_peak_rss_bytes {stats['peak_rss_bytes']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "archanon"):
+        """
+        Writes the metrics to a file for node_exporter's textfile collector.
+        The file is replaced atomically, so a scrape never sees half of it.
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(tmp_path, path)
+
+class PrometheusFileExporter:
+    """Rewrites a registry's Prometheus text file at a fixed interval from a daemon thread."""
+
+    def __init__(self, metrics: MetricsRegistry, path: str, interval: float = 15.0):
+        """
+        Args:
+            metrics (MetricsRegistry): The registry to export.
+            path (str): The .prom file to write.
+            interval (float): Seconds between writes.
+        """
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.metrics.write_prometheus(self.path)
+
+    def stop(self):
+        """Stops the thread after one last write."""
+        self._stop.set()
+        self._thread.join()
+        self.metrics.write_prometheus(self.path)
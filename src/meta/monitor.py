@@ -1,60 +1,303 @@
 # src/meta/monitor.py
 
+import time
+import queue
+import atexit
 import datetime
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from meta.trace import EventIndex
+from meta.metrics import MetricsRegistry
 
 class MetacognitiveMonitor:
     """
-    MetacognitiveMonitor v0.1: State Tracking & Introspection.
+    MetacognitiveMonitor v0.6: State Tracking & Introspection.
 
     This module acts as the system's internal observer. It logs every
     significant action taken by other modules to create a "Chain of
     Consciousness" (CoC). This provides a fully transparent and auditable
     record of the system's reasoning process.
-    """
 
-    def __init__(self):
-        """Initializes the monitor with an empty log."""
-        self._chain_of_consciousness: List[Dict[str, Any]] = []
-        print("MetacognitiveMonitor v0.1 initialized.")
+    v0.2: Events are written to pluggable sinks (see meta.sinks). Recent
+    events stay queryable in memory, optionally bounded to a ring buffer,
+    while the full audit trail can stream to rotating segment files.
+
+    v0.3: A non-blocking mode. log_event then only records a monotonic
+    clock reading and references to its arguments; a background writer
+    thread builds, timestamps and stores the events. Both modes derive
+    timestamps from the same monotonic clock, so their audit trails match.
+
+    v0.4: Events held in memory are indexed by module, action, node and time
+    (see meta.trace.EventIndex), with cursor-based paging and cached
+    formatted lines, so tailing the trace costs only the new events.
+
+    v0.5: The in-memory log is guarded by a lock, so events may be logged
+    and read from many threads at once (see ArchanonKernel's thread-safe mode).
 
-    def log_event(self, module: str, action: str, params: Dict[str, Any], result: Any):
+    v0.6: Operational metrics (see meta.metrics.MetricsRegistry). Timers,
+    decorators and counters record per-module, per-action latency
+    histograms, exposed through metrics_snapshot() and a Prometheus text
+    file. Events may carry the duration of the call they record.
+    """
+
+    def __init__(self, retain: Optional[int] = None, sinks: Sequence[Any] = (), background: bool = False,
+                 metrics: bool = True):
         """
-        Logs a single computational event.
+        Initializes the monitor with an empty log.
 
         Args:
-            module (str): The name of the module generating the event (e.g., "MemoryCore").
-            action (str): The name of the function or method called (e.g., "add_relationship").
-            params (dict): The parameters passed to the function.
-            result (any): The result returned by the function.
+            retain (int, optional): Keep only this many recent events in
+                memory. By default every event is kept.
+            sinks (sequence, optional): Extra sinks (e.g., JSONLSegmentSink)
+                that receive every event.
+            background (bool): Hand events to a writer thread instead of
+                storing them on the caller's thread. Call flush() before
+                reading from sinks, and close() when done (it also runs at
+                interpreter exit).
+            metrics (bool): Record latency histograms and counters.
+        """
+        self._recent = EventIndex(capacity=retain)
+        self._lock = threading.Lock()
+        self._sinks = list(sinks)
+        self.metrics = MetricsRegistry(enabled=metrics)
+        # Wall-clock time is derived from one anchor plus monotonic offsets.
+        self._wall_anchor = datetime.datetime.now(datetime.timezone.utc)
+        self._mono_anchor = time.monotonic_ns()
+        self._last_mono_ns = self._mono_anchor
+
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        # Background events are numbered as they are queued; readers wait
+        # until the writer has stored every event queued before they were called.
+        self._submit_lock = threading.Lock()
+        self._submitted = 0
+        self._stored = 0
+        self._drained = threading.Condition()
+        # The first error a sink raised on the writer thread, re-raised by flush() or close().
+        self._writer_error: Optional[BaseException] = None
+        if background:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._drain, args=(self._queue,), name="coc-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        print("MetacognitiveMonitor v0.6 initialized.")
+
+    def _timestamp(self, mono_ns: int) -> str:
+        """Formats a monotonic clock reading as an ISO-8601 UTC timestamp."""
+        offset = datetime.timedelta(microseconds=(mono_ns - self._mono_anchor) // 1000)
+        return (self._wall_anchor + offset).isoformat(timespec="microseconds")
+
+    def _store(self, mono_ns: Optional[int], module: str, action: str, params: Dict[str, Any], result: Any,
+               justification: Optional[List[Tuple[str, str, str]]], duration_ns: Optional[int] = None):
+        """
+        Stores one event. Without a clock reading (synchronous mode), the
+        clock is read under the lock. Either way, timestamps never decrease
+        in storage order, which the index's time-range search relies on.
         """
         event = {
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "timestamp": None,
             "module": module,
             "action": action,
             "params": params,
             "result": result
         }
-        self._chain_of_consciousness.append(event)
+        if justification is not None:
+            event["justification"] = justification
+        if duration_ns is not None:
+            event["duration_us"] = round(duration_ns / 1000, 1)
+        with self._lock:
+            if mono_ns is None:
+                mono_ns = time.monotonic_ns()
+            # Two background callers may read the clock and queue in opposite orders.
+            mono_ns = self._last_mono_ns = max(mono_ns, self._last_mono_ns)
+            event["timestamp"] = self._timestamp(mono_ns)
+            self._recent.write(event)
+            for sink in self._sinks:
+                sink.write(event)
+
+    def _drain(self, events: queue.Queue):
+        """
+        Writer thread: stores queued events until it receives None. A sink
+        error does not stop the thread; it is kept for flush() or close().
+        """
+        while True:
+            record = events.get()
+            if record is None:
+                return
+            try:
+                self._store(*record)
+            except Exception as error:
+                if self._writer_error is None:
+                    self._writer_error = error
+            with self._drained:
+                self._stored += 1
+                self._drained.notify_all()
+
+    def _raise_writer_error(self):
+        """Re-raises, once, the first sink error seen by the writer thread."""
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+
+    def log_event(self, module: str, action: str, params: Dict[str, Any], result: Any,
+                  justification: Optional[List[Tuple[str, str, str]]] = None, duration_ns: Optional[int] = None):
+        """
+        Logs a single computational event.
+
+        Args:
+            module (str): The name of the module generating the event (e.g., "MemoryCore").
+            action (str): The name of the function or method called (e.g., "add_relationship").
+            params (dict): The parameters passed to the function.
+            result (any): The result returned by the function.
+            justification (list, optional): The (source, label, target) facts
+                the result rests on, e.g. the 'is_a' chain of a deduction.
+            duration_ns (int, optional): How long the call took, e.g. a
+                timer's elapsed_ns. Recorded in the event as duration_us.
+        """
+        if self._queue is not None:
+            record = (time.monotonic_ns(), module, action, params, result, justification, duration_ns)
+            with self._submit_lock:
+                # close() swaps the queue out under this lock, so no event lands behind its sentinel.
+                if self._queue is not None:
+                    self._submitted += 1
+                    self._queue.put(record)
+                    return
+        if self._submitted:
+            self._wait_for_writer()  # After close(), keep the order of events queued before it.
+        self._store(None, module, action, params, result, justification, duration_ns)
+
+    def timer(self, module: str, action: str):
+        """
+        Returns a context manager recording how long its block takes.
+
+        Example:
+            with monitor.timer("CausalEngine", "deduce_property") as timer:
+                result = engine.deduce_property("Socrates", "mortal")
+            monitor.log_event(..., duration_ns=timer.elapsed_ns)
+        """
+        return self.metrics.timer(module, action)
+
+    def timed(self, module: str, action: Optional[str] = None):
+        """A decorator recording the latency of every call (see MetricsRegistry.timed)."""
+        return self.metrics.timed(module, action)
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Returns latency summaries and counters per module and action (see MetricsRegistry.snapshot)."""
+        return self.metrics.snapshot()
+
+    def write_prometheus(self, path: str):
+        """Writes the metrics to a Prometheus text file, e.g. for node_exporter's textfile collector."""
+        self.metrics.write_prometheus(path)
 
     def get_chain_of_consciousness(self) -> List[Dict[str, Any]]:
-        """Returns the raw, structured log of all events."""
-        return self._chain_of_consciousness
+        """Returns the raw, structured log of the events held in memory."""
+        self._wait_for_writer()
+        with self._lock:
+            return self._recent.events()
 
     def get_formatted_chain(self) -> str:
         """Returns a human-readable string of the entire reasoning process."""
-        if not self._chain_of_consciousness:
-            return "No events logged."
-
-        formatted_lines = []
-        for event in self._chain_of_consciousness:
-            ts = datetime.datetime.fromisoformat(event['timestamp']).strftime('%H:%M:%S.%f')[:-3]
-            param_str = ", ".join(f"{k}={v}" for k, v in event['params'].items())
-            line = f"[{ts}] {event['module']}: Called {event['action']}({param_str}). Result -> {event['result']}"
-            formatted_lines.append(line)
-        
-        return "\n".join(formatted_lines)
+        self._wait_for_writer()
+        with self._lock:
+            seqs = self._recent.seqs_since(0)
+            if not seqs:
+                return "No events logged."
+            return "\n".join(self._recent.line(seq) for seq in seqs)
+
+    def events_since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Returns a page of events, oldest first, starting at a cursor.
+
+        Example:
+            events, cursor = monitor.events_since(0)
+            ... later ...
+            new_events, cursor = monitor.events_since(cursor)
+
+        Args:
+            cursor (int): A cursor returned by a previous call (0 for the start).
+            limit (int, optional): The maximum number of events to return.
+
+        Returns:
+            The events, and the cursor to pass to the next call.
+        """
+        self._wait_for_writer()
+        with self._lock:
+            seqs = self._recent.seqs_since(cursor, limit)
+            return [self._recent.get(seq) for seq in seqs], seqs.stop
+
+    def formatted_since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[str], int]:
+        """Like events_since, but returns cached human-readable lines."""
+        self._wait_for_writer()
+        with self._lock:
+            seqs = self._recent.seqs_since(cursor, limit)
+            return [self._recent.line(seq) for seq in seqs], seqs.stop
+
+    def events_for(self, node_id: str) -> List[Dict[str, Any]]:
+        """Returns the held events that mention a node, oldest first."""
+        return self.find_events(node_id=node_id)
+
+    def find_events(self, module: Optional[str] = None, action: Optional[str] = None,
+                    node_id: Optional[str] = None, start: Optional[datetime.datetime] = None,
+                    end: Optional[datetime.datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the held events matching every given filter, oldest first.
+
+        Args:
+            module (str, optional): e.g. "CausalEngine".
+            action (str, optional): e.g. "deduce_property".
+            node_id (str, optional): A node named in the event's params or batch results.
+            start, end (datetime, optional): A timezone-aware [start, end) time range.
+        """
+        self._wait_for_writer()
+        with self._lock:
+            seqs = self._recent.seqs_for(module, action, node_id)
+            if start is not None or end is not None:
+                window = self._recent.seqs_between(start, end)
+                seqs = [seq for seq in seqs if seq in window]
+            return [self._recent.get(seq) for seq in seqs]
 
     def clear_log(self):
-        """Clears all events from the log."""
-        self._chain_of_consciousness = []
\ No newline at end of file
+        """Clears all events from the in-memory log. Sinks are not affected."""
+        self._wait_for_writer()
+        with self._lock:
+            self._recent.clear()
+
+    def _wait_for_writer(self):
+        """
+        Blocks until the writer thread has stored every event queued before
+        the call. Events other threads queue meanwhile are not waited for.
+        """
+        if not self._submitted:
+            return
+        with self._submit_lock:
+            target = self._submitted
+        with self._drained:
+            while self._stored < target:
+                self._drained.wait()
+
+    def flush(self):
+        """Stores every pending event and flushes every sink to its storage."""
+        self._wait_for_writer()
+        with self._lock:
+            for sink in self._sinks:
+                sink.flush()
+        self._raise_writer_error()
+
+    def close(self):
+        """
+        Stores every pending event, stops the writer thread and closes every
+        sink. Events logged afterwards are stored synchronously. A sink error
+        raised on the writer thread and not yet reported by flush() is
+        re-raised here.
+        """
+        with self._submit_lock:
+            events, self._queue = self._queue, None
+            if events is not None:
+                events.put(None)
+        if events is not None:
+            self._writer.join()
+            self._writer = None
+            atexit.unregister(self.close)
+        for sink in self._sinks:
+            sink.close()
+        self._raise_writer_error()
@@ -0,0 +1,141 @@
+# src/meta/sinks.py
+
+import os
+import gzip
+import json
+import queue
+import shutil
+import threading
+from typing import Any, Dict, List, Optional
+
+class JSONLSegmentSink:
+    """
+    Streams events to append-only JSON Lines segment files in a directory.
+
+    A segment is rotated once it reaches max_bytes. Rotated segments form
+    the archive tier: with compress=True they are gzip-compressed on a
+    helper thread, so rotating never stalls the logging caller, and with
+    max_archives set, the oldest archives beyond that count are deleted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024,
+                 compress: bool = True, max_archives: Optional[int] = None):
+        """
+        Args:
+            directory (str): Where segment files are written.
+            max_bytes (int): Size at which the active segment is rotated.
+            compress (bool): Gzip segments once they are rotated.
+            max_archives (int, optional): Number of rotated segments to keep.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.max_archives = max_archives
+        os.makedirs(directory, exist_ok=True)
+        self._segment_number = self._last_segment_number() + 1
+        self._archives: List[str] = self._existing_archives()
+        self._file = None
+        self._size = 0
+        self._archive_lock = threading.Lock()
+        self._to_compress: Optional[queue.Queue] = None
+        self._compressor: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _segment_number_of(name: str) -> Optional[int]:
+        if name.startswith("events-") and (name.endswith(".jsonl") or name.endswith(".jsonl.gz")):
+            number = name[len("events-"):].split(".", 1)[0]
+            if number.isdigit():
+                return int(number)
+        return None
+
+    def _last_segment_number(self) -> int:
+        numbers = [self._segment_number_of(name) for name in os.listdir(self.directory)]
+        return max([n for n in numbers if n is not None], default=0)
+
+    @staticmethod
+    def _segment_names(directory: str) -> List[str]:
+        names = [name for name in os.listdir(directory) if JSONLSegmentSink._segment_number_of(name) is not None]
+        # A segment being compressed briefly exists in both forms.
+        names = [name for name in names if not (name.endswith(".gz") and name[:-len(".gz")] in names)]
+        names.sort(key=JSONLSegmentSink._segment_number_of)
+        return names
+
+    def _existing_archives(self) -> List[str]:
+        return [os.path.join(self.directory, name) for name in self._segment_names(self.directory)]
+
+    def segment_path(self) -> str:
+        """The path of the segment currently being written."""
+        return os.path.join(self.directory, f"events-{self._segment_number:06d}.jsonl")
+
+    def write(self, event: Dict[str, Any]):
+        line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+        if self._file is None:
+            self._file = open(self.segment_path(), "ab")
+            self._size = self._file.tell()
+        self._file.write(line)
+        self._size += len(line)
+        if self._size >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        """Closes the active segment, archives it and starts a new one."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        path = self.segment_path()
+        self._segment_number += 1
+        if not self.compress:
+            self._archive(path)
+            return
+        if self._compressor is None:
+            self._to_compress = queue.Queue()
+            self._compressor = threading.Thread(target=self._compress_segments, args=(self._to_compress,),
+                                                name="coc-compressor", daemon=True)
+            self._compressor.start()
+        self._to_compress.put(path)
+
+    def _compress_segments(self, paths: queue.Queue):
+        """Compressor thread: gzips rotated segments, oldest first, until it receives None."""
+        while True:
+            path = paths.get()
+            if path is None:
+                return
+            # The .gz appears atomically; until the original is removed,
+            # read_segments reads only one of the two.
+            with open(path, "rb") as src, gzip.open(path + ".gz.tmp", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(path + ".gz.tmp", path + ".gz")
+            os.remove(path)
+            self._archive(path + ".gz")
+
+    def _archive(self, path: str):
+        with self._archive_lock:
+            self._archives.append(path)
+            if self.max_archives is not None:
+                while len(self._archives) > self.max_archives:
+                    os.remove(self._archives.pop(0))
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """Closes the active segment and waits for rotated segments to be compressed."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._compressor is not None:
+            self._to_compress.put(None)
+            self._compressor.join()
+            self._compressor = None
+
+def read_segments(directory: str) -> List[Dict[str, Any]]:
+    """Reads back every event written by a JSONLSegmentSink, oldest first."""
+    events = []
+    for name in JSONLSegmentSink._segment_names(directory):
+        path = os.path.join(directory, name)
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            events.extend(json.loads(line) for line in f)
+    return events
@@ -0,0 +1,184 @@
+# src/meta/trace.py
+
+import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+# Event fields (in params, or in per-item batch results) that name a node.
+NODE_KEYS = ("source_id", "target_id", "node_id")
+
+def format_event(event: Dict[str, Any]) -> str:
+    """Formats one event as a line of the human-readable Chain of Consciousness."""
+    ts = datetime.datetime.fromisoformat(event['timestamp']).strftime('%H:%M:%S.%f')[:-3]
+    param_str = ", ".join(f"{k}={v}" for k, v in event['params'].items())
+    line = f"[{ts}] {event['module']}: Called {event['action']}({param_str}). Result -> {event['result']}"
+    if "duration_us" in event:
+        line += f" ({event['duration_us']} us)"
+    justification = event.get("justification")
+    if justification:
+        steps = "; ".join(f"{source} -{label}-> {target}" for source, label, target in justification)
+        line += f" Because: {steps}"
+    return line
+
+def _event_nodes(event: Dict[str, Any]) -> Iterable[str]:
+    """Yields the node IDs an event refers to, including those in its justification."""
+    params = event["params"]
+    for key in NODE_KEYS:
+        if key in params:
+            yield params[key]
+    result = event["result"]
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict):
+                for key in NODE_KEYS:
+                    if key in item:
+                        yield item[key]
+    for source_id, _, target_id in event.get("justification") or ():
+        yield source_id
+        yield target_id
+
+class EventIndex:
+    """
+    EventIndex v0.1: The Indexed Trace.
+
+    The monitor's in-memory event store. Every event gets a sequence number,
+    which serves as a cursor. Events are indexed by module, action and the
+    nodes they mention, and their formatted lines are cached on first use.
+    Tailing the trace from a cursor therefore costs only the new events.
+
+    With a capacity, only the newest events are kept, in a ring of that many
+    slots, so every held event is still found in O(1). Index entries for
+    evicted events are swept out once per capacity's worth of writes.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Args:
+            capacity (int, optional): Maximum number of events held. Unbounded by default.
+        """
+        self._capacity = capacity
+        self.clear()
+        self._next_seq = 0
+
+    def clear(self):
+        """Drops every held event. Sequence numbers keep counting, so cursors stay valid."""
+        self._events: List[Optional[Dict[str, Any]]] = [None] * self._capacity if self._capacity else []
+        self._lines: List[Optional[str]] = [None] * self._capacity if self._capacity else []
+        self._by_module: Dict[str, List[int]] = {}
+        self._by_action: Dict[str, List[int]] = {}
+        self._by_node: Dict[str, List[int]] = {}
+        self._first_seq = getattr(self, "_next_seq", 0)
+        self._evicted_since_sweep = 0
+
+    def __len__(self) -> int:
+        return self._next_seq - self._first_seq
+
+    def _slot(self, seq: int) -> int:
+        """The position of a held event in the event and line lists."""
+        return seq % self._capacity if self._capacity else seq - self._first_seq
+
+    @property
+    def cursor(self) -> int:
+        """The sequence number the next event will receive."""
+        return self._next_seq
+
+    def write(self, event: Dict[str, Any]):
+        seq = self._next_seq
+        self._next_seq += 1
+        if self._capacity:
+            if seq - self._first_seq == self._capacity:
+                self._first_seq += 1
+                self._evicted_since_sweep += 1
+            self._events[seq % self._capacity] = event
+            self._lines[seq % self._capacity] = None
+        else:
+            self._events.append(event)
+            self._lines.append(None)
+
+        self._by_module.setdefault(event["module"], []).append(seq)
+        self._by_action.setdefault(event["action"], []).append(seq)
+        for node_id in dict.fromkeys(_event_nodes(event)):
+            self._by_node.setdefault(node_id, []).append(seq)
+
+        if self._capacity and self._evicted_since_sweep >= self._capacity:
+            self._sweep()
+
+    def _sweep(self):
+        """Removes index entries that point at evicted events."""
+        first = self._first_seq
+        for index in (self._by_module, self._by_action, self._by_node):
+            for key in list(index):
+                seqs = index[key]
+                if seqs[-1] < first:
+                    del index[key]
+                elif seqs[0] < first:
+                    del seqs[:self._position(seqs, first)]
+        self._evicted_since_sweep = 0
+
+    @staticmethod
+    def _position(seqs: List[int], seq: int) -> int:
+        lo, hi = 0, len(seqs)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if seqs[mid] < seq:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def events(self) -> List[Dict[str, Any]]:
+        if not self._capacity:
+            return list(self._events)
+        return [self._events[self._slot(seq)] for seq in range(self._first_seq, self._next_seq)]
+
+    def get(self, seq: int) -> Optional[Dict[str, Any]]:
+        """Returns the event with a sequence number, if it is still held."""
+        if self._first_seq <= seq < self._next_seq:
+            return self._events[self._slot(seq)]
+        return None
+
+    def line(self, seq: int) -> str:
+        """Returns the formatted line of a held event, formatting it only once."""
+        i = self._slot(seq)
+        line = self._lines[i]
+        if line is None:
+            line = format_event(self._events[i])
+            self._lines[i] = line
+        return line
+
+    def seqs_since(self, cursor: int, limit: Optional[int] = None) -> range:
+        """Returns the held sequence numbers from a cursor onwards."""
+        start = max(cursor, self._first_seq)
+        end = self._next_seq if limit is None else min(self._next_seq, start + limit)
+        return range(start, max(start, end))
+
+    def seqs_for(self, module: Optional[str] = None, action: Optional[str] = None,
+                 node_id: Optional[str] = None) -> List[int]:
+        """Returns the held sequence numbers matching every given filter, in order."""
+        candidates = []
+        for index, key in ((self._by_module, module), (self._by_action, action), (self._by_node, node_id)):
+            if key is not None:
+                candidates.append(index.get(key, []))
+        if not candidates:
+            return list(self.seqs_since(0))
+        candidates.sort(key=len)
+        others = [set(seqs) for seqs in candidates[1:]]
+        first = self._first_seq
+        return [seq for seq in candidates[0] if seq >= first and all(seq in other for other in others)]
+
+    def seqs_between(self, start: Optional[datetime.datetime] = None,
+                     end: Optional[datetime.datetime] = None) -> range:
+        """Returns the held sequence numbers timestamped within [start, end)."""
+        return range(self._bisect_time(start, self._first_seq), self._bisect_time(end, self._next_seq))
+
+    def _bisect_time(self, bound: Optional[datetime.datetime], default: int) -> int:
+        if bound is None:
+            return default
+        key = bound.astimezone(datetime.timezone.utc).isoformat(timespec="microseconds")
+        lo, hi = self._first_seq, self._next_seq
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._events[self._slot(mid)]["timestamp"] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
@@ -0,0 +1,57 @@
+# src/sensory/models.py
+
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# A short text that exercises both extraction paths (is_a and has_property).
+WARM_UP_TEXT = "The cat is an animal. The sky is blue."
+
+# Pipelines loaded in this process, shared by every TextParser.
+_models: Dict[str, "Language"] = {}
+_lock = threading.Lock()
+
+def get_model(name: str = DEFAULT_MODEL) -> "Language":
+    """
+    Returns the process-wide spaCy pipeline for a model, loading it (and
+    spaCy itself) on first use. Later calls, from any parser or thread,
+    share the same pipeline.
+
+    Args:
+        name (str): The spaCy model package, e.g. "en_core_web_sm".
+
+    Raises:
+        OSError: If the model is not installed.
+    """
+    nlp = _models.get(name)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(name)
+            if nlp is None:
+                import spacy
+                nlp = spacy.load(name)
+                _models[name] = nlp
+    return nlp
+
+def warm_up(name: str = DEFAULT_MODEL, text: str = WARM_UP_TEXT) -> "Language":
+    """
+    Loads a model and runs a short text through it, so the first real parse
+    does not pay for any lazy initialization inside the pipeline. Call it at
+    service startup, off the request path.
+    """
+    nlp = get_model(name)
+    nlp(text)
+    return nlp
+
+def loaded_models() -> List[str]:
+    """Returns the names of the models loaded in this process."""
+    return list(_models)
+
+def unload_model(name: str = DEFAULT_MODEL):
+    """Drops a model from the registry. Parsers already holding it keep it."""
+    with _lock:
+        _models.pop(name, None)
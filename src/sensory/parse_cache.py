@@ -0,0 +1,139 @@
+# src/sensory/parse_cache.py
+
+import json
+import sqlite3
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Triplet = Tuple[str, str, str]
+
+# Number of keys per SQL statement, below SQLite's host parameter limit.
+_QUERY_BATCH = 500
+
+class ParseCache:
+    """
+    ParseCache v0.1: Content-Addressed Parse Results.
+
+    An on-disk SQLite table mapping each sentence to the triplets extracted
+    from it, so sentences already seen in an earlier ingest skip spaCy
+    entirely. Keys are SHA-256 digests of the sentence together with a
+    namespace naming the parser and model versions (see
+    TextParser.cache_namespace), so upgrading either starts a fresh cache.
+
+    The table is bounded: once it holds more than max_entries sentences,
+    the least recently used ones are evicted. New entries are buffered and
+    written in batches; call flush() (or close()) to persist them.
+    """
+
+    def __init__(self, path: str, namespace: str, max_entries: int = 1_000_000):
+        """
+        Opens (or creates) a cache file.
+
+        Args:
+            path (str): The SQLite database file.
+            namespace (str): Identifies the parser and model that produced
+                the cached results.
+            max_entries (int): The maximum number of sentences kept.
+        """
+        self.path = path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS parses (key BLOB PRIMARY KEY, triplets TEXT NOT NULL, used INTEGER NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS parses_used ON parses (used)")
+        self._clock = self._db.execute("SELECT COALESCE(MAX(used), 0) FROM parses").fetchone()[0]
+        self._entries = self._db.execute("SELECT COUNT(*) FROM parses").fetchone()[0]
+        self._unsaved: Dict[bytes, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, sentence: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{sentence}".encode("utf-8")).digest()
+
+    @staticmethod
+    def _decode(triplets: str) -> List[Triplet]:
+        return [tuple(triplet) for triplet in json.loads(triplets)]
+
+    def get_many(self, sentences: Iterable[str]) -> Dict[str, List[Triplet]]:
+        """
+        Looks up many sentences at once and marks the hits as recently used.
+
+        Returns:
+            The cached triplets of each sentence that was found. A sentence
+            that yielded no triplets maps to an empty list.
+        """
+        wanted = {self._key(sentence): sentence for sentence in sentences}
+        found: Dict[str, List[Triplet]] = {}
+        stored: List[bytes] = []
+        for key, sentence in wanted.items():
+            if key in self._unsaved:
+                found[sentence] = self._decode(self._unsaved[key])
+            else:
+                stored.append(key)
+
+        self._clock += 1
+        for i in range(0, len(stored), _QUERY_BATCH):
+            batch = stored[i:i + _QUERY_BATCH]
+            rows = self._db.execute(
+                f"SELECT key, triplets FROM parses WHERE key IN ({','.join('?' * len(batch))})", batch).fetchall()
+            for key, triplets in rows:
+                found[wanted[key]] = self._decode(triplets)
+            if rows:
+                self._db.execute(f"UPDATE parses SET used = ? WHERE key IN ({','.join('?' * len(rows))})",
+                                 [self._clock] + [key for key, _ in rows])
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        return found
+
+    def get(self, sentence: str) -> Optional[List[Triplet]]:
+        """Returns the cached triplets of one sentence, or None on a miss."""
+        return self.get_many([sentence]).get(sentence)
+
+    def put(self, sentence: str, triplets: Iterable[Triplet]):
+        """Records the triplets extracted from a sentence. Written on the next flush()."""
+        self._unsaved[self._key(sentence)] = json.dumps(list(triplets))
+        if len(self._unsaved) >= _QUERY_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered entries and evicts the least recently used ones past max_entries."""
+        if self._unsaved:
+            self._clock += 1
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO parses (key, triplets, used) VALUES (?, ?, ?)",
+                [(key, triplets, self._clock) for key, triplets in self._unsaved.items()])
+            self._entries += self._db.total_changes - before
+            self._unsaved = {}
+        excess = self._entries - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM parses WHERE key IN (SELECT key FROM parses ORDER BY used LIMIT ?)", (excess,))
+            self._entries -= excess
+            self.evictions += excess
+        self._db.commit()
+
+    def close(self):
+        """Flushes and closes the cache file."""
+        self.flush()
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._entries + len(self._unsaved)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the cache counters as a flat dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "entries": len(self),
+        }
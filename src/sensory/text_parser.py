@@ -1,35 +1,166 @@
 # In src/sensory/text_parser.py
 
-import spacy
-from typing import List, Tuple, Optional
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Tuple, Optional, Union
+from sensory.models import DEFAULT_MODEL, WARM_UP_TEXT, get_model
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Span, Token
+
+# Version of the extraction rules below. Bump it whenever they change, so
+# cached parse results (see sensory.parse_cache) are not reused.
+EXTRACTOR_VERSION = "1.6"
+
+# Pipeline components whose output triplet extraction never reads.
+UNUSED_PIPES = ("ner",)
+
+class _LabelIds(NamedTuple):
+    """
+    Integer IDs compared on the hot path instead of the string attributes
+    (token.lemma vs. token.lemma_), which would each need a string lookup.
+    """
+    be: int
+    nsubj: int
+    attr: int
+    acomp: int
+    noun: int
+    adj: int
+    det: int
+
+_label_ids: Optional[_LabelIds] = None
+
+def _load_label_ids() -> _LabelIds:
+    """Looks up the IDs once. Deferred so that importing this module does not import spaCy."""
+    global _label_ids
+    from spacy.strings import hash_string
+    from spacy import symbols
+    _label_ids = _LabelIds(hash_string("be"), symbols.nsubj, symbols.attr, symbols.acomp,
+                           symbols.NOUN, symbols.ADJ, symbols.DET)
+    return _label_ids
+
+# Every form of "be" (including contractions and negations) a sentence
+# needs before extraction can yield a triplet from it.
+COPULA_PATTERN = re.compile(
+    r"\b(?:am|is|are|was|were|be|been|being)(?:n['’]t)?\b|['’](?:s|re|m)\b",
+    re.IGNORECASE,
+)
+
+# Number of distinct phrases whose canonical form is memoized.
+CANONICAL_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonicalize_entity(phrase: str) -> str:
+    """
+    Converts a phrase to its canonical form: lowercased, with runs of
+    whitespace collapsed and leading articles removed (e.g., "The  Cat" -> "cat").
+    Entity phrases repeat heavily in a corpus, so results are memoized.
+    """
+    phrase = " ".join(phrase.lower().split())
+    for article in ("a ", "an ", "the "):
+        if phrase.startswith(article):
+            phrase = phrase[len(article):]
+    return phrase.strip()
+
+def _phrase(token: "Token") -> str:
+    """Returns the text of a token's subtree, sliced from the document text."""
+    start = token.left_edge.idx
+    right = token.right_edge
+    return token.doc.text[start:right.idx + len(right)]
 
 class TextParser:
     """
-    TextParser v1.3: Canonicalization.
+    TextParser v1.7: Single-Pass Extraction.
 
     This version adds entity canonicalization to ensure that different phrases
     referring to the same concept (e.g., "a cat", "The cat") are resolved
     to a single, standard representation (e.g., "cat").
+
+    v1.4: Triplets can be extracted from an already-parsed Doc or sentence
+    Span, so callers that have parsed a text once need not parse it again.
+
+    v1.5: A faster extraction path. Phrases are sliced from the document
+    text by token offsets instead of joined token by token, labels are
+    compared as integer IDs, canonical forms are memoized in a bounded LRU
+    cache, and iter_triplets() yields unique triplets in document order
+    without building intermediate lists. Phrases keep their original
+    spacing (e.g., "dog's", not "dog 's").
+
+    v1.6: A cheap lexical pre-filter. split_sentences() runs only a
+    tokenizer and a rule-based sentencizer, and is_candidate() checks a
+    sentence for a copula, so sentences that cannot yield a triplet never
+    reach the full pipeline (see Learner's prefilter option).
+
+    v1.7: The spaCy model is loaded on first use rather than in the
+    constructor, from a process-wide registry (see sensory.models), so all
+    parsers share one pipeline and code that never parses never loads it.
     """
 
-    def __init__(self):
-        """Initializes the parser by loading a spaCy model."""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            print("TextParser v1.3 initialized with 'en_core_web_sm' model.")
-        except OSError:
-            print("spaCy model 'en_core_web_sm' not found.")
-            print("Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
-
-    def _canonicalize_entity(self, phrase: str) -> str:
-        """Converts a phrase to its canonical form."""
-        phrase = phrase.lower().strip()
-        articles = ["a ", "an ", "the "]
-        for article in articles:
-            if phrase.startswith(article):
-                phrase = phrase[len(article):]
-        return phrase.strip()
+    def __init__(self, model_name: str = DEFAULT_MODEL, warm_up: bool = False):
+        """
+        Initializes the parser. The spaCy model is loaded when first needed.
+
+        Args:
+            model_name (str): The spaCy model to use.
+            warm_up (bool): Load the model and run a sample text through it now.
+        """
+        self.model_name = model_name
+        self._nlp = None
+        self._load_failed = False
+        self._splitter = None
+        print(f"TextParser v1.7 initialized for the '{model_name}' model.")
+        if warm_up and self.nlp is not None:
+            self.nlp(WARM_UP_TEXT)
+
+    @property
+    def nlp(self):
+        """The shared spaCy pipeline, or None if the model is not installed."""
+        if self._nlp is None and not self._load_failed:
+            try:
+                self._nlp = get_model(self.model_name)
+            except OSError:
+                print(f"spaCy model '{self.model_name}' not found.")
+                print(f"Please run: python -m spacy download {self.model_name}")
+                self._load_failed = True
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp):
+        self._nlp = nlp
+        self._load_failed = nlp is None
+
+    def unused_pipes(self) -> List[str]:
+        """Returns the loaded pipeline components that extraction can skip."""
+        if not self.nlp:
+            return []
+        return [name for name in self.nlp.pipe_names if name in UNUSED_PIPES]
+
+    def split_sentences(self, text: str) -> List[str]:
+        """
+        Splits text into sentences with a tokenizer and punctuation rules
+        only. This is far cheaper than a dependency parse, and needs no model.
+        """
+        if self._splitter is None:
+            import spacy
+            self._splitter = spacy.blank(self._nlp.lang if self._nlp is not None else "en")
+            self._splitter.add_pipe("sentencizer")
+        return [sentence.text for sentence in self._splitter(text).sents if not sentence.text.isspace()]
+
+    def cache_namespace(self) -> str:
+        """
+        Identifies the model and extraction rules, for keying cached results.
+
+        Example: "spacy-3.8.7/en_core_web_sm-3.8.0/extractor-1.6"
+        """
+        import spacy
+        nlp = self.nlp
+        model = f"{nlp.lang}_{nlp.meta.get('name')}-{nlp.meta.get('version')}" if nlp else "none"
+        return f"spacy-{spacy.__version__}/{model}/extractor-{EXTRACTOR_VERSION}"
+
+    @staticmethod
+    def is_candidate(sentence: str) -> bool:
+        """Checks whether a sentence contains a copula, without which it cannot yield a triplet."""
+        return COPULA_PATTERN.search(sentence) is not None
 
     def extract_triplets(self, sentence: str) -> List[Tuple[str, str, str]]:
         """
@@ -39,40 +170,56 @@ class TextParser:
         if not self.nlp:
             return []
 
-        doc = self.nlp(sentence.strip())
-        triplets = []
+        doc = self.nlp(sentence.strip(), disable=self.unused_pipes())
+        return self.extract_triplets_from_doc(doc)
+
+    def extract_triplets_from_doc(self, doc: Union["Doc", "Span"]) -> List[Tuple[str, str, str]]:
+        """
+        Extracts knowledge triplets from text that has already been parsed.
+
+        Args:
+            doc (Doc or Span): A parsed document, or one sentence of it
+                (e.g., an item of doc.sents).
+
+        Returns:
+            A list of unique, canonicalized (subject, relation, object)
+            triplets, in document order.
+        """
+        return list(self.iter_triplets(doc))
 
+    def iter_triplets(self, doc: Union["Doc", "Span"]) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yields the unique, canonicalized (subject, relation, object) triplets
+        of a parsed document or sentence, in document order.
+        """
+        ids = _label_ids or _load_label_ids()
+        seen = set()
         for token in doc:
-            if token.lemma_ == "be":
-                subjects = [child for child in token.children if child.dep_ == "nsubj"]
-                attributes = [child for child in token.children if child.dep_ in ("attr", "acomp")]
-
-                if subjects and attributes:
-                    subject_phrase = " ".join(t.text for t in subjects[0].subtree).strip()
-                    attribute_phrase = " ".join(t.text for t in attributes[0].subtree).strip()
-
-                    is_a_candidate = False
-                    if attributes[0].pos_ == "NOUN":
-                        is_a_candidate = True
-                    first_child_of_attr = next(attributes[0].children, None)
-                    if first_child_of_attr and first_child_of_attr.pos_ == "DET":
-                        is_a_candidate = True
-                    
-                    if is_a_candidate:
-                        # Apply canonicalization
-                        canonical_subject = self._canonicalize_entity(subject_phrase)
-                        canonical_object = self._canonicalize_entity(attribute_phrase)
-                        triplets.append((canonical_subject, "is_a", canonical_object))
-                    
-                    elif attributes[0].pos_ == "ADJ":
-                        # Apply canonicalization
-                        canonical_subject = self._canonicalize_entity(subject_phrase)
-                        canonical_object = self._canonicalize_entity(attribute_phrase)
-                        triplets.append((canonical_subject, "has_property", canonical_object))
-
-        return self._clean_triplets(triplets) # _clean_triplets still useful for deduplication
-    
-    def _clean_triplets(self, triplets: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str]]:
-        """A helper to remove duplicates and clean up text."""
-        # This function is now simpler as canonicalization handles most of the work.
-        return list(set(triplets)) # Use set for efficient deduplication
\ No newline at end of file
+            if token.lemma != ids.be:
+                continue
+            subject = attribute = None
+            for child in token.children:
+                dep = child.dep
+                if subject is None and dep == ids.nsubj:
+                    subject = child
+                elif attribute is None and (dep == ids.attr or dep == ids.acomp):
+                    attribute = child
+            if subject is None or attribute is None:
+                continue
+
+            pos = attribute.pos
+            if pos == ids.noun:
+                relation = "is_a"
+            else:
+                first_child_of_attr = next(attribute.children, None)
+                if first_child_of_attr is not None and first_child_of_attr.pos == ids.det:
+                    relation = "is_a"
+                elif pos == ids.adj:
+                    relation = "has_property"
+                else:
+                    continue
+
+            triplet = (canonicalize_entity(_phrase(subject)), relation, canonicalize_entity(_phrase(attribute)))
+            if triplet not in seen:
+                seen.add(triplet)
+                yield triplet
@@ -0,0 +1,39 @@
+# tests/causal/test_cache.py
+
+from causal.cache import AncestorCache
+
+def test_get_put_and_counters():
+    """Tests basic storage and the hit/miss counters."""
+    cache = AncestorCache()
+    assert cache.get("cat") is None
+    cache.put("cat", frozenset({"animal"}))
+    assert cache.get("cat") == frozenset({"animal"})
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_lru_eviction_respects_member_limit():
+    """Tests that the least recently used entries are evicted first."""
+    cache = AncestorCache(max_members=4)
+    cache.put("a", frozenset({"x", "y"}))
+    cache.put("b", frozenset({"x", "y"}))
+    cache.get("a")  # "b" is now the least recently used.
+    cache.put("c", frozenset({"z"}))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["members"] == 3
+
+def test_oversized_entry_is_not_cached():
+    """Tests that an entry larger than the whole limit is skipped."""
+    cache = AncestorCache(max_members=1)
+    cache.put("a", frozenset({"x", "y"}))
+    assert len(cache) == 0
+
+def test_invalidate():
+    """Tests that invalidation only counts entries that were present."""
+    cache = AncestorCache()
+    cache.put("a", frozenset({"x"}))
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 1
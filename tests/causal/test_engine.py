@@ -57,4 +57,52 @@ def test_deduce_on_unrelated_node(reasoning_setup):
 def test_deduce_on_nonexistent_node(reasoning_setup):
     """Tests behavior with a node that does not exist in memory."""
     _, engine = reasoning_setup
-    assert engine.deduce_property("Plato", "mortal") is False
\ No newline at end of file
+    assert engine.deduce_property("Plato", "mortal") is False
+
+def test_cache_hits_and_invalidation(reasoning_setup):
+    """Tests that repeated questions hit the cache and new 'is_a' facts invalidate it."""
+    memory, engine = reasoning_setup
+    memory.add_relationship("Plato", "human", "is_a")
+    assert engine.deduce_property("Socrates", "mortal") is True
+    assert engine.deduce_property("Socrates", "animal") is True
+    assert engine.deduce_property("Plato", "mortal") is True
+    assert engine.deduce_property("stone", "mortal") is False
+    stats = engine.cache_stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 1
+
+    # Only "human" and its descendants are affected by this new edge.
+    memory.add_relationship("human", "thinker", "is_a")
+    assert engine.cache_stats()["invalidations"] == 2
+    assert engine.deduce_property("Socrates", "thinker") is True
+    assert engine.deduce_property("stone", "thinker") is False
+    assert engine.cache_stats()["hits"] == 2
+
+def test_cached_answers_match_uncached():
+    """Tests that the cached engine answers exactly like the uncached one."""
+    import random
+    rng = random.Random(3)
+    memory = MemoryCore()
+    cached = CausalEngine(memory, cache_limit=50)
+    uncached = CausalEngine(memory, cache_limit=0)
+    for _ in range(300):
+        memory.add_relationship(f"n{rng.randrange(60)}", f"n{rng.randrange(60)}", rng.choice(["is_a", "has_property"]))
+        source, prop = f"n{rng.randrange(60)}", f"n{rng.randrange(60)}"
+        assert cached.deduce_property(source, prop) == uncached.deduce_property(source, prop)
+    assert uncached.cache_stats() == {}
+    assert cached.cache_stats()["evictions"] > 0
+
+def test_deduce_property_explains_its_answer(reasoning_setup):
+    """Tests that the justification chain comes from the same traversal."""
+    memory, engine = reasoning_setup
+    memory.add_relationship("Socrates", "wise", "has_property")
+    memory.add_relationship("Socrates", "mortal", "is_a")  # A shortcut.
+
+    assert engine.deduce_property("Socrates", "wise", explain=True) == (
+        True, [("Socrates", "has_property", "wise")])
+    assert engine.deduce_property("Socrates", "animal", explain=True) == (
+        True, [("Socrates", "is_a", "human"), ("human", "is_a", "mammal"), ("mammal", "is_a", "animal")])
+    assert engine.deduce_property("Socrates", "mortal", explain=True) == (
+        True, [("Socrates", "is_a", "mortal")])
+    assert engine.deduce_property("human", "human", explain=True) == (True, [])
+    assert engine.deduce_property("stone", "mortal", explain=True) == (False, None)
@@ -0,0 +1,137 @@
+# tests/causal/test_properties.py
+
+import random
+from memory.core import MemoryCore
+from causal.engine import CausalEngine
+from causal.properties import PropertyClosure
+
+def test_inherited_property_and_holder():
+    """Tests that a property held by an ancestor is inherited, with its holder."""
+    memory = MemoryCore()
+    memory.add_relationship("cat", "animal", "is_a")
+    memory.add_relationship("animal", "alive", "has_property")
+    closure = PropertyClosure(memory)
+    assert closure.holder("cat", "alive") == "animal"
+    assert closure.holder("animal", "alive") == "animal"
+    assert closure.holder("alive", "alive") is None
+    assert closure.properties("cat") == ["alive"]
+
+def test_incremental_updates_in_either_order():
+    """Tests that new facts update a built table, whichever fact comes first."""
+    memory = MemoryCore()
+    closure = PropertyClosure(memory)
+    assert closure.ready and closure.holder("cat", "alive") is None
+
+    memory.add_relationship("animal", "alive", "has_property")
+    memory.add_relationship("cat", "animal", "is_a")
+    memory.add_relationship("kitten", "cat", "is_a")
+    assert closure.holder("kitten", "alive") == "animal"
+
+    memory.add_relationship("mammal", "warm-blooded", "has_property")
+    memory.add_relationship("cat", "mammal", "is_a")
+    assert closure.holder("kitten", "warm-blooded") == "mammal"
+
+    # A direct fact becomes the node's own holder.
+    memory.add_relationship("cat", "alive", "has_property")
+    assert closure.holder("cat", "alive") == "cat"
+
+def test_cycles_terminate():
+    """Tests that properties spread around an 'is_a' cycle without looping."""
+    memory = MemoryCore()
+    memory.add_relationship("a", "b", "is_a")
+    memory.add_relationship("b", "a", "is_a")
+    closure = PropertyClosure(memory)
+    memory.add_relationship("b", "p", "has_property")
+    assert closure.holder("a", "p") == "b"
+
+def test_matches_naive_ancestor_scan():
+    """Tests the incrementally maintained table against a scan of each node's ancestors."""
+    rng = random.Random(3)
+    memory = MemoryCore()
+    engine = CausalEngine(memory, cache_limit=0)
+    closure = PropertyClosure(memory)
+    for _ in range(300):
+        a, b = f"n{rng.randrange(40)}", f"n{rng.randrange(40)}"
+        if rng.random() < 0.3:
+            memory.add_relationship(a, f"p{rng.randrange(5)}", "has_property")
+        else:
+            memory.add_relationship(a, b, "is_a")
+    built = PropertyClosure(memory)  # Built in one pass from the same facts.
+    for i in range(40):
+        node = f"n{i}"
+        holders = {node} | set(engine.get_ancestors(node))
+        expected = {p for h in holders for p in memory.query_relationships(h, "has_property")}
+        assert set(closure.properties(node)) == expected
+        assert set(built.properties(node)) == expected
+        for p in expected:
+            assert memory.has_relationship(built.holder(node, p), p, "has_property")
+            assert built.holder(node, p) in holders
+
+def test_engine_explains_inherited_property():
+    """Tests the justification for an inherited property."""
+    memory = MemoryCore()
+    memory.add_relationship("cat", "mammal", "is_a")
+    memory.add_relationship("mammal", "animal", "is_a")
+    memory.add_relationship("animal", "alive", "has_property")
+    engine = CausalEngine(memory)
+    memory.add_relationship("mammal", "warm-blooded", "has_property")
+
+    assert engine.deduce_property("cat", "alive", explain=True) == (
+        True, [("cat", "is_a", "mammal"), ("mammal", "is_a", "animal"), ("animal", "has_property", "alive")])
+    assert engine.deduce_property("cat", "warm-blooded") is True
+    assert engine.deduce_properties("cat", ["alive", "animal", "stone"]) == {
+        "alive": True, "animal": True, "stone": False}
+    assert CausalEngine(memory, inherit_properties=False).deduce_property("cat", "alive") is False
+
+def test_overflow_falls_back_to_ancestor_search():
+    """Tests that a table past its size limit is dropped and answers come from the ancestry."""
+    memory = MemoryCore()
+    for i in range(10):
+        memory.add_relationship(f"n{i}", f"n{(i + 1) % 10}", "is_a")  # One big cycle.
+        memory.add_relationship(f"n{i}", f"p{i}", "has_property")
+    engine = CausalEngine(memory)
+    engine._properties = PropertyClosure(memory, max_entries=20)
+    assert engine.deduce_property("n0", "p5", explain=True) == (
+        True, [("n0", "is_a", "n1"), ("n1", "is_a", "n2"), ("n2", "is_a", "n3"), ("n3", "is_a", "n4"),
+               ("n4", "is_a", "n5"), ("n5", "has_property", "p5")])
+    assert engine._properties.overflowed
+    memory.add_relationship("n3", "q", "has_property")
+    assert engine.deduce_property("n7", "q") is True
+    assert engine.deduce_property("n7", "r") is False
+
+def test_cyclic_graph_overflows_before_spreading(monkeypatch):
+    """Tests that a table bound to overflow is never spread, so the first question stays cheap."""
+    rng = random.Random(8)
+    memory = MemoryCore()
+    for i in range(2000):
+        memory.add_relationship(f"n{rng.randrange(300)}", f"n{rng.randrange(300)}", "is_a")
+        memory.add_relationship(f"n{rng.randrange(300)}", f"p{i}", "has_property")
+    lookups = []
+    query_sources = memory.query_sources
+    monkeypatch.setattr(memory, "query_sources", lambda *args: lookups.append(args) or query_sources(*args))
+    engine = CausalEngine(memory, inherit_properties=False)
+    engine._properties = PropertyClosure(memory, max_entries=10_000)
+
+    holder = next(node for node in engine.get_ancestors("n0")
+                  if node != "n0" and memory.query_relationships(node, "has_property"))
+    prop = memory.query_relationships(holder, "has_property")[0]
+    assert engine.deduce_property("n0", prop) is True
+    assert engine._properties.overflowed
+    assert lookups == []
+
+def test_deferred_build_searches_the_ancestry_until_built():
+    """Tests that with build_properties=False nothing is built until build_property_closure()."""
+    memory = MemoryCore()
+    memory.add_relationship("cat", "animal", "is_a")
+    memory.add_relationship("animal", "alive", "has_property")
+    engine = CausalEngine(memory, build_properties=False)
+    assert not engine._properties.ready
+    assert engine.deduce_property("cat", "alive", explain=True) == (
+        True, [("cat", "is_a", "animal"), ("animal", "has_property", "alive")])
+    assert not engine._properties.ready  # Questions never trigger the build.
+
+    engine.build_property_closure()
+    memory.add_relationship("kitten", "cat", "is_a")
+    assert engine._properties.ready
+    assert engine._properties.holder("kitten", "alive") == "animal"
+    assert engine.deduce_property("kitten", "alive") is True
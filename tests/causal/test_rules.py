@@ -0,0 +1,102 @@
+# tests/causal/test_rules.py
+
+import random
+import pytest
+from memory import create_memory
+from causal.engine import CausalEngine
+from causal.rules import DEFAULT_RULES, Rule, RuleEngine, inheritance, transitivity
+
+@pytest.fixture(params=["networkx", "compact"])
+def memory(request):
+    return create_memory(request.param)
+
+def test_rule_validation():
+    """Tests that malformed rules are rejected."""
+    with pytest.raises(ValueError):
+        Rule(("?x", "is_a", "?z"), [])
+    with pytest.raises(ValueError):
+        Rule(("?x", "?label", "?z"), [("?x", "is_a", "?z")])
+    with pytest.raises(ValueError):
+        Rule(("?x", "is_a", "?w"), [("?x", "is_a", "?z")])
+    assert str(transitivity("part_of")) == "?x part_of ?z <- ?x part_of ?y, ?y part_of ?z"
+
+def test_materializes_transitive_closure(memory):
+    """Tests that transitivity is derived up front and kept apart from asserted facts."""
+    memory.add_relationship("Paris", "France", "part_of")
+    memory.add_relationship("France", "Europe", "part_of")
+    memory.add_relationship("Europe", "Earth", "part_of")
+    rules = RuleEngine(memory, [transitivity("part_of")])
+    assert rules.materialize() == 3
+    assert rules.holds("Paris", "part_of", "Earth")
+    assert rules.is_derived("Paris", "part_of", "Earth")
+    assert not rules.is_derived("Paris", "part_of", "France")
+    assert not memory.has_relationship("Paris", "Earth", "part_of")
+    assert sorted(rules.query_relationships("Paris", "part_of")) == ["Earth", "Europe", "France"]
+    assert sorted(rules.query_sources("Earth", "part_of")) == ["Europe", "France", "Paris"]
+    assert rules.explain("Paris", "part_of", "Earth") == [
+        ("Paris", "part_of", "France"), ("France", "part_of", "Europe"), ("Europe", "part_of", "Earth")]
+    assert rules.explain("Earth", "part_of", "Paris") is None
+
+def test_new_facts_derive_only_their_consequences(memory):
+    """Tests that a fact added after materialization is a delta of one."""
+    rules = RuleEngine(memory, DEFAULT_RULES)
+    memory.add_relationship("mammal", "animal", "is_a")
+    memory.add_relationship("animal", "alive", "has_property")
+    rules.materialize()
+    rounds = rules.rounds
+    memory.add_relationship("cat", "mammal", "is_a")
+    assert rules.holds("cat", "is_a", "animal")
+    assert rules.holds("cat", "has_property", "alive")
+    # cat is_a animal, cat has_property alive, then a round that derives nothing.
+    assert rules.rounds - rounds == 2
+    memory.add_relationship("unrelated", "thing", "causes")
+    assert rules.rounds - rounds == 2
+
+def test_retract_and_change_rules(memory):
+    """Tests that derived facts are dropped in one step and derived again on demand."""
+    memory.add_relationship("Paris", "France", "located_in")
+    memory.add_relationship("France", "Europe", "part_of")
+    rules = RuleEngine(memory, [transitivity("part_of")])
+    assert not rules.holds("Paris", "located_in", "Europe")
+    located = Rule(("?x", "located_in", "?z"), [("?x", "located_in", "?y"), ("?y", "part_of", "?z")], "located")
+    assert rules.add_rule(located) == 1
+    assert rules.holds("Paris", "located_in", "Europe")
+    rules.retract_derived()
+    assert rules.stats()["derived"] == 0
+    assert rules.holds("Paris", "located_in", "Europe")  # Materialized again.
+    rules.remove_rule("located")
+    assert not rules.holds("Paris", "located_in", "Europe")
+
+def test_matches_backward_chaining_engine():
+    """Tests materialized answers against the search-based engine on a random graph with cycles."""
+    rng = random.Random(5)
+    plain_memory, rule_memory = create_memory("networkx"), create_memory("networkx")
+    plain = CausalEngine(plain_memory, cache_limit=0)
+    materialized = CausalEngine(rule_memory, rules=DEFAULT_RULES)
+    for step in range(400):
+        a = f"n{rng.randrange(40)}"
+        fact = (a, f"p{rng.randrange(5)}", "has_property") if rng.random() < 0.3 else (a, f"n{rng.randrange(40)}", "is_a")
+        plain_memory.add_relationship(*fact)
+        rule_memory.add_relationship(*fact)
+        if step == 100:
+            materialized.deduce_property("n0", "p0")  # Later facts arrive incrementally.
+    for i in range(40):
+        for target in [f"p{k}" for k in range(5)] + [f"n{k}" for k in range(0, 40, 7)]:
+            expected = plain.deduce_property(f"n{i}", target)
+            result, justification = materialized.deduce_property(f"n{i}", target, explain=True)
+            assert result == expected
+            if result and justification:
+                assert all(rule_memory.has_relationship(s, t, label) for s, label, t in justification)
+                assert justification[0][0] == f"n{i}" and justification[-1][2] == target
+
+def test_engine_with_partial_rule_set():
+    """Tests that questions no rule derives still use the search."""
+    memory = create_memory("networkx")
+    memory.add_relationship("cat", "mammal", "is_a")
+    memory.add_relationship("mammal", "animal", "is_a")
+    memory.add_relationship("animal", "alive", "has_property")
+    engine = CausalEngine(memory, rules=[inheritance("has_property", "is_a")])
+    assert engine.deduce_property("cat", "alive", explain=True) == (
+        True, [("cat", "is_a", "mammal"), ("mammal", "is_a", "animal"), ("animal", "has_property", "alive")])
+    assert engine.deduce_property("cat", "animal") is True
+    assert engine.deduce_properties("cat", ["alive", "stone"]) == {"alive": True, "stone": False}
@@ -0,0 +1,98 @@
+# tests/causal/test_taxonomy.py
+
+import random
+import pytest
+from memory.core import MemoryCore
+from causal.engine import CausalEngine
+from causal.taxonomy import TaxonomyIndex
+
+@pytest.fixture
+def taxonomy_memory():
+    """A small taxonomy with a tree part, a diamond and a cycle."""
+    memory = MemoryCore()
+    memory.add_relationship("Socrates", "human", "is_a")
+    memory.add_relationship("human", "mammal", "is_a")
+    memory.add_relationship("mammal", "animal", "is_a")
+    # Diamond: a platypus has two parents.
+    memory.add_relationship("platypus", "mammal", "is_a")
+    memory.add_relationship("platypus", "egg-layer", "is_a")
+    memory.add_relationship("egg-layer", "oviparous", "is_a")
+    # Cycle from noisy ingestion.
+    memory.add_relationship("a", "b", "is_a")
+    memory.add_relationship("b", "a", "is_a")
+    memory.add_relationship("b", "c", "is_a")
+    return memory
+
+def test_tree_dag_and_cycle_subsumption(taxonomy_memory):
+    """Tests interval (tree), extra-set (DAG) and cyclic lookups."""
+    index = TaxonomyIndex(taxonomy_memory)
+    assert index.is_ancestor("animal", "Socrates")
+    assert not index.is_ancestor("Socrates", "animal")
+    assert index.is_ancestor("animal", "platypus")
+    assert index.is_ancestor("oviparous", "platypus")
+    assert not index.is_ancestor("oviparous", "human")
+    assert index.is_ancestor("a", "a")
+    assert index.is_ancestor("c", "a")
+    assert not index.is_ancestor("human", "human")
+    assert not index.is_ancestor("animal", "unknown")
+
+def test_leaf_patch_and_staleness(taxonomy_memory):
+    """Tests that leaf edges are patched and other edges mark the index stale."""
+    index = TaxonomyIndex(taxonomy_memory)
+    taxonomy_memory.add_relationship("Plato", "human", "is_a")
+    taxonomy_memory.add_relationship("Socrates", "philosopher", "is_a")
+    taxonomy_memory.add_relationship("Socrates", "wise", "has_property")
+    assert index.is_fresh
+    assert index.is_ancestor("animal", "Plato")
+    assert index.is_ancestor("philosopher", "Socrates")
+
+    taxonomy_memory.add_relationship("animal", "living thing", "is_a")
+    assert not index.is_fresh
+    index.refresh()
+    assert index.is_fresh
+    assert index.is_ancestor("living thing", "Plato")
+
+def test_engine_matches_bfs_on_random_dag():
+    """Tests that the frozen taxonomy gives the same answers as the BFS."""
+    rng = random.Random(11)
+    memory = MemoryCore()
+    for i in range(1, 300):
+        for _ in range(rng.choice([1, 1, 1, 2, 3])):
+            memory.add_relationship(f"n{i}", f"n{rng.randrange(i)}", "is_a")
+    memory.add_relationship("n5", "n250", "is_a")  # Introduce a cycle.
+    indexed = CausalEngine(memory)
+    indexed.freeze_taxonomy(auto_rebuild=True)
+    plain = CausalEngine(memory, cache_limit=0)
+    for _ in range(2000):
+        source, prop = f"n{rng.randrange(300)}", f"n{rng.randrange(300)}"
+        assert indexed.deduce_property(source, prop) == plain.deduce_property(source, prop)
+    memory.add_relationship("n3", "n299", "is_a")
+    for i in range(300):
+        assert indexed.deduce_property(f"n{i}", "n299") == plain.deduce_property(f"n{i}", "n299")
+
+def test_explained_answers_use_the_frozen_taxonomy(taxonomy_memory, monkeypatch):
+    """Tests that explain=True decides with the index and never searches the whole ancestry."""
+    taxonomy_memory.add_relationship("mammal", "warm-blooded", "has_property")
+    engine = CausalEngine(taxonomy_memory, cache_limit=0)
+    engine.freeze_taxonomy()
+    monkeypatch.setattr(engine, "_compute_ancestors", lambda source_id: pytest.fail("BFS over the ancestry"))
+    assert engine.deduce_property("Socrates", "animal", explain=True) == (
+        True, [("Socrates", "is_a", "human"), ("human", "is_a", "mammal"), ("mammal", "is_a", "animal")])
+    assert engine.deduce_property("platypus", "oviparous", explain=True) == (
+        True, [("platypus", "is_a", "egg-layer"), ("egg-layer", "is_a", "oviparous")])
+    assert engine.deduce_property("a", "c", explain=True) == (True, [("a", "is_a", "b"), ("b", "is_a", "c")])
+    assert engine.deduce_property("human", "warm-blooded", explain=True) == (
+        True, [("human", "is_a", "mammal"), ("mammal", "has_property", "warm-blooded")])
+    assert engine.deduce_property("Socrates", "oviparous", explain=True) == (False, None)
+
+def test_refreezing_reuses_the_index(taxonomy_memory):
+    """Tests that freezing again refreshes the existing index instead of registering another listener."""
+    engine = CausalEngine(taxonomy_memory)
+    index = engine.freeze_taxonomy()
+    listeners = len(taxonomy_memory._listeners)
+    taxonomy_memory.add_relationship("animal", "organism", "is_a")
+    assert not index.is_fresh
+    assert engine.freeze_taxonomy(auto_rebuild=True) is index
+    assert index.is_fresh and index.auto_rebuild
+    assert len(taxonomy_memory._listeners) == listeners
+    assert engine.deduce_property("Socrates", "organism") is True
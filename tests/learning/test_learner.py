@@ -49,4 +49,121 @@ def test_learner_learns_and_kernel_reasons(learning_setup):
     assert kernel.ask_question("cat", "fluffy") is True
     
     # 3. The final, most important test: Is the chain of inference now complete?
-    assert kernel.ask_question("cat", "living thing") is True
\ No newline at end of file
+    assert kernel.ask_question("cat", "living thing") is True
+
+def test_iter_corpus_chunks_splits_on_articles_and_paragraphs(tmp_path):
+    """Tests that the streaming reader splits on article markers and paragraphs."""
+    from learning.learner import iter_corpus_chunks
+    corpus_file = tmp_path / "wiki.txt"
+    corpus_file.write_text(
+        "--- ARTICLE: Cat ---\nThe cat is an animal.\n\n"
+        "--- ARTICLE: Dog ---\nThe dog is loyal.\n\nThe dog is an animal.\n\n",
+        encoding="utf-8",
+    )
+    chunks = list(iter_corpus_chunks(str(corpus_file)))
+    assert len(chunks) == 2
+    assert "ARTICLE" not in "".join(chunks)
+    assert chunks[0].strip() == "The cat is an animal."
+
+    # With a small limit, articles are further split at paragraph boundaries,
+    # and over-long lines are cut at sentence ends.
+    corpus_file.write_text(
+        "Dogs are loyal.\n\nDogs are pets.\n\nA cat is small. A cat is cute.\n",
+        encoding="utf-8",
+    )
+    chunks = list(iter_corpus_chunks(str(corpus_file), max_chars=20))
+    assert [c.strip() for c in chunks] == [
+        "Dogs are loyal.\n\nDogs are pets.", "A cat is small.", "A cat is cute.",
+    ]
+
+def test_learner_streaming_mode(learning_setup):
+    """Tests that streaming ingestion learns the same facts."""
+    learner, kernel, corpus_path = learning_setup
+    learner.learn_from_corpus(corpus_path, streaming=True)
+    assert kernel.ask_question("cat", "animal") is True
+    assert kernel.ask_question("cat", "living thing") is True
+
+def test_parallel_parsing_is_deterministic(tmp_path):
+    """Tests that multi-process parsing adds the same facts in the same order."""
+    corpus_file = tmp_path / "wiki.txt"
+    corpus_file.write_text(
+        "".join(f"--- ARTICLE: A{i} ---\nThe cat{i} is an animal. The cat{i} is fluffy.\n\n" for i in range(8)),
+        encoding="utf-8",
+    )
+    parser = TextParser()
+    learned = []
+    for n_process in (1, 2):
+        kernel = ArchanonKernel()
+        Learner(kernel, parser, batch_size=2, n_process=n_process).learn_from_corpus(str(corpus_file), streaming=True)
+        learned.append(list(kernel.memory.iter_edges()))
+    assert learned[0] == learned[1]
+    assert len(learned[0]) == 16
+
+def test_prefilter_mode_learns_and_counts_skips(tmp_path):
+    """Tests that pre-filtered ingestion learns the same facts and reports skipped sentences."""
+    corpus_file = tmp_path / "wiki.txt"
+    corpus_file.write_text(
+        "--- ARTICLE: Cat ---\nThe cat is an animal. It sleeps a lot. An animal is a living thing.\n\n"
+        "--- ARTICLE: Dog ---\nDogs bark. The dog is loyal.\n\n",
+        encoding="utf-8",
+    )
+    kernel = ArchanonKernel()
+    learner = Learner(kernel, TextParser(), prefilter=True)
+    learner.learn_from_corpus(str(corpus_file), streaming=True)
+    assert learner.sentences_skipped == 2
+    assert kernel.ask_question("cat", "living thing") is True
+    assert kernel.ask_question("dog", "loyal") is True
+
+def test_parse_cache_skips_known_sentences(learning_setup, tmp_path):
+    """Tests that a second ingest is served from the parse cache with the same facts."""
+    from sensory.parse_cache import ParseCache
+    learner, kernel, corpus_path = learning_setup
+    cache = ParseCache(str(tmp_path / "parses.db"), learner.parser.cache_namespace())
+    learner.parse_cache = cache
+    learner.learn_from_corpus(corpus_path, streaming=True)
+    first = list(kernel.memory.iter_edges())
+    assert cache.hits == 0
+
+    kernel.reset()
+    learner.learn_from_corpus(corpus_path, streaming=True)
+    assert list(kernel.memory.iter_edges()) == first
+    assert cache.hits == 3 and cache.hit_rate == 0.5
+
+def test_warm_parse_cache_finishes_chunks_as_it_reads(tmp_path):
+    """Tests that a fully cached re-ingest adds each chunk's facts before reading far ahead."""
+    import spacy
+    from sensory import models
+    from sensory.parse_cache import ParseCache
+    model_path = str(tmp_path / "blank_en")
+    spacy.blank("en").to_disk(model_path)  # No parse is needed on a warm cache.
+    corpus_file = tmp_path / "wiki.txt"
+    corpus_file.write_text(
+        "".join(f"--- ARTICLE: A{i} ---\nThe cat{i} is an animal.\n\n" for i in range(50)), encoding="utf-8")
+    cache = ParseCache(str(tmp_path / "parses.db"), "test")
+    for i in range(50):
+        cache.put(f"The cat{i} is an animal.", [(f"cat{i}", "is_a", "animal")])
+
+    kernel = ArchanonKernel()
+    learner = Learner(kernel, TextParser(model_name=model_path), parse_cache=cache)
+    sizes = []
+    finish_chunks = learner._finish_chunks
+    learner._finish_chunks = lambda pending, totals: sizes.append(len(pending)) or finish_chunks(pending, totals)
+    learner.learn_from_corpus(str(corpus_file), streaming=True)
+    models.unload_model(model_path)
+    assert kernel.memory.number_of_edges() == 50
+    assert max(sizes) == 1
+
+def test_iter_corpus_chunks_splits_text_without_blank_lines(tmp_path):
+    """Tests that a long file with no blank lines is cut at line boundaries, preferring sentence ends."""
+    from learning.learner import iter_corpus_chunks
+    corpus_file = tmp_path / "lines.txt"
+    corpus_file.write_text("".join(f"The cat{i} is an animal.\n" for i in range(2000)), encoding="utf-8")
+    chunks = list(iter_corpus_chunks(str(corpus_file), max_chars=1000))
+    assert len(chunks) > 40
+    assert all(len(chunk) < 1100 for chunk in chunks)
+    assert "".join(chunks) == corpus_file.read_text(encoding="utf-8")
+
+    # A sentence wrapped over two lines is not cut in the middle.
+    corpus_file.write_text("The cat is\nan animal.\n" * 10, encoding="utf-8")
+    chunks = list(iter_corpus_chunks(str(corpus_file), max_chars=30))
+    assert all(chunk.startswith("The cat is") and chunk.endswith("an animal.\n") for chunk in chunks)
@@ -0,0 +1,56 @@
+# tests/memory/test_compact.py
+
+import pytest
+from memory import create_memory
+from memory.compact import CompactMemoryCore
+
+@pytest.fixture
+def populated_memory():
+    """Provides a CompactMemoryCore pre-populated with a classic syllogism."""
+    memory = CompactMemoryCore(compact_threshold=2)
+    memory.add_relationship("Socrates", "human", "is_a")
+    memory.add_relationship("human", "mortal", "is_a")
+    memory.add_relationship("Plato", "human", "is_a")
+    memory.add_node("Socrates", attributes={"born_in": "Athens"})
+    return memory
+
+def test_initialization():
+    """Tests if the compact backend starts empty."""
+    memory = CompactMemoryCore()
+    assert memory.number_of_nodes() == 0
+    assert memory.number_of_edges() == 0
+
+def test_query_relationships_across_compaction(populated_memory):
+    """Tests queries over both compacted and pending edges."""
+    populated_memory.add_relationship("Socrates", "philosopher", "is_a")
+    assert populated_memory.query_relationships("Socrates", "is_a") == ["human", "philosopher"]
+    assert populated_memory.query_sources("human", "is_a") == ["Socrates", "Plato"]
+    assert populated_memory.query_relationships("Socrates", "causes") == []
+    assert populated_memory.query_relationships("Aristotle", "is_a") == []
+
+def test_duplicates_and_multiple_labels(populated_memory):
+    """Tests deduplication and several labels on one node pair."""
+    populated_memory.add_relationship("Socrates", "human", "is_a")
+    populated_memory.add_relationship("Socrates", "human", "resembles")
+    assert populated_memory.number_of_edges() == 4
+    assert populated_memory.has_relationship("Socrates", "human", "resembles")
+    assert not populated_memory.has_relationship("human", "Socrates", "is_a")
+
+def test_get_node_attributes(populated_memory):
+    """Tests retrieving attributes from a node."""
+    assert populated_memory.get_node_attributes("Socrates")["born_in"] == "Athens"
+    assert populated_memory.get_node_attributes("human") == {}
+    assert populated_memory.get_node_attributes("Aristotle") is None
+
+def test_find_path(populated_memory):
+    """Tests path finding and the no-path case."""
+    assert populated_memory.find_path("Socrates", "mortal") == ["Socrates", "human", "mortal"]
+    populated_memory.add_node("logic")
+    assert populated_memory.find_path("Socrates", "logic") is None
+    assert populated_memory.find_path("Socrates", "nowhere") is None
+
+def test_create_memory_backends():
+    """Tests backend selection by name."""
+    assert isinstance(create_memory("compact"), CompactMemoryCore)
+    with pytest.raises(ValueError):
+        create_memory("nonexistent")
@@ -53,4 +53,49 @@ def test_find_path_no_path(populated_memory):
     # Add a disconnected concept
     populated_memory.add_node("logic")
     path = populated_memory.find_path("Socrates", "logic")
-    assert path is None
\ No newline at end of file
+    assert path is None
+
+def test_query_sources(populated_memory):
+    """Tests the reverse, label-filtered lookup."""
+    populated_memory.add_relationship("Plato", "human", "is_a")
+    assert populated_memory.query_sources("human", "is_a") == ["Socrates", "Plato"]
+    assert populated_memory.query_sources("human", "causes") == []
+    assert populated_memory.query_sources("nobody", "is_a") == []
+
+def test_multiple_labels_between_same_nodes():
+    """Tests that one node pair can carry several relationship labels."""
+    memory = MemoryCore()
+    memory.add_relationship("fire", "heat", "causes")
+    memory.add_relationship("fire", "heat", "has_property")
+    memory.add_relationship("fire", "heat", "causes")  # Duplicate, ignored.
+
+    assert memory.query_relationships("fire", "causes") == ["heat"]
+    assert memory.query_relationships("fire", "has_property") == ["heat"]
+    assert memory.has_relationship("fire", "heat", "causes")
+    assert not memory.has_relationship("heat", "fire", "causes")
+    assert memory._graph.number_of_edges() == 1
+
+def test_add_relationships_bulk():
+    """Tests bulk insertion and deduplication within and across batches."""
+    memory = MemoryCore()
+    assert memory.add_relationship("Socrates", "human", "is_a") is True
+    added = memory.add_relationships([
+        ("Socrates", "human", "is_a"),
+        ("human", "mortal", "is_a"),
+        ("human", "mortal", "is_a"),
+        ("Socrates", "wise", "has_property"),
+    ])
+    assert added == 2
+    assert memory.number_of_edges() == 3
+
+def test_networkx_graph_is_built_lazily_and_kept_current():
+    """Tests that find_path builds the graph on demand and sees later facts."""
+    memory = MemoryCore()
+    memory.add_relationship("Socrates", "human", "is_a")
+    assert memory._nx_graph is None
+    assert memory.find_path("Socrates", "human") == ["Socrates", "human"]
+    memory.add_relationship("human", "mortal", "is_a")
+    memory.add_node("mortal", {"kind": "property"})
+    assert memory.find_path("Socrates", "mortal") == ["Socrates", "human", "mortal"]
+    assert memory._graph.nodes["mortal"] == {"kind": "property"}
+    assert memory.get_node_attributes("mortal") == {"kind": "property"}
@@ -0,0 +1,83 @@
+# tests/memory/test_query.py
+
+import pytest
+from memory import MEMORY_BACKENDS, LabelStats, TripleQuery, query, open_snapshot
+
+@pytest.fixture(params=sorted(MEMORY_BACKENDS))
+def memory(request):
+    """A small world on every backend, with compaction on a hair trigger."""
+    if request.param == "compact":
+        memory = MEMORY_BACKENDS["compact"](compact_threshold=2)
+    else:
+        memory = MEMORY_BACKENDS[request.param]()
+    memory.add_relationships([
+        ("France", "country", "is_a"), ("Japan", "country", "is_a"),
+        ("Monaco", "country", "is_a"), ("Paris", "city", "is_a"),
+        ("France", "large", "has_property"), ("Japan", "large", "has_property"),
+        ("Paris", "large", "has_property"), ("Monaco", "small", "has_property"),
+        ("Paris", "France", "part_of"), ("Tokyo", "Japan", "part_of"),
+    ])
+    return memory
+
+def rows(results):
+    return sorted(tuple(sorted(row.items())) for row in results)
+
+def test_label_stats(memory):
+    """Tests the per-label counts every backend keeps, before and after later inserts."""
+    assert memory.label_stats()["is_a"] == LabelStats(edges=4, sources=4, targets=2)
+    memory.add_relationship("Tokyo", "city", "is_a")
+    memory.add_relationship("Tokyo", "city", "is_a")  # Duplicates are not counted.
+    memory.add_relationship("Tokyo", "capital", "is_a")
+    assert memory.label_stats()["is_a"] == LabelStats(edges=6, sources=5, targets=3)
+    assert memory.label_stats()["part_of"] == LabelStats(edges=2, sources=2, targets=2)
+
+def test_conjunctive_query(memory):
+    """Tests the example from the docstring: which ?x is_a country and has_property large."""
+    results = query(memory, [("?x", "is_a", "country"), ("?x", "has_property", "large")])
+    assert rows(results) == [(("?x", "France"),), (("?x", "Japan"),)]
+
+def test_join_across_variables(memory):
+    """Tests a two-variable join and projection onto one variable."""
+    patterns = [("?city", "part_of", "?country"), ("?country", "is_a", "country"),
+                ("?city", "has_property", "large")]
+    assert rows(query(memory, patterns)) == [(("?city", "Paris"), ("?country", "France"))]
+    kinds = list(query(memory, [("?x", "is_a", "?kind")], select=["?kind"]))
+    assert rows(kinds) == [(("?kind", "city"),), (("?kind", "country"),)]
+
+def test_planner_starts_with_the_most_selective_pattern(memory):
+    """Tests that the planner orders joins by estimated cardinality."""
+    triple_query = TripleQuery([("?x", "is_a", "country"), ("?x", "has_property", "small")])
+    first, second = triple_query.plan(memory)
+    assert first.pattern == ("?x", "has_property", "small") and first.mode == "backward"
+    assert second.mode == "check"
+    assert triple_query.explain(memory)[0] == "backward ?x -has_property-> small (~1 rows)"
+
+def test_empty_and_invalid_queries(memory):
+    assert list(query(memory, [("?x", "is_a", "planet")])) == []
+    assert list(query(memory, [("?x", "orbits", "?y")])) == []
+    assert list(query(memory, [("France", "is_a", "country")])) == [{}]
+    with pytest.raises(ValueError):
+        TripleQuery([("?x", "?relation", "country")])
+    with pytest.raises(ValueError):
+        TripleQuery([("?x", "is_a", "country")], select=["?y"])
+
+def test_results_stream_lazily(memory):
+    """Tests that a generator is returned and consuming one row does not need the rest."""
+    results = query(memory, [("?x", "has_property", "?p")])
+    assert next(results)["?p"] in ("large", "small")
+
+def test_query_over_snapshot_and_mapped_store(memory, tmp_path):
+    """Tests queries on read-only views and memory-mapped stores."""
+    view = memory.snapshot()
+    memory.add_relationship("Brazil", "country", "is_a")
+    memory.add_relationship("Brazil", "large", "has_property")
+    patterns = [("?x", "is_a", "country"), ("?x", "has_property", "large")]
+    assert len(list(query(view, patterns))) == 2
+    assert len(list(query(memory, patterns))) == 3
+
+    path = str(tmp_path / "memory.snap")
+    memory.save_snapshot(path)
+    store = open_snapshot(path)
+    assert store.label_stats()["is_a"] == memory.label_stats()["is_a"]
+    assert len(list(query(store, patterns))) == 3
+    store.close()
@@ -0,0 +1,103 @@
+# tests/memory/test_snapshot.py
+
+import threading
+import pytest
+from memory import MEMORY_BACKENDS, open_snapshot
+from causal.engine import CausalEngine
+
+@pytest.fixture(params=sorted(MEMORY_BACKENDS))
+def memory(request):
+    """Runs each test against every backend, with compaction on a hair trigger."""
+    if request.param == "compact":
+        return MEMORY_BACKENDS["compact"](compact_threshold=2)
+    return MEMORY_BACKENDS[request.param]()
+
+def test_snapshot_hides_later_facts(memory):
+    """Tests that a view shows exactly the facts present when it was taken."""
+    memory.add_relationship("Socrates", "human", "is_a")
+    memory.add_relationship("human", "mortal", "is_a")
+    view = memory.snapshot()
+
+    memory.add_relationship("Socrates", "philosopher", "is_a")
+    memory.add_relationship("Plato", "human", "is_a")
+    memory.add_node("Aristotle")
+    for i in range(10):  # Forces compaction on the compact backend.
+        memory.add_relationship(f"n{i}", "human", "is_a")
+
+    assert view.query_relationships("Socrates", "is_a") == ["human"]
+    assert view.query_sources("human", "is_a") == ["Socrates"]
+    assert view.has_relationship("Socrates", "human", "is_a")
+    assert not view.has_relationship("Socrates", "philosopher", "is_a")
+    assert not view.has_node("Plato") and not view.has_node("Aristotle")
+    assert sorted(view.iter_edges()) == [("Socrates", "human", "is_a"), ("human", "mortal", "is_a")]
+    assert sorted(node for node, _ in view.iter_nodes()) == ["Socrates", "human", "mortal"]
+    assert view.number_of_nodes() == 3 and view.number_of_edges() == 2
+    assert view.find_path("Socrates", "mortal") == ["Socrates", "human", "mortal"]
+    assert view.find_path("Plato", "mortal") is None
+
+    # The live store sees everything.
+    assert memory.query_relationships("Socrates", "is_a") == ["human", "philosopher"]
+    assert memory.number_of_edges() == 14
+
+def test_snapshot_is_read_only(memory):
+    view = memory.snapshot()
+    with pytest.raises(TypeError):
+        view.add_relationship("a", "b", "is_a")
+
+def test_engine_reasons_over_a_stable_view(memory):
+    """Tests that a CausalEngine over a view keeps its answers as memory changes."""
+    memory.add_relationship("Socrates", "human", "is_a")
+    memory.add_relationship("human", "alive", "has_property")
+    engine = CausalEngine(memory.snapshot())
+    assert engine.deduce_property("Socrates", "alive") is True
+
+    memory.add_relationship("human", "mortal", "is_a")
+    assert engine.deduce_property("Socrates", "mortal") is False
+    assert CausalEngine(memory.snapshot()).deduce_property("Socrates", "mortal") is True
+
+def test_snapshot_path_search_during_writes(memory):
+    """Tests that path searches over views run safely while a writer adds facts."""
+    for i in range(200):
+        memory.add_relationship(f"n{i}", f"n{i + 1}", "is_a")
+    errors = []
+    done = threading.Event()
+
+    def writer():
+        for i in range(200, 5000):
+            memory.add_relationship(f"n{i}", f"n{i + 1}", "is_a")
+            memory.add_relationship(f"m{i}", f"n{i}", "part_of")
+        done.set()
+
+    def reader():
+        try:
+            while not done.is_set():
+                assert memory.snapshot().find_path("n0", "n200") is not None
+        except Exception as exc:  # Surfaced in the main thread below.
+            errors.append(exc)
+            done.set()
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    # Views read the versioned index; they never build the networkx graph.
+    assert getattr(memory, "_nx_graph", None) is None
+    assert memory.find_path("n0", "n5000") is not None
+
+def test_mapped_store_snapshot(tmp_path):
+    """Tests views over a memory-mapped store with unsaved additions."""
+    path = str(tmp_path / "kb.bin")
+    source = MEMORY_BACKENDS["networkx"]()
+    source.add_relationship("Socrates", "human", "is_a")
+    source.save_snapshot(path)
+
+    store = open_snapshot(path)
+    store.add_relationship("human", "mortal", "is_a")
+    view = store.snapshot()
+    store.add_relationship("Plato", "human", "is_a")
+    assert sorted(view.iter_edges()) == [("Socrates", "human", "is_a"), ("human", "mortal", "is_a")]
+    assert view.query_sources("human", "is_a") == ["Socrates"]
+    del view
+    store.close()
@@ -0,0 +1,74 @@
+# tests/memory/test_store.py
+
+import pytest
+from memory.core import MemoryCore
+from memory.compact import CompactMemoryCore
+from memory.store import MappedMemoryCore, open_snapshot
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    """Writes a small snapshot and returns its path."""
+    memory = MemoryCore()
+    memory.add_relationship("Socrates", "human", "is_a")
+    memory.add_relationship("human", "mortal", "is_a")
+    memory.add_relationship("Sócrates", "human", "is_a")  # Non-ASCII name.
+    memory.add_relationship("Socrates", "wise", "has_property")
+    memory.add_node("Socrates", attributes={"born_in": "Athens"})
+    path = str(tmp_path / "memory.snap")
+    memory.save_snapshot(path)
+    return path
+
+def test_open_snapshot_queries(snapshot_path):
+    """Tests that a mapped snapshot answers like the memory it was saved from."""
+    memory = open_snapshot(snapshot_path)
+    assert isinstance(memory, MappedMemoryCore)
+    assert memory.number_of_nodes() == 5
+    assert memory.number_of_edges() == 4
+    assert memory.query_relationships("Socrates", "is_a") == ["human"]
+    assert sorted(memory.query_sources("human", "is_a")) == ["Socrates", "Sócrates"]
+    assert memory.query_relationships("Socrates", "has_property") == ["wise"]
+    assert memory.get_node_attributes("Socrates") == {"born_in": "Athens"}
+    assert memory.find_path("Socrates", "mortal") == ["Socrates", "human", "mortal"]
+    assert not memory.has_node("Plato")
+    memory.close()
+
+def test_incremental_save_and_reopen(snapshot_path):
+    """Tests append-only saves on top of a snapshot."""
+    memory = open_snapshot(snapshot_path)
+    memory.add_relationship("Plato", "human", "is_a")
+    memory.add_relationship("Socrates", "human", "is_a")  # Already in the snapshot.
+    memory.add_node("Plato", attributes={"born_in": "Athens"})
+    assert memory.save() == 2
+    assert memory.save() == 0
+    memory.close()
+
+    reopened = open_snapshot(snapshot_path)
+    assert reopened.query_relationships("Plato", "is_a") == ["human"]
+    assert reopened.get_node_attributes("Plato") == {"born_in": "Athens"}
+    assert reopened.number_of_edges() == 5
+
+    # A fresh snapshot folds the log back in.
+    reopened.save_snapshot(snapshot_path)
+    reopened.close()
+    compacted = open_snapshot(snapshot_path)
+    assert compacted.number_of_edges() == 5
+    assert compacted.query_sources("human", "is_a") == ["Plato", "Socrates", "Sócrates"]
+    compacted.close()
+
+def test_snapshot_roundtrip_from_compact_backend(tmp_path):
+    """Tests that the compact backend writes the same format."""
+    memory = CompactMemoryCore(compact_threshold=1)
+    memory.add_relationship("cat", "animal", "is_a")
+    memory.add_relationship("dog", "animal", "is_a")
+    path = str(tmp_path / "compact.snap")
+    memory.save_snapshot(path)
+    mapped = open_snapshot(path)
+    assert sorted(mapped.iter_edges("is_a")) == sorted(memory.iter_edges("is_a"))
+    mapped.close()
+
+def test_rejects_foreign_files(tmp_path):
+    """Tests that files that are not snapshots are refused."""
+    path = tmp_path / "not_a_snapshot"
+    path.write_bytes(b"\0" * 512)
+    with pytest.raises(ValueError):
+        MappedMemoryCore(str(path))
@@ -0,0 +1,85 @@
+# tests/meta/test_metrics.py
+
+import pytest
+from meta.metrics import MetricsRegistry, LatencyHistogram, PrometheusFileExporter
+
+def test_histogram_quantiles():
+    """Tests that quantiles land in the right power-of-two bucket."""
+    histogram = LatencyHistogram()
+    for _ in range(98):
+        histogram.observe(1_500)        # 1.5 us -> bucket [1024, 2048) ns
+    histogram.observe(3_000_000)        # 3 ms
+    histogram.observe(5_000_000, failed=True)
+    assert histogram.count == 100 and histogram.errors == 1
+    assert histogram.quantile(0.5) == 2048
+    assert histogram.quantile(0.99) == 4_194_304
+    assert histogram.quantile(1.0) == 5_000_000  # Capped at the largest latency seen.
+
+def test_timer_decorator_and_counters():
+    """Tests that timers, decorated functions and counters feed the snapshot."""
+    metrics = MetricsRegistry()
+    with metrics.timer("CausalEngine", "deduce_property") as timer:
+        pass
+    assert timer.elapsed_ns >= 0
+
+    @metrics.timed("TextParser")
+    def extract_triplets(sentence):
+        if not sentence:
+            raise ValueError("empty")
+        return []
+
+    extract_triplets("The cat is a mammal.")
+    with pytest.raises(ValueError):
+        extract_triplets("")
+    metrics.increment("Learner", "facts", 3)
+    metrics.increment("Learner", "facts", 2)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["operations"]["CausalEngine.deduce_property"]["count"] == 1
+    assert snapshot["operations"]["TextParser.extract_triplets"]["count"] == 2
+    assert snapshot["operations"]["TextParser.extract_triplets"]["errors"] == 1
+    assert snapshot["counters"] == {"Learner.facts": 5}
+
+def test_instrument_and_time_iter():
+    """Tests timing the methods of an existing object and the items of an iterator."""
+    class Engine:
+        def deduce_property(self, source_id, property_label):
+            return source_id == property_label
+
+    metrics = MetricsRegistry()
+    engine = Engine()
+    metrics.instrument(engine, "CausalEngine", ["deduce_property"])
+    metrics.instrument(engine, "CausalEngine", ["deduce_property"])  # Not wrapped twice.
+    assert engine.deduce_property("a", "a") is True
+    assert list(metrics.time_iter("TextParser", "parse", iter("abc"))) == ["a", "b", "c"]
+
+    operations = metrics.snapshot()["operations"]
+    assert operations["CausalEngine.deduce_property"]["count"] == 1
+    assert operations["TextParser.parse"]["count"] == 3
+
+def test_disabled_registry_records_nothing():
+    metrics = MetricsRegistry(enabled=False)
+    with metrics.timer("MemoryCore", "add_relationship") as timer:
+        pass
+    metrics.increment("Learner", "facts")
+    assert timer.elapsed_ns is None
+    assert metrics.snapshot()["operations"] == {} and metrics.snapshot()["counters"] == {}
+
+def test_prometheus_text(tmp_path):
+    """Tests the exposition format and the textfile exporter."""
+    metrics = MetricsRegistry()
+    metrics.observe("CausalEngine", "deduce_property", 1_500)
+    metrics.observe("CausalEngine", "deduce_property", 3_000)
+    metrics.increment("Learner", "sentences", 7)
+    text = metrics.to_prometheus()
+    labels = 'module="CausalEngine",action="deduce_property"'
+    assert "# TYPE archanon_operation_duration_seconds histogram" in text
+    assert f'archanon_operation_duration_seconds_bucket{{{labels},le="2.048e-06"}} 1' in text
+    assert f'archanon_operation_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"archanon_operation_duration_seconds_count{{{labels}}} 2" in text
+    assert 'archanon_events_total{module="Learner",name="sentences"} 7' in text
+
+    path = tmp_path / "archanon.prom"
+    exporter = PrometheusFileExporter(metrics, str(path), interval=60)
+    exporter.stop()
+    assert f"archanon_operation_duration_seconds_count{{{labels}}} 2" in path.read_text()
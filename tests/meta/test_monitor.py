@@ -54,4 +54,126 @@ def test_clear_log():
     assert len(monitor.get_chain_of_consciousness()) == 1
     
     monitor.clear_log()
-    assert len(monitor.get_chain_of_consciousness()) == 0
\ No newline at end of file
+    assert len(monitor.get_chain_of_consciousness()) == 0
+
+def test_background_mode_matches_synchronous_mode(tmp_path):
+    """Tests that off-thread logging produces the same audit trail."""
+    from meta.sinks import JSONLSegmentSink, read_segments
+
+    trails = []
+    for background in (False, True):
+        directory = str(tmp_path / f"background_{background}")
+        monitor = MetacognitiveMonitor(sinks=[JSONLSegmentSink(directory)], background=background)
+        for i in range(200):
+            monitor.log_event("MemoryCore", "add_relationship", {"source_id": f"n{i}"}, "Success")
+        in_memory = monitor.get_chain_of_consciousness()
+        monitor.close()
+        on_disk = read_segments(directory)
+        assert [e["params"] for e in in_memory] == [e["params"] for e in on_disk]
+        timestamps = [e["timestamp"] for e in on_disk]
+        assert timestamps == sorted(timestamps)
+        trails.append([{k: v for k, v in e.items() if k != "timestamp"} for e in on_disk])
+
+    assert trails[0] == trails[1]
+    assert len(trails[0]) == 200
+
+def test_background_mode_close_is_idempotent():
+    """Tests flush/close semantics and logging after close."""
+    monitor = MetacognitiveMonitor(background=True)
+    monitor.log_event("TestModule", "test_action", {}, "before")
+    monitor.flush()
+    assert len(monitor.get_chain_of_consciousness()) == 1
+    monitor.close()
+    monitor.close()
+    monitor.log_event("TestModule", "test_action", {}, "after")
+    assert [e["result"] for e in monitor.get_chain_of_consciousness()] == ["before", "after"]
+
+def test_background_close_loses_no_concurrent_events():
+    """Tests that events logged from other threads while close() runs are all stored."""
+    import threading
+    monitor = MetacognitiveMonitor(background=True)
+    start = threading.Barrier(5)
+
+    def log_many(worker):
+        start.wait()
+        for i in range(2000):
+            monitor.log_event("TestModule", "step", {"worker": worker, "i": i}, i)
+
+    threads = [threading.Thread(target=log_many, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    monitor.close()
+    for thread in threads:
+        thread.join()
+    events = monitor.get_chain_of_consciousness()
+    assert len(events) == 8000
+    for w in range(4):
+        assert [e["result"] for e in events if e["params"]["worker"] == w] == list(range(2000))
+
+def test_background_reads_do_not_wait_for_later_events():
+    """Tests that a read waits for the events queued before it, not for the queue to run empty."""
+    import time
+    import threading
+
+    class SlowSink:
+        def write(self, event):
+            time.sleep(0.002)
+
+        def flush(self):
+            pass
+
+        def close(self):
+            pass
+
+    monitor = MetacognitiveMonitor(sinks=[SlowSink()], background=True)
+    monitor.log_event("TestModule", "step", {}, "first")
+    stop = threading.Event()
+
+    def keep_logging():  # Faster than the writer, so the queue never drains.
+        while not stop.is_set():
+            monitor.log_event("TestModule", "step", {}, "more")
+            time.sleep(0.0005)
+
+    logger = threading.Thread(target=keep_logging)
+    logger.start()
+    try:
+        reads = []
+        reader = threading.Thread(target=lambda: reads.append(monitor.events_since(0, limit=1)[0]))
+        reader.start()
+        reader.join(timeout=10)
+        assert not reader.is_alive()
+        assert reads[0][0]["result"] == "first"
+    finally:
+        stop.set()
+        logger.join()
+        monitor.close()
+
+def test_background_sink_error_does_not_stop_the_writer():
+    """Tests that a failing sink leaves the writer running and its error surfaces on flush()."""
+    class FailOnceSink:
+        def __init__(self):
+            self.written = []
+
+        def write(self, event):
+            if event["result"] == "bad":
+                raise OSError("disk full")
+            self.written.append(event["result"])
+
+        def flush(self):
+            pass
+
+        def close(self):
+            pass
+
+    sink = FailOnceSink()
+    monitor = MetacognitiveMonitor(sinks=[sink], background=True)
+    for result in ["before", "bad", "after"]:
+        monitor.log_event("TestModule", "step", {}, result)
+    assert [e["result"] for e in monitor.get_chain_of_consciousness()] == ["before", "bad", "after"]
+    with pytest.raises(OSError, match="disk full"):
+        monitor.flush()
+    monitor.log_event("TestModule", "step", {}, "later")
+    monitor.flush()
+    monitor.close()
+    assert sink.written == ["before", "after", "later"]
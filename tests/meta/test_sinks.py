@@ -0,0 +1,82 @@
+# tests/meta/test_sinks.py
+
+import os
+import gzip
+import shutil
+import threading
+from meta.monitor import MetacognitiveMonitor
+import meta.sinks as sinks
+from meta.sinks import JSONLSegmentSink, read_segments
+
+def test_ring_buffer_keeps_recent_events():
+    """Tests that a bounded monitor keeps only the newest events in memory."""
+    monitor = MetacognitiveMonitor(retain=3)
+    for i in range(10):
+        monitor.log_event("TestModule", "step", {"i": i}, i)
+    events = monitor.get_chain_of_consciousness()
+    assert [event["result"] for event in events] == [7, 8, 9]
+    assert "i=9" in monitor.get_formatted_chain()
+
+def test_segment_sink_rotates_and_archives(tmp_path):
+    """Tests rotation, gzip archiving and reading the full trail back."""
+    directory = str(tmp_path / "coc")
+    sink = JSONLSegmentSink(directory, max_bytes=300, compress=True)
+    monitor = MetacognitiveMonitor(retain=2, sinks=[sink])
+    for i in range(20):
+        monitor.log_event("MemoryCore", "add_relationship", {"source_id": f"n{i}"}, {"tags": {"a"}})
+    monitor.close()
+
+    names = sorted(os.listdir(directory))
+    assert any(name.endswith(".jsonl.gz") for name in names)
+    events = read_segments(directory)
+    assert [event["params"]["source_id"] for event in events] == [f"n{i}" for i in range(20)]
+    assert events[0]["result"] == {"tags": "{'a'}"}  # Non-JSON values are stringified.
+
+def test_segment_sink_prunes_old_archives(tmp_path):
+    """Tests that only max_archives rotated segments are kept."""
+    directory = str(tmp_path / "coc")
+    sink = JSONLSegmentSink(directory, max_bytes=1, compress=False, max_archives=2)
+    for i in range(5):
+        sink.write({"i": i})
+    sink.close()
+    assert [event["i"] for event in read_segments(directory)] == [3, 4]
+
+def test_segment_sink_resumes_after_restart(tmp_path):
+    """Tests that a new sink continues numbering after existing segments."""
+    directory = str(tmp_path / "coc")
+    first = JSONLSegmentSink(directory)
+    first.write({"i": 0})
+    first.close()
+    second = JSONLSegmentSink(directory)
+    second.write({"i": 1})
+    second.close()
+    assert [event["i"] for event in read_segments(directory)] == [0, 1]
+
+def test_segment_sink_compresses_off_the_writing_thread(tmp_path, monkeypatch):
+    """Tests that rotation hands gzip work to a helper thread and close() waits for it."""
+    compressing_threads = []
+    real_gzip_open = sinks.gzip.open
+    def recording_gzip_open(*args, **kwargs):
+        compressing_threads.append(threading.current_thread())
+        return real_gzip_open(*args, **kwargs)
+    monkeypatch.setattr(sinks.gzip, "open", recording_gzip_open)
+
+    directory = str(tmp_path / "coc")
+    sink = JSONLSegmentSink(directory, max_bytes=1, compress=True, max_archives=2)
+    for i in range(5):
+        sink.write({"i": i})
+    sink.close()
+    assert compressing_threads and threading.current_thread() not in compressing_threads
+    assert sorted(os.listdir(directory)) == ["events-000004.jsonl.gz", "events-000005.jsonl.gz"]
+    assert [event["i"] for event in read_segments(directory)] == [3, 4]
+
+def test_read_segments_skips_a_segment_mid_compression(tmp_path):
+    """Tests that a segment present both plain and gzipped is read only once."""
+    directory = str(tmp_path / "coc")
+    sink = JSONLSegmentSink(directory, compress=False)
+    sink.write({"i": 0})
+    sink.close()
+    path = os.path.join(directory, "events-000001.jsonl")
+    with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    assert [event["i"] for event in read_segments(directory)] == [0]
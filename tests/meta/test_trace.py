@@ -0,0 +1,90 @@
+# tests/meta/test_trace.py
+
+import datetime
+import pytest
+from meta.monitor import MetacognitiveMonitor
+from meta.trace import EventIndex
+
+@pytest.fixture
+def monitor():
+    """A monitor holding a short mixed trace."""
+    monitor = MetacognitiveMonitor()
+    monitor.log_event("MemoryCore", "add_relationship", {"source_id": "Socrates", "target_id": "human", "label": "is_a"}, "Success")
+    monitor.log_event("MemoryCore", "add_relationship", {"source_id": "human", "target_id": "mortal", "label": "is_a"}, "Success")
+    monitor.log_event("CausalEngine", "deduce_property", {"source_id": "Socrates", "property_label": "mortal"}, True)
+    monitor.log_event("CausalEngine", "deduce_properties", {"questions": 1, "subjects": 1},
+                      [{"source_id": "Plato", "property_label": "mortal", "result": False}])
+    return monitor
+
+def test_events_since_pages_and_tails(monitor):
+    """Tests cursor-based paging and tailing only new events."""
+    page, cursor = monitor.events_since(0, limit=3)
+    assert len(page) == 3 and cursor == 3
+    page, cursor = monitor.events_since(cursor)
+    assert [e["action"] for e in page] == ["deduce_properties"] and cursor == 4
+    assert monitor.events_since(cursor) == ([], 4)
+
+    monitor.log_event("ArchanonKernel", "reset", {}, "ok")
+    lines, cursor = monitor.formatted_since(cursor)
+    assert len(lines) == 1 and "reset" in lines[0] and cursor == 5
+
+def test_events_for_node_and_filters(monitor):
+    """Tests the node, module and action indexes."""
+    assert len(monitor.events_for("Socrates")) == 2
+    assert len(monitor.events_for("Plato")) == 1
+    assert monitor.events_for("Aristotle") == []
+    assert len(monitor.find_events(module="MemoryCore")) == 2
+    assert len(monitor.find_events(module="CausalEngine", node_id="Socrates")) == 1
+    assert monitor.find_events(action="reset") == []
+
+def test_time_range(monitor):
+    """Tests time-range queries."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    assert len(monitor.find_events(end=now + datetime.timedelta(seconds=1))) == 4
+    assert monitor.find_events(start=now + datetime.timedelta(seconds=1)) == []
+
+def test_cursors_survive_clear_and_eviction():
+    """Tests bounded indexes and stable cursors."""
+    index = EventIndex(capacity=2)
+    for i in range(5):
+        index.write({"timestamp": "", "module": "M", "action": "a", "params": {"node_id": f"n{i}"}, "result": i})
+    assert list(index.seqs_since(0)) == [3, 4]
+    assert index.seqs_for(node_id="n0") == []
+    assert index.seqs_for(module="M") == [3, 4]
+    assert len(index._by_node) <= 4  # Evicted entries have been swept.
+    index.clear()
+    assert list(index.seqs_since(0)) == []
+    assert index.cursor == 5
+
+def test_bounded_index_reads_across_the_ring():
+    """Tests that a bounded index returns held events in order after wrapping around, and after a clear."""
+    index = EventIndex(capacity=3)
+    base = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    def write(i):
+        timestamp = (base + datetime.timedelta(seconds=i)).isoformat(timespec="microseconds")
+        index.write({"timestamp": timestamp, "module": "M", "action": "a", "params": {}, "result": i})
+    for i in range(7):
+        write(i)
+    assert len(index) == 3
+    assert [event["result"] for event in index.events()] == [4, 5, 6]
+    assert index.get(3) is None and index.get(5)["result"] == 5
+    assert "Result -> 6" in index.line(6)
+    between = index.seqs_between(base + datetime.timedelta(seconds=5), base + datetime.timedelta(seconds=9))
+    assert list(between) == [5, 6]
+    index.clear()
+    write(7)
+    assert [event["result"] for event in index.events()] == [7]
+    assert index.get(6) is None and index.get(7)["result"] == 7
+
+def test_time_range_with_clock_readings_stored_out_of_order():
+    """Tests that an event whose clock was read before a stored one's still falls in its time range."""
+    monitor = MetacognitiveMonitor()
+    now = monitor._mono_anchor
+    # Two background callers read the clock, then queue in the opposite order.
+    monitor._store(now + 2_000_000, "MemoryCore", "add_relationship", {"source_id": "late"}, "Success", None)
+    monitor._store(now + 1_000_000, "MemoryCore", "add_relationship", {"source_id": "early"}, "Success", None)
+    timestamps = [e["timestamp"] for e in monitor.get_chain_of_consciousness()]
+    assert timestamps == sorted(timestamps)
+    start = datetime.datetime.fromisoformat(timestamps[0])
+    window = monitor.find_events(start=start, end=start + datetime.timedelta(seconds=1))
+    assert [e["params"]["source_id"] for e in window] == ["late", "early"]
@@ -0,0 +1,30 @@
+# tests/sensory/test_models.py
+
+import pytest
+import spacy
+from sensory import models
+from sensory.text_parser import TextParser
+
+@pytest.fixture
+def blank_model(tmp_path):
+    """A blank English pipeline saved to disk, loadable by path like an installed model."""
+    path = str(tmp_path / "blank_en")
+    spacy.blank("en").to_disk(path)
+    yield path
+    models.unload_model(path)
+
+def test_parsers_share_one_lazily_loaded_pipeline(blank_model):
+    first = TextParser(model_name=blank_model)
+    second = TextParser(model_name=blank_model)
+    assert blank_model not in models.loaded_models()  # Nothing is loaded until needed.
+    assert first.nlp is second.nlp
+    assert models.loaded_models().count(blank_model) == 1
+
+def test_warm_up_loads_the_model(blank_model):
+    nlp = models.warm_up(blank_model)
+    assert models.get_model(blank_model) is nlp
+
+def test_missing_model():
+    with pytest.raises(OSError):
+        models.get_model("no_such_model_xyz")
+    assert TextParser(model_name="no_such_model_xyz").nlp is None
@@ -0,0 +1,35 @@
+# tests/sensory/test_parse_cache.py
+
+from sensory.parse_cache import ParseCache
+
+def test_round_trip_and_persistence(tmp_path):
+    """Tests that cached triplets survive a reopen and empty results are cached too."""
+    path = str(tmp_path / "parses.db")
+    cache = ParseCache(path, "model-1")
+    cache.put("The cat is an animal.", [("cat", "is_a", "animal")])
+    cache.put("Dogs bark.", [])
+    assert cache.get("Dogs bark.") == []  # Served from the unsaved buffer.
+    cache.close()
+
+    cache = ParseCache(path, "model-1")
+    assert cache.get_many(["The cat is an animal.", "Dogs bark.", "Unseen."]) == {
+        "The cat is an animal.": [("cat", "is_a", "animal")],
+        "Dogs bark.": [],
+    }
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+    assert len(cache) == 2
+
+    # A different model or extractor version does not see these entries.
+    assert ParseCache(path, "model-2").get("Dogs bark.") is None
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ParseCache(str(tmp_path / "parses.db"), "model-1", max_entries=2)
+    cache.put("a", [])
+    cache.put("b", [])
+    cache.flush()
+    assert cache.get("a") == []  # "a" is now more recently used than "b".
+    cache.put("c", [])
+    cache.flush()
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == [] and cache.get("c") == []
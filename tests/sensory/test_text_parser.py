@@ -42,4 +42,60 @@ def test_multiple_triplets_in_one_sentence(parser):
     assert ("dog", "is_a", "animal") in triplets
     # The parser might still struggle with the second part of a conjunction,
     # but we can test for the ideal case. Let's make this flexible.
-    assert len(triplets) >= 1 # Ensure at least one fact is learned
\ No newline at end of file
+    assert len(triplets) >= 1 # Ensure at least one fact is learned
+
+def _hand_parsed_doc():
+    """Builds a parsed two-sentence Doc by hand, so no model is needed."""
+    from spacy.vocab import Vocab
+    from spacy.tokens import Doc
+    return Doc(
+        Vocab(),
+        words=["Socrates", "is", "a", "philosopher", ".", "The", "sky", "is", "blue", "."],
+        heads=[1, 1, 3, 1, 1, 6, 7, 7, 7, 7],
+        deps=["nsubj", "ROOT", "det", "attr", "punct", "det", "nsubj", "ROOT", "acomp", "punct"],
+        pos=["PROPN", "AUX", "DET", "NOUN", "PUNCT", "DET", "NOUN", "AUX", "ADJ", "PUNCT"],
+        lemmas=["Socrates", "be", "a", "philosopher", ".", "the", "sky", "be", "blue", "."],
+    )
+
+def test_extract_triplets_from_parsed_doc_and_spans(parser):
+    """Tests extraction from an existing parse, per document and per sentence."""
+    doc = _hand_parsed_doc()
+    assert sorted(parser.extract_triplets_from_doc(doc)) == [
+        ("sky", "has_property", "blue"), ("socrates", "is_a", "philosopher"),
+    ]
+    sentences = list(doc.sents)
+    assert len(sentences) == 2
+    assert parser.extract_triplets_from_doc(sentences[0]) == [("socrates", "is_a", "philosopher")]
+    assert parser.extract_triplets_from_doc(sentences[1]) == [("sky", "has_property", "blue")]
+
+def test_canonicalize_entity_is_memoized():
+    from sensory.text_parser import canonicalize_entity
+    canonicalize_entity.cache_clear()
+    assert canonicalize_entity("The  Fluffy\nCat ") == "fluffy cat"
+    assert canonicalize_entity("an apple") == "apple"
+    assert canonicalize_entity("The  Fluffy\nCat ") == "fluffy cat"
+    assert canonicalize_entity.cache_info().hits == 1
+
+def test_iter_triplets_slices_phrases_and_dedupes(parser):
+    """Tests that phrases keep their original spacing and repeats are yielded once."""
+    from spacy.vocab import Vocab
+    from spacy.tokens import Doc
+    doc = Doc(
+        Vocab(),
+        words=["The", "dog", "'s", "toy", "is", "red", ",", "and", "the", "dog", "'s", "toy", "is", "red", "."],
+        spaces=[True, False, True, True, True, False, True, True, True, False, True, True, True, False, False],
+        heads=[1, 3, 1, 4, 4, 4, 4, 12, 9, 11, 9, 12, 4, 12, 4],
+        deps=["det", "poss", "case", "nsubj", "ROOT", "acomp", "punct", "cc",
+              "det", "poss", "case", "nsubj", "conj", "acomp", "punct"],
+        pos=["DET", "NOUN", "PART", "NOUN", "AUX", "ADJ", "PUNCT", "CCONJ",
+             "DET", "NOUN", "PART", "NOUN", "AUX", "ADJ", "PUNCT"],
+        lemmas=["the", "dog", "'s", "toy", "be", "red", ",", "and", "the", "dog", "'s", "toy", "be", "red", "."],
+    )
+    assert list(parser.iter_triplets(doc)) == [("dog's toy", "has_property", "red")]
+
+def test_prefilter_splits_and_flags_copula_sentences(parser):
+    """Tests the model-free sentence splitter and copula check."""
+    sentences = parser.split_sentences("The cat is an animal. Dogs bark! It's late. Birds weren't there.")
+    assert sentences == ["The cat is an animal.", "Dogs bark!", "It's late.", "Birds weren't there."]
+    assert [parser.is_candidate(s) for s in sentences] == [True, False, True, True]
+    assert not parser.is_candidate("This island has no rivers.")
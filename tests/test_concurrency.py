@@ -0,0 +1,66 @@
+# tests/test_concurrency.py
+
+import threading
+import time
+from concurrency import ReadWriteLock
+
+def test_readers_share_and_writer_excludes():
+    """Tests that readers overlap with each other but never with a writer."""
+    lock = ReadWriteLock()
+    state = {"readers": 0, "max_readers": 0, "writer_overlap": False}
+    guard = threading.Lock()
+    barrier = threading.Barrier(4)
+
+    def reader():
+        barrier.wait()
+        for _ in range(50):
+            with lock.read():
+                with guard:
+                    state["readers"] += 1
+                    state["max_readers"] = max(state["max_readers"], state["readers"])
+                time.sleep(0.0005)
+                with guard:
+                    state["readers"] -= 1
+
+    def writer():
+        barrier.wait()
+        for _ in range(50):
+            with lock.write():
+                with guard:
+                    if state["readers"]:
+                        state["writer_overlap"] = True
+                time.sleep(0.0002)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state["max_readers"] > 1
+    assert not state["writer_overlap"]
+
+def test_waiting_writer_blocks_new_readers():
+    """Tests that a queued writer gets the lock before readers that arrive after it."""
+    lock = ReadWriteLock()
+    order = []
+
+    def writer():
+        with lock.write():
+            order.append("writer")
+
+    def reader():
+        with lock.read():
+            order.append("reader")
+
+    with lock.read():
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        while not lock._waiting_writers:
+            time.sleep(0.001)
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.start()
+        time.sleep(0.01)
+        assert order == []
+    writer_thread.join()
+    reader_thread.join()
+    assert order == ["writer", "reader"]
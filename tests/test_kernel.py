@@ -1,7 +1,11 @@
 # tests/test_kernel.py
 
+import asyncio
+import threading
 import pytest
-from kernel import ArchanonKernel
+from kernel import ArchanonKernel, AsyncArchanonKernel
+from meta.monitor import MetacognitiveMonitor
+from causal.rules import DEFAULT_RULES, transitivity
 
 def test_kernel_initialization():
     """Tests if the kernel and its sub-modules initialize correctly."""
@@ -69,4 +73,197 @@ def test_kernel_reset():
     log_events = kernel.monitor.get_chain_of_consciousness()
     assert len(log_events) == 2 # The reset event and the ask_question event
     assert log_events[0]['action'] == 'reset'
-    assert "fact1" not in log_events[0]['params'] # Old facts should not be in the reset log
\ No newline at end of file
+    assert "fact1" not in log_events[0]['params'] # Old facts should not be in the reset log
+
+def test_kernel_compact_backend():
+    """Tests that the kernel reasons the same way on the compact backend."""
+    kernel = ArchanonKernel(memory_backend="compact")
+    kernel.add_fact("Socrates", "human", "is_a")
+    kernel.add_fact("human", "mortal", "is_a")
+    assert kernel.ask_question("Socrates", "mortal") is True
+
+    kernel.reset()
+    assert kernel.memory.number_of_nodes() == 0
+    assert kernel.ask_question("Socrates", "mortal") is False
+
+
+def test_ask_questions_batch_matches_loop():
+    """Tests that the batch API agrees with ask_question and logs one event."""
+    kernel = ArchanonKernel()
+    kernel.add_fact("Socrates", "human", "is_a")
+    kernel.add_fact("human", "mortal", "is_a")
+    kernel.add_fact("Socrates", "wise", "has_property")
+    questions = [
+        ("Socrates", "mortal"), ("stone", "mortal"), ("Socrates", "wise"),
+        ("human", "Socrates"), ("Socrates", "Socrates"), ("Socrates", "mortal"),
+    ]
+    events_before = len(kernel.monitor.get_chain_of_consciousness())
+
+    results = kernel.ask_questions(questions)
+
+    log_events = kernel.monitor.get_chain_of_consciousness()
+    assert len(log_events) == events_before + 1
+    batch_event = log_events[-1]
+    assert batch_event["action"] == "deduce_properties"
+    assert batch_event["params"] == {"questions": 6, "subjects": 3}
+    assert [entry["result"] for entry in batch_event["result"]] == results
+    assert results == [kernel.ask_question(s, p) for s, p in questions]
+
+
+def test_add_facts_logs_one_summary_event():
+    """Tests bulk fact insertion and its single summary log event."""
+    kernel = ArchanonKernel()
+    facts = [("Socrates", "human", "is_a"), ("human", "mortal", "is_a"), ("Socrates", "human", "is_a")]
+    assert kernel.add_facts(facts) == 2
+    assert kernel.add_facts(facts) == 0
+    assert kernel.ask_question("Socrates", "mortal") is True
+
+    log_events = kernel.monitor.get_chain_of_consciousness()
+    assert [event["action"] for event in log_events] == ["add_relationships", "add_relationships", "deduce_property"]
+    assert log_events[0]["params"]["facts"] == 3
+    assert log_events[0]["params"]["unique"] == 2
+    assert log_events[0]["params"]["digest"] == log_events[1]["params"]["digest"]
+    assert log_events[0]["result"] == {"added": 2}
+    assert log_events[1]["result"] == {"added": 0}
+
+
+def test_kernel_starts_from_snapshot(tmp_path):
+    """Tests that a kernel can reason over a memory-mapped snapshot."""
+    kernel = ArchanonKernel()
+    kernel.add_facts([("Socrates", "human", "is_a"), ("human", "mortal", "is_a")])
+    path = str(tmp_path / "kernel.snap")
+    kernel.memory.save_snapshot(path)
+
+    restarted = ArchanonKernel(memory_path=path)
+    assert not restarted.causal._properties.ready  # Opening stays O(1); the table is an explicit step.
+    assert restarted.ask_question("Socrates", "mortal") is True
+    restarted.add_fact("mortal", "finite", "is_a")
+    assert restarted.ask_question("Socrates", "finite") is True
+    restarted.memory.save()
+    restarted.memory.close()
+
+    assert ArchanonKernel(memory_path=path).ask_question("Socrates", "finite") is True
+
+
+def test_ask_question_logs_justification():
+    """Tests that the kernel records the deduction's chain of facts."""
+    kernel = ArchanonKernel()
+    kernel.add_fact("Socrates", "human", "is_a")
+    kernel.add_fact("human", "mortal", "is_a")
+    assert kernel.ask_question("Socrates", "mortal") is True
+
+    event = kernel.monitor.get_chain_of_consciousness()[-1]
+    assert event["justification"] == [("Socrates", "is_a", "human"), ("human", "is_a", "mortal")]
+    assert "Because: Socrates -is_a-> human; human -is_a-> mortal" in kernel.get_reasoning_trace()
+    # The intermediate node is indexed too.
+    assert event in kernel.monitor.events_for("human")
+
+def test_ask_question_inherits_properties():
+    """Tests that the kernel answers a property held by an ancestor."""
+    kernel = ArchanonKernel()
+    kernel.add_fact("cat", "animal", "is_a")
+    kernel.add_fact("animal", "alive", "has_property")
+    assert kernel.ask_question("cat", "alive") is True
+    assert kernel.ask_question("stone", "alive") is False
+
+def test_kernel_with_materialized_rules():
+    """Tests that facts added to a rule-driven kernel are answered from derived facts."""
+    kernel = ArchanonKernel(rules=list(DEFAULT_RULES) + [transitivity("part_of")])
+    kernel.add_fact("cat", "mammal", "is_a")
+    kernel.add_fact("mammal", "animal", "is_a")
+    assert kernel.ask_question("cat", "animal") is True
+    kernel.add_fact("animal", "alive", "has_property")
+    assert kernel.ask_question("cat", "alive") is True
+    assert "Because: cat -is_a-> mammal; mammal -is_a-> animal; animal -has_property-> alive" in \
+        kernel.get_reasoning_trace()
+    assert kernel.causal.rules.is_derived("cat", "has_property", "alive")
+    kernel.reset()
+    assert kernel.causal.rules is not None and kernel.ask_question("cat", "alive") is False
+
+def test_thread_safe_readers_never_see_half_a_batch():
+    """Tests that questions answered under one read lock see whole batches only."""
+    kernel = ArchanonKernel(thread_safe=True, monitor=MetacognitiveMonitor(retain=100))
+    done = threading.Event()
+    torn = []
+
+    def writer():
+        for i in range(200):
+            kernel.add_facts([(f"x{i}", f"mid{i}", "is_a"), (f"mid{i}", "top", "is_a")])
+        done.set()
+
+    def reader():
+        i = 0
+        while not done.is_set():
+            first, second = kernel.ask_questions([(f"x{i}", f"mid{i}"), (f"mid{i}", "top")])
+            if first != second:
+                torn.append(i)
+            i = (i + 1) % 200
+
+    threads = [threading.Thread(target=reader) for _ in range(3)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert torn == []
+    assert kernel.ask_question("x199", "top") is True
+
+def test_async_kernel_serves_concurrent_questions():
+    """Tests the asyncio facade with overlapping questions and writes."""
+    async def scenario():
+        kernel = AsyncArchanonKernel(max_workers=4)
+        await kernel.add_facts([("Socrates", "human", "is_a"), ("human", "mortal", "is_a")])
+        answers = await asyncio.gather(
+            *(kernel.ask_question("Socrates", "mortal") for _ in range(20)),
+            kernel.add_fact("Plato", "human", "is_a"),
+        )
+        late = await kernel.ask_question("Plato", "mortal")
+        kernel.close()
+        return answers[:20], late
+
+    answers, late = asyncio.run(scenario())
+    assert all(answers)
+    assert late is True
+
+def test_async_kernel_requires_thread_safe_kernel():
+    with pytest.raises(ValueError):
+        AsyncArchanonKernel(ArchanonKernel())
+
+def test_kernel_snapshot_is_stable_across_ingestion_and_reset():
+    """Tests that a kernel snapshot ignores later facts and survives a reset."""
+    kernel = ArchanonKernel(thread_safe=True)
+    kernel.add_facts([("Socrates", "human", "is_a"), ("human", "mortal", "is_a")])
+    view = kernel.snapshot()
+    kernel.add_fact("Plato", "human", "is_a")
+    kernel.reset()
+    assert view.has_relationship("human", "mortal", "is_a")
+    assert not view.has_node("Plato")
+    assert view.number_of_edges() == 2
+
+def test_kernel_calls_are_timed():
+    """Tests that kernel calls feed the monitor's metrics and carry their duration in the trace."""
+    kernel = ArchanonKernel()
+    kernel.add_fact("Socrates", "human", "is_a")
+    kernel.add_facts([("human", "mortal", "is_a")])
+    kernel.ask_question("Socrates", "mortal")
+    kernel.ask_questions([("Socrates", "human")])
+
+    operations = kernel.monitor.metrics_snapshot()["operations"]
+    for key in ("MemoryCore.add_relationship", "MemoryCore.add_relationships",
+                "CausalEngine.deduce_property", "CausalEngine.deduce_properties"):
+        assert operations[key]["count"] == 1
+    assert all("duration_us" in event for event in kernel.monitor.get_chain_of_consciousness())
+    assert " us)" in kernel.get_reasoning_trace()
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_kernel_query(thread_safe):
+    """Tests conjunctive queries through the kernel, with the plan logged."""
+    kernel = ArchanonKernel(thread_safe=thread_safe)
+    kernel.add_facts([("France", "country", "is_a"), ("France", "large", "has_property"),
+                      ("Monaco", "country", "is_a"), ("Monaco", "small", "has_property")])
+    results = kernel.query([("?x", "is_a", "country"), ("?x", "has_property", "large")])
+    kernel.add_fact("Japan", "country", "is_a")
+    kernel.add_fact("Japan", "large", "has_property")
+    answers = [row["?x"] for row in results]
+    assert answers == (["France"] if thread_safe else ["France", "Japan"])
+    event = kernel.monitor.find_events(action="plan_query")[0]
+    assert event["result"][0].startswith("backward ?x -has_property-> large")
@@ -8,6 +8,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from kernel import ArchanonKernel
 from sensory.text_parser import TextParser
+from sensory.parse_cache import ParseCache
 from learning.learner import Learner
 
 def main():
@@ -17,11 +18,16 @@ def main():
     print("--- INITIALIZING ARCHANON KERNEL v1.0 ---")
     kernel = ArchanonKernel()
     parser = TextParser()
-    learner = Learner(kernel, parser)
+    corpus_path = "data_corpus/simple_wiki_corpus_v1.txt"
+    # Sentences parsed by earlier runs are served from the cache. The
+    # directory is created so a missing corpus is reported by the learner.
+    os.makedirs(os.path.dirname(corpus_path), exist_ok=True)
+    parse_cache = ParseCache("data_corpus/parse_cache.sqlite", parser.cache_namespace())
+    learner = Learner(kernel, parser, parse_cache=parse_cache)
 
     print("\n--- BEGINNING LEARNING FROM CORPUS ---")
-    corpus_path = "data_corpus/simple_wiki_corpus_v1.txt"
-    learner.learn_from_corpus(corpus_path)
+    learner.learn_from_corpus(corpus_path, streaming=True)
+    parse_cache.close()
 
     print("\n--- KNOWLEDGE INTERROGATION ---")
     print("Let's see what the kernel has learned...")